@@ -0,0 +1,617 @@
+"""Platform backends, everything the manager needs from the operating system.
+
+WindowsBackend talks to the real system: the registry, processes, windows
+and folder change notifications. FakeBackend simulates Steam, idler
+processes and their windows in memory so the whole app, background jobs
+included, can run headless on any OS, e.g. for benchmarks:
+
+    STEAMIDLE_BACKEND=fake python steam_idle_manager.py
+
+The fake is deterministic: PIDs, window handles and the generated library
+only depend on its settings (STEAMIDLE_FAKE_ROOT, STEAMIDLE_FAKE_APPS,
+STEAMIDLE_FAKE_STEAM).
+"""
+import os
+import sys
+import time
+import itertools
+import threading
+import subprocess
+import tempfile
+from contextlib import nullcontext
+from collections import namedtuple
+
+import psutil
+
+STARTUP_VALUE_NAME = "SteamIdleManager"
+STARTUP_KEY = r"Software\Microsoft\Windows\CurrentVersion\Run"
+
+FakeMemoryInfo = namedtuple('FakeMemoryInfo', ['rss', 'vms'])
+
+# Launch profile names -> psutil values: priority classes on Windows, nice values elsewhere
+PRIORITIES = ('normal', 'below_normal', 'idle')
+IO_PRIORITIES = ('normal', 'low', 'very_low')
+
+def priority_value(name):
+    """Argument for psutil's Process.nice() for a priority name"""
+    if hasattr(psutil, 'IDLE_PRIORITY_CLASS'):
+        return {'normal': psutil.NORMAL_PRIORITY_CLASS,
+                'below_normal': psutil.BELOW_NORMAL_PRIORITY_CLASS,
+                'idle': psutil.IDLE_PRIORITY_CLASS}[name]
+    return {'normal': 0, 'below_normal': 10, 'idle': 19}[name]
+
+def io_priority_args(name):
+    """Arguments for psutil's Process.ionice() for an I/O priority name"""
+    if hasattr(psutil, 'IOPRIO_VERYLOW'):
+        return ({'normal': psutil.IOPRIO_NORMAL, 'low': psutil.IOPRIO_LOW,
+                 'very_low': psutil.IOPRIO_VERYLOW}[name],)
+    if hasattr(psutil, 'IOPRIO_CLASS_IDLE'):
+        return {'normal': (psutil.IOPRIO_CLASS_BE, 4), 'low': (psutil.IOPRIO_CLASS_BE, 7),
+                'very_low': (psutil.IOPRIO_CLASS_IDLE,)}[name]
+    raise NotImplementedError("I/O priority is not supported on this platform")
+
+class Backend:
+    """Interface shared by the backends"""
+
+    name = None
+    headless = False  # No webview window or tray icon
+
+    def appdata_dir(self):
+        raise NotImplementedError
+
+    def default_idler_path(self):
+        return os.path.join(os.path.dirname(os.path.abspath(__file__)), "steam-idle.exe")
+
+    def steam_install_path(self):
+        """Steam's install folder from the registry, or None"""
+        raise NotImplementedError
+
+    def steam_active_user(self):
+        """Account ID of the logged in Steam user, or None"""
+        raise NotImplementedError
+
+    def launch_steam(self, steam_exe):
+        raise NotImplementedError
+
+    def spawn_idler(self, idler_path, game_id, priority='normal'):
+        """Start an idler for a game, returns an object with its `pid`.
+        The process is created with the given priority so the idler inherits it from the shell"""
+        raise NotImplementedError
+
+    def process(self, pid):
+        """psutil.Process (or a look-alike) for a PID, raises psutil.NoSuchProcess"""
+        raise NotImplementedError
+
+    def process_iter(self, attrs=None):
+        raise NotImplementedError
+
+    def wait_procs(self, procs, timeout=None):
+        """Wait for processes to exit, returns (gone, alive) like psutil.wait_procs"""
+        return psutil.wait_procs(procs, timeout=timeout)
+
+    def is_steam_running(self):
+        for proc in self.process_iter(['name']):
+            try:
+                if proc.name().lower() == 'steam.exe':
+                    return True
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                pass
+        return False
+
+    def get_startup_command(self):
+        """Command registered to run at login, or None"""
+        raise NotImplementedError
+
+    def set_startup_command(self, command):
+        """Register a command to run at login, None removes it"""
+        raise NotImplementedError
+
+    def idler_windows(self):
+        """(handle, minimized) for every visible window of a steam-idle process"""
+        raise NotImplementedError
+
+    def show_window(self, handle, minimize):
+        raise NotImplementedError
+
+    def watch_folders(self, folders):
+        """Watcher whose wait(timeout) returns True once one of the folders changed"""
+        raise NotImplementedError
+
+class WindowsBackend(Backend):
+    name = 'windows'
+
+    def __init__(self):
+        # Only importable on Windows, keep them out of the fake's way
+        import winreg
+        import win32gui
+        import win32con
+        import win32process
+        self.winreg = winreg
+        self.win32gui = win32gui
+        self.win32con = win32con
+        self.win32process = win32process
+
+    def appdata_dir(self):
+        return os.getenv('APPDATA')
+
+    def steam_install_path(self):
+        winreg = self.winreg
+        try:
+            hkey = winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, "SOFTWARE\\WOW6432Node\\Valve\\Steam")
+            try:
+                return winreg.QueryValueEx(hkey, "InstallPath")[0]
+            finally:
+                winreg.CloseKey(hkey)
+        except OSError:
+            return None
+
+    def steam_active_user(self):
+        winreg = self.winreg
+        try:
+            hkey = winreg.OpenKey(winreg.HKEY_CURRENT_USER, "Software\\Valve\\Steam\\ActiveProcess")
+            try:
+                steam_id = winreg.QueryValueEx(hkey, "ActiveUser")[0]
+            finally:
+                winreg.CloseKey(hkey)
+            return str(steam_id) if steam_id != 0 else None
+        except OSError:
+            return None
+
+    def launch_steam(self, steam_exe):
+        subprocess.Popen([steam_exe])
+
+    def spawn_idler(self, idler_path, game_id, priority='normal'):
+        flags = {'normal': 0,
+                 'below_normal': getattr(subprocess, 'BELOW_NORMAL_PRIORITY_CLASS', 0),
+                 'idle': getattr(subprocess, 'IDLE_PRIORITY_CLASS', 0)}[priority]
+        return subprocess.Popen([idler_path, game_id], shell=True, creationflags=flags)
+
+    def process(self, pid):
+        return psutil.Process(pid)
+
+    def process_iter(self, attrs=None):
+        return psutil.process_iter(attrs)
+
+    def get_startup_command(self):
+        winreg = self.winreg
+        try:
+            key = winreg.OpenKey(winreg.HKEY_CURRENT_USER, STARTUP_KEY, 0, winreg.KEY_READ)
+        except OSError:
+            return None
+        try:
+            return winreg.QueryValueEx(key, STARTUP_VALUE_NAME)[0]
+        except OSError:
+            return None
+        finally:
+            winreg.CloseKey(key)
+
+    def set_startup_command(self, command):
+        winreg = self.winreg
+        key = winreg.OpenKey(winreg.HKEY_CURRENT_USER, STARTUP_KEY, 0, winreg.KEY_SET_VALUE)
+        try:
+            if command:
+                winreg.SetValueEx(key, STARTUP_VALUE_NAME, 0, winreg.REG_SZ, command)
+            else:
+                try:
+                    winreg.DeleteValue(key, STARTUP_VALUE_NAME)
+                except OSError:
+                    pass
+        finally:
+            winreg.CloseKey(key)
+
+    def idler_windows(self):
+        windows = []
+
+        def callback(hwnd, windows):
+            if self.win32gui.IsWindowVisible(hwnd):
+                try:
+                    _, pid = self.win32process.GetWindowThreadProcessId(hwnd)
+                    if 'steam-idle' in psutil.Process(pid).name().lower():
+                        windows.append((hwnd, bool(self.win32gui.IsIconic(hwnd))))
+                except Exception:
+                    pass
+
+        self.win32gui.EnumWindows(callback, windows)
+        return windows
+
+    def show_window(self, handle, minimize):
+        self.win32gui.ShowWindow(handle, self.win32con.SW_MINIMIZE if minimize else self.win32con.SW_RESTORE)
+
+    def watch_folders(self, folders):
+        return WindowsFolderWatcher(folders)
+
+class WindowsFolderWatcher:
+    """Change notifications on a set of folders (file names, writes and sizes)"""
+
+    def __init__(self, folders):
+        import win32con
+        import win32event
+        import win32file
+        self.win32event = win32event
+        self.win32file = win32file
+        notify_filter = (win32con.FILE_NOTIFY_CHANGE_FILE_NAME |
+                         win32con.FILE_NOTIFY_CHANGE_LAST_WRITE |
+                         win32con.FILE_NOTIFY_CHANGE_SIZE)
+        self.handles = []
+        try:
+            for folder in folders:
+                self.handles.append(win32file.FindFirstChangeNotification(folder, False, notify_filter))
+        except Exception:
+            self.close()
+            raise
+
+    def wait(self, timeout):
+        result = self.win32event.WaitForMultipleObjects(self.handles, False, int(timeout * 1000))
+        if result == self.win32event.WAIT_TIMEOUT:
+            return False
+        self.win32file.FindNextChangeNotification(self.handles[result - self.win32event.WAIT_OBJECT_0])
+        return True
+
+    def close(self):
+        for handle in self.handles:
+            self.win32file.FindCloseChangeNotification(handle)
+        self.handles = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+class FakeProcess:
+    """psutil.Process look-alike for a simulated process"""
+
+    def __init__(self, backend, pid, name, cmdline, parent=None):
+        self.backend = backend
+        self.pid = pid
+        self._name = name
+        self._cmdline = cmdline
+        self._parent = parent
+        self._children = []
+        self._create_time = backend.clock()
+        self._status = psutil.STATUS_RUNNING
+        self.alive = True
+        self.returncode = None
+        self._cpu = 0.1
+        self._rss = 8 * 1024 * 1024
+        self._nice = priority_value('normal')
+        self._affinity = list(range(os.cpu_count() or 1))
+        self._ionice = None
+        self._ignores_terminate = False
+        self.info = {}
+        if parent:
+            parent._children.append(self)
+
+    def _check(self):
+        if not self.alive:
+            raise psutil.NoSuchProcess(self.pid, self._name)
+
+    def name(self):
+        self._check()
+        return self._name
+
+    def cmdline(self):
+        self._check()
+        return list(self._cmdline)
+
+    def create_time(self):
+        self._check()
+        return self._create_time
+
+    def status(self):
+        self._check()
+        return self._status
+
+    def ppid(self):
+        return self._parent.pid if self._parent else 0
+
+    def parent(self):
+        return self._parent if self._parent and self._parent.alive else None
+
+    def children(self, recursive=False):
+        self._check()
+        result = []
+        for child in self._children:
+            if child.alive:
+                result.append(child)
+                if recursive:
+                    result.extend(child.children(recursive=True))
+        return result
+
+    def is_running(self):
+        return self.alive
+
+    def oneshot(self):
+        return nullcontext()
+
+    def cpu_percent(self, interval=None):
+        self._check()
+        return 0.0 if self._status == psutil.STATUS_STOPPED else self._cpu
+
+    def memory_info(self):
+        self._check()
+        return FakeMemoryInfo(rss=self._rss, vms=2 * self._rss)
+
+    def num_threads(self):
+        self._check()
+        return 4
+
+    def num_handles(self):
+        self._check()
+        return 64
+
+    def nice(self, value=None):
+        self._check()
+        if value is None:
+            return self._nice
+        self._nice = value
+
+    def cpu_affinity(self, cpus=None):
+        self._check()
+        if cpus is None:
+            return list(self._affinity)
+        self._affinity = list(cpus)
+
+    def ionice(self, ioclass=None, value=None):
+        self._check()
+        if ioclass is None:
+            return self._ionice
+        self._ionice = (ioclass, value) if value is not None else ioclass
+
+    def suspend(self):
+        self._check()
+        self._status = psutil.STATUS_STOPPED
+
+    def resume(self):
+        self._check()
+        self._status = psutil.STATUS_RUNNING
+
+    def terminate(self):
+        self._check()
+        if self._ignores_terminate:
+            return
+        # psutil terminates Windows processes with exit code SIGTERM
+        self.backend.exit_process(self, 15)
+
+    def kill(self):
+        self._check()
+        # Same TerminateProcess call on Windows, but a hung idler can't ignore it
+        self.backend.exit_process(self, 15)
+
+    def poll(self):
+        """Popen-style exit code, None while running"""
+        return self.returncode
+
+    def wait(self, timeout=None):
+        return self.returncode
+
+    def __repr__(self):
+        return f"FakeProcess(pid={self.pid}, name={self._name!r}, alive={self.alive})"
+
+class FakeFolderWatcher:
+    def __init__(self, backend):
+        self.backend = backend
+
+    def wait(self, timeout):
+        changed = self.backend.folder_changed.wait(timeout)
+        self.backend.folder_changed.clear()
+        return changed
+
+    def close(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+class FakeBackend(Backend):
+    """In-memory Windows: a generated Steam library, idler processes and their windows.
+
+    Idlers are spawned the way `shell=True` does on Windows, a cmd.exe whose
+    child is steam-idle.exe. Like the real idler, the child exits right away
+    when Steam isn't running, and the shell exits with it.
+    """
+
+    name = 'fake'
+    headless = True
+
+    def __init__(self, root=None, app_count=None, steam_running=None):
+        self.root = root or os.getenv('STEAMIDLE_FAKE_ROOT') or tempfile.mkdtemp(prefix='steamidle-')
+        self.app_count = app_count if app_count is not None else int(os.getenv('STEAMIDLE_FAKE_APPS', '50'))
+        if steam_running is None:
+            steam_running = os.getenv('STEAMIDLE_FAKE_STEAM', '1') != '0'
+        self.lock = threading.RLock()
+        self.pids = itertools.count(1000, 4)  # Windows PIDs are multiples of four
+        self.hwnds = itertools.count(0x10010, 2)
+        self.processes = {}
+        self.windows = {}  # handle -> {"pid", "minimized"}
+        self.startup_command = None
+        self.folder_changed = threading.Event()
+        self.steam_process = None
+        self.clock = time.time
+
+        self.steam_path = os.path.join(self.root, "Steam")
+        self._create_files()
+        self._start("System", ["System"])
+        self._start("explorer.exe", ["C:\\Windows\\explorer.exe"])
+        if steam_running:
+            self.start_steam()
+
+    def _create_files(self):
+        steamapps = os.path.join(self.steam_path, "steamapps")
+        os.makedirs(steamapps, exist_ok=True)
+        os.makedirs(os.path.join(self.root, "AppData"), exist_ok=True)
+        for path in (os.path.join(self.steam_path, "Steam.exe"), self.default_idler_path()):
+            if not os.path.exists(path):
+                open(path, 'w').close()
+        libraryfolders = os.path.join(steamapps, "libraryfolders.vdf")
+        if not os.path.exists(libraryfolders):
+            path = self.steam_path.replace('\\', '\\\\')
+            with open(libraryfolders, 'w', encoding='utf-8') as f:
+                f.write(f'"libraryfolders"\n{{\n\t"0"\n\t{{\n\t\t"path"\t\t"{path}"\n\t}}\n}}\n')
+        for n in range(1, self.app_count + 1):
+            self.install_app(str(n * 10), f"Fake Game {n}", notify=False)
+
+    def install_app(self, app_id, name, notify=True):
+        """Write an appmanifest as Steam would when installing a game"""
+        path = os.path.join(self.steam_path, "steamapps", f"appmanifest_{app_id}.acf")
+        if os.path.exists(path):
+            return
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(f'"AppState"\n{{\n\t"appid"\t\t"{app_id}"\n\t"name"\t\t"{name}"\n'
+                    f'\t"StateFlags"\t\t"4"\n\t"installdir"\t\t"{name}"\n}}\n')
+        if notify:
+            self.folder_changed.set()
+
+    def _start(self, name, cmdline, parent=None):
+        with self.lock:
+            process = FakeProcess(self, next(self.pids), name, cmdline, parent)
+            self.processes[process.pid] = process
+            return process
+
+    def exit_process(self, process, exit_code=0):
+        with self.lock:
+            if not process.alive:
+                return
+            process.alive = False
+            process.returncode = exit_code
+            self.processes.pop(process.pid, None)
+            for handle in [h for h, window in self.windows.items() if window['pid'] == process.pid]:
+                del self.windows[handle]
+            if process is self.steam_process:
+                self.steam_process = None
+                # Idlers lose their Steam connection and quit
+                for other in list(self.processes.values()):
+                    if other._name == 'steam-idle.exe':
+                        self.exit_process(other, 1)
+            parent = process._parent
+            if parent and parent._name == 'cmd.exe' and parent.alive and not parent.children():
+                # cmd /c exits with the code of its command
+                self.exit_process(parent, exit_code)
+
+    def start_steam(self):
+        with self.lock:
+            if not self.steam_process:
+                self.steam_process = self._start("steam.exe", [os.path.join(self.steam_path, "Steam.exe")])
+
+    def stop_steam(self):
+        if self.steam_process:
+            self.exit_process(self.steam_process)
+
+    def crash_idler(self, game_id, exit_code=1):
+        """Kill the idler of a game as if it crashed, returns whether one was running"""
+        for process in list(self.processes.values()):
+            if process._name == 'steam-idle.exe' and process._cmdline[1:2] == [str(game_id)]:
+                self.exit_process(process, exit_code)
+                return True
+        return False
+
+    def hang_idler(self, game_id):
+        """Make the idler of a game ignore terminate(), so only kill() stops it"""
+        for process in list(self.processes.values()):
+            if process._name == 'steam-idle.exe' and process._cmdline[1:2] == [str(game_id)]:
+                process._ignores_terminate = True
+                return True
+        return False
+
+    def set_idler_usage(self, game_id, cpu=None, rss_mb=None):
+        """Make the idler of a game report this CPU percent and memory, to simulate leaks and busy loops"""
+        for process in list(self.processes.values()):
+            if process._name == 'steam-idle.exe' and process._cmdline[1:2] == [str(game_id)]:
+                if cpu is not None:
+                    process._cpu = cpu
+                if rss_mb is not None:
+                    process._rss = int(rss_mb * 1024 * 1024)
+                return True
+        return False
+
+    def appdata_dir(self):
+        return os.path.join(self.root, "AppData")
+
+    def default_idler_path(self):
+        return os.path.join(self.root, "steam-idle.exe")
+
+    def steam_install_path(self):
+        return self.steam_path
+
+    def steam_active_user(self):
+        return "1" if self.steam_process else None
+
+    def launch_steam(self, steam_exe):
+        if not os.path.exists(steam_exe):
+            raise FileNotFoundError(steam_exe)
+        self.start_steam()
+
+    def spawn_idler(self, idler_path, game_id, priority='normal'):
+        with self.lock:
+            shell = self._start("cmd.exe", ["cmd.exe", "/c", idler_path, str(game_id)])
+            shell._nice = priority_value(priority)
+            idler = self._start("steam-idle.exe", [idler_path, str(game_id)], parent=shell)
+            idler._nice = shell._nice
+            if self.steam_process:
+                self.windows[next(self.hwnds)] = {"pid": idler.pid, "minimized": False}
+            else:
+                self.exit_process(idler, 1)
+            return shell
+
+    def process(self, pid):
+        with self.lock:
+            process = self.processes.get(pid)
+        if process is None:
+            raise psutil.NoSuchProcess(pid)
+        return process
+
+    def wait_procs(self, procs, timeout=None):
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while any(proc.alive for proc in procs):
+            if deadline is not None and time.monotonic() >= deadline:
+                break
+            time.sleep(0.01)
+        return [proc for proc in procs if not proc.alive], [proc for proc in procs if proc.alive]
+
+    def process_iter(self, attrs=None):
+        with self.lock:
+            processes = list(self.processes.values())
+        for process in processes:
+            if attrs:
+                process.info = {}
+                for attr in attrs:
+                    try:
+                        value = getattr(process, attr)
+                        process.info[attr] = value() if callable(value) else value
+                    except psutil.NoSuchProcess:
+                        process.info[attr] = None
+            yield process
+
+    def get_startup_command(self):
+        return self.startup_command
+
+    def set_startup_command(self, command):
+        self.startup_command = command or None
+
+    def idler_windows(self):
+        with self.lock:
+            return [(handle, window['minimized']) for handle, window in self.windows.items()]
+
+    def show_window(self, handle, minimize):
+        with self.lock:
+            if handle not in self.windows:
+                raise OSError(f"Invalid window handle {handle:#x}")
+            self.windows[handle]['minimized'] = minimize
+
+    def watch_folders(self, folders):
+        return FakeFolderWatcher(self)
+
+BACKENDS = {
+    'windows': WindowsBackend,
+    'fake': FakeBackend,
+}
+
+def get_backend():
+    """Backend named by STEAMIDLE_BACKEND, by default the real one on Windows and the fake elsewhere"""
+    name = os.getenv('STEAMIDLE_BACKEND') or ('windows' if sys.platform == 'win32' else 'fake')
+    if name not in BACKENDS:
+        raise ValueError(f"Unknown STEAMIDLE_BACKEND {name!r}, use one of: {', '.join(BACKENDS)}")
+    return BACKENDS[name]()
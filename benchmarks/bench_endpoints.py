@@ -0,0 +1,298 @@
+"""Benchmark the Flask endpoints under the UI's polling mix.
+
+Builds a synthetic install on the fake backend (1000 games with sessions,
+running idlers, 200 presets, 50 goals, full histories), stubs every
+outbound HTTP request and replays what script.js polls over a number of
+10 second windows through the Flask test client, honouring ETags like the
+browser does. Reports p50/p95/p99 latency per endpoint, then the peak and
+net memory allocated per request in a separate tracemalloc pass.
+
+    python benchmarks/bench_endpoints.py
+    python benchmarks/bench_endpoints.py --windows 50 --sessions 5000 --running 32
+    python benchmarks/bench_endpoints.py --save benchmarks/baseline.json
+    python benchmarks/bench_endpoints.py --baseline benchmarks/baseline.json --threshold 0.25
+    python benchmarks/bench_endpoints.py --history benchmarks/history.jsonl
+
+With --baseline the exit status is 1 when an endpoint's p95 got slower than
+the baseline by more than the threshold (and by more than --min-delta-ms,
+so sub-millisecond noise doesn't count). --history appends the results with
+the current commit, so changes can be followed commit by commit.
+"""
+import os
+import sys
+import json
+import time
+import random
+import argparse
+import tempfile
+import statistics
+import subprocess
+import tracemalloc
+from datetime import datetime, timedelta
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_DIR)
+
+STORE_PAGE = ('<div class="apphub_AppName">Synthetic Game</div>'
+              '<img class="game_header_image_full" src="https://example.invalid/header.jpg">')
+
+def stub_http():
+    """Answer every outbound request locally, the benchmark must not touch the network"""
+    import requests
+
+    def request(self, method, url, **kwargs):
+        response = requests.Response()
+        response.status_code = 200
+        response.url = url
+        if 'GetAppList' in url:
+            apps = [{"appid": 10 * n, "name": f"Synthetic Game {n}"} for n in range(1, 5001)]
+            response._content = json.dumps({"applist": {"apps": apps}}).encode()
+        elif 'store.steampowered.com/app/' in url:
+            response._content = STORE_PAGE.encode()
+        else:
+            response._content = b'<html></html>'
+        return response
+
+    requests.sessions.Session.request = request
+
+def build_state(m, args):
+    """Fill the app with synthetic sessions, running idlers, presets, goals and histories"""
+    random.seed(args.seed)
+    now = datetime.now()
+    game_ids = [str(10 * n) for n in range(1, args.sessions + 1)]
+
+    m.game_state.load_sessions({
+        game_id: {
+            'total_time': random.uniform(0, 500 * 3600),
+            'name': f"Synthetic Game {game_id}",
+            'image': f"https://cdn.cloudflare.steamstatic.com/steam/apps/{game_id}/header.jpg"
+        }
+        for game_id in game_ids
+    })
+    running = game_ids[:args.running]
+    for game_id in running:
+        process = m.backend.spawn_idler(m.IDLER_PATH, game_id)
+        m.game_state.start_session(game_id, process.pid,
+                                   start_time=now - timedelta(minutes=random.uniform(1, 48 * 60)))
+    m.save_statistics()
+
+    preset_names = []
+    for i in range(args.presets):
+        name = f"Preset {i:03d}"
+        games = [
+            {"id": game_id, "name": f"Synthetic Game {game_id}",
+             "image": f"https://cdn.cloudflare.steamstatic.com/steam/apps/{game_id}/header.jpg"}
+            for game_id in random.sample(game_ids, min(len(game_ids), random.randint(5, 40)))
+        ]
+        with open(os.path.join(m.PRESETS_DIR, f"{name}.json"), 'w') as f:
+            json.dump(games, f)
+        with open(os.path.join(m.PRESETS_DIR, f"{name}.bat"), 'w') as f:
+            f.write("@echo off\n" + "".join(f"start steam-idle.exe {game['id']}\n" for game in games))
+        preset_names.append(name)
+
+    m.save_goals([
+        {"id": str(i + 1), "game_id": game_id, "target_hours": random.randint(1, 1000),
+         "created_at": now.isoformat()}
+        for i, game_id in enumerate(random.sample(game_ids, min(len(game_ids), args.goals)))
+    ])
+    m.save_favorites({"favorites": [
+        {"name": name, "games": json.load(open(os.path.join(m.PRESETS_DIR, f"{name}.json")))}
+        for name in preset_names[:10]
+    ]})
+    for i in range(10):
+        m.save_recent_action(f"Started preset {preset_names[i % len(preset_names)]}")
+    m.save_game_history({"history": [
+        {"id": game_id, "name": f"Synthetic Game {game_id}", "image": "", "addedAt": now.isoformat()}
+        for game_id in game_ids[:50]
+    ]})
+    m.save_game_favorites({"favorites": [
+        {"id": game_id, "name": f"Synthetic Game {game_id}", "image": ""}
+        for game_id in game_ids[:100]
+    ]})
+    m.connectivity._set(True)
+    m.app_catalog.refresh()
+    return running
+
+def polling_mix(running):
+    """(label, method, path, json body) requests script.js makes in one 10 second window"""
+    session_times = f"/api/session-times?ids={','.join(running)}"
+    mix = []
+    # Every second: playtimes, and statistics from both of its intervals
+    for second in range(10):
+        mix.append(("/api/session-times", 'GET', session_times, None))
+        mix.append(("/api/stats/total-playtime", 'GET', "/api/stats/total-playtime", None))
+        mix.append(("/api/stats/most-idled", 'GET', "/api/stats/most-idled", None))
+        if second % 5 == 0:
+            mix.append(("/api/stats/total-playtime", 'GET', "/api/stats/total-playtime", None))
+            mix.append(("/api/stats/most-idled", 'GET', "/api/stats/most-idled", None))
+            # Quick actions panel
+            mix.append(("/api/favorites", 'GET', "/api/favorites", None))
+            mix.append(("/api/recent-actions", 'GET', "/api/recent-actions", None))
+        if second % 2 == 0:
+            # One status check per running game every 2 seconds
+            for game_id in running:
+                mix.append(("/api/game-status", 'POST', "/api/game-status", {"gameId": game_id}))
+    mix.append(("/api/steam-status", 'GET', "/api/steam-status", None))
+    # Less frequent views: presets, stats tab, histories, library, exports
+    mix.append(("/api/get-presets", 'GET', "/api/get-presets", None))
+    mix.append(("/api/stats/goals", 'GET', "/api/stats/goals", None))
+    for period in ('daily', 'weekly', 'monthly'):
+        mix.append((f"/api/stats/playtime-history/{period}", 'GET', f"/api/stats/playtime-history/{period}", None))
+    mix.append(("/api/game-history", 'GET', "/api/game-history", None))
+    mix.append(("/api/game-favorites", 'GET', "/api/game-favorites", None))
+    mix.append(("/api/settings", 'GET', "/api/settings", None))
+    mix.append(("/api/steam-library", 'GET', "/api/steam-library?limit=60&sort=hours", None))
+    mix.append(("/api/catalog/search", 'GET', "/api/catalog/search?q=synthetic+game+4", None))
+    mix.append(("/api/export-stats", 'POST', "/api/export-stats", {"format": "csv", "preferences": {}}))
+    return mix
+
+class Client:
+    """Test client that revalidates GETs with the ETag it last saw, like the browser cache"""
+
+    def __init__(self, app):
+        self.client = app.test_client()
+        self.etags = {}
+
+    def send(self, method, path, body):
+        if method == 'GET':
+            headers = {"If-None-Match": self.etags[path]} if path in self.etags else {}
+            response = self.client.get(path, headers=headers)
+            if response.headers.get('ETag'):
+                self.etags[path] = response.headers['ETag']
+        else:
+            response = self.client.post(path, json=body)
+        response.get_data()
+        if response.status_code >= 400:
+            raise RuntimeError(f"{method} {path} returned {response.status_code}")
+        return response
+
+def percentiles(samples):
+    if len(samples) < 2:
+        value = samples[0] if samples else 0.0
+        return value, value, value
+    cuts = statistics.quantiles(samples, n=100, method='inclusive')
+    return cuts[49], cuts[94], cuts[98]
+
+def measure_latency(client, mix, windows):
+    timings = {}
+    for _ in range(windows):
+        for label, method, path, body in mix:
+            start = time.perf_counter()
+            client.send(method, path, body)
+            timings.setdefault(label, []).append((time.perf_counter() - start) * 1000)
+    return timings
+
+def measure_allocations(client, mix, repeat):
+    """Peak and net bytes allocated per request of each endpoint"""
+    allocations = {}
+    seen = set()
+    tracemalloc.start()
+    try:
+        for label, method, path, body in mix:
+            if label in seen:
+                continue
+            seen.add(label)
+            peaks, nets = [], []
+            for _ in range(repeat):
+                tracemalloc.reset_peak()
+                before, _ = tracemalloc.get_traced_memory()
+                client.send(method, path, body)
+                after, peak = tracemalloc.get_traced_memory()
+                peaks.append(peak - before)
+                nets.append(after - before)
+            allocations[label] = (statistics.median(peaks), statistics.median(nets))
+    finally:
+        tracemalloc.stop()
+    return allocations
+
+def current_commit():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=REPO_DIR,
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def compare(results, baseline, threshold, min_delta_ms):
+    regressions = []
+    for label, result in results.items():
+        before = baseline.get('endpoints', {}).get(label)
+        if not before:
+            continue
+        delta = result['p95_ms'] - before['p95_ms']
+        if delta > min_delta_ms and delta > before['p95_ms'] * threshold:
+            regressions.append((label, before['p95_ms'], result['p95_ms']))
+    return regressions
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sessions', type=int, default=1000, help="Games with a session")
+    parser.add_argument('--running', type=int, default=32, help="Running idlers")
+    parser.add_argument('--presets', type=int, default=200)
+    parser.add_argument('--goals', type=int, default=50)
+    parser.add_argument('--windows', type=int, default=20, help="10 second polling windows to replay")
+    parser.add_argument('--alloc-repeat', type=int, default=5, help="Requests per endpoint in the allocation pass")
+    parser.add_argument('--seed', type=int, default=1)
+    parser.add_argument('--save', help="Write the results to this JSON file")
+    parser.add_argument('--baseline', help="Compare p95 latencies with a file written by --save")
+    parser.add_argument('--threshold', type=float, default=0.25, help="Allowed relative p95 slowdown")
+    parser.add_argument('--min-delta-ms', type=float, default=0.5, help="Ignore p95 slowdowns below this")
+    parser.add_argument('--history', help="Append the results with the current commit to this JSONL file")
+    args = parser.parse_args()
+
+    root = tempfile.mkdtemp(prefix='steamidle-bench-')
+    os.environ['STEAMIDLE_BACKEND'] = 'fake'
+    os.environ['STEAMIDLE_FAKE_ROOT'] = root
+    os.environ.setdefault('STEAMIDLE_FAKE_APPS', '100')
+    stub_http()
+    import steam_idle_manager as m
+
+    running = build_state(m, args)
+    mix = polling_mix(running)
+    client = Client(m.app)
+    # Warm up caches and ETags before measuring
+    for label, method, path, body in mix:
+        client.send(method, path, body)
+
+    timings = measure_latency(client, mix, args.windows)
+    allocations = measure_allocations(client, mix, args.alloc_repeat)
+
+    results = {}
+    print(f"{args.sessions} sessions, {len(running)} running, {args.presets} presets, {args.goals} goals, "
+          f"{args.windows} x 10s polling windows\n")
+    print(f"{'endpoint':<38}{'calls':>7}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}{'peak KiB':>10}{'net KiB':>9}")
+    for label in sorted(timings, key=lambda label: -sum(timings[label])):
+        samples = timings[label]
+        p50, p95, p99 = percentiles(samples)
+        peak, net = allocations.get(label, (0, 0))
+        results[label] = {"calls": len(samples), "p50_ms": round(p50, 3), "p95_ms": round(p95, 3),
+                          "p99_ms": round(p99, 3), "peak_bytes": int(peak), "net_bytes": int(net)}
+        print(f"{label:<38}{len(samples):>7}{p50:>9.2f}{p95:>9.2f}{p99:>9.2f}{peak / 1024:>10.1f}{net / 1024:>9.1f}")
+    total = sum(sum(samples) for samples in timings.values())
+    print(f"\nServer time per 10s window: {total / args.windows:.1f} ms")
+
+    report = {
+        "commit": current_commit(),
+        "date": datetime.now().isoformat(timespec='seconds'),
+        "config": {key: getattr(args, key) for key in ('sessions', 'running', 'presets', 'goals', 'windows')},
+        "endpoints": results
+    }
+    if args.save:
+        with open(args.save, 'w') as f:
+            json.dump(report, f, indent=2)
+    if args.history:
+        with open(args.history, 'a') as f:
+            f.write(json.dumps(report) + "\n")
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline, args.threshold, args.min_delta_ms)
+        if regressions:
+            print(f"\nRegressions against {args.baseline} (commit {baseline.get('commit')}):")
+            for label, before, after in regressions:
+                print(f"  {label}: p95 {before:.2f} ms -> {after:.2f} ms")
+            return 1
+        print(f"\nNo p95 regressions against {args.baseline} (commit {baseline.get('commit')})")
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,131 @@
+"""Benchmark the VDF parser against the old line/regex scraping.
+
+Runs over a generated corpus of appmanifest files, or over real ones:
+
+    python benchmarks/bench_vdf.py                       # 900 generated manifests
+    python benchmarks/bench_vdf.py --count 3000
+    python benchmarks/bench_vdf.py --corpus "C:\\Program Files (x86)\\Steam\\steamapps"
+"""
+import os
+import re
+import sys
+import glob
+import time
+import random
+import argparse
+import tempfile
+import statistics
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import vdf_parser
+
+MANIFEST_TEMPLATE = '''"AppState"
+{{
+	"appid"		"{appid}"
+	"Universe"		"1"
+	"name"		"{name}"
+	"StateFlags"		"4"
+	"installdir"		"{installdir}"
+	"LastUpdated"		"{updated}"
+	"SizeOnDisk"		"{size}"
+	"StagingSize"		"0"
+	"buildid"		"{build}"
+	"LastOwner"		"76561198000000000"
+	"UpdateResult"		"0"
+	"BytesToDownload"		"{size}"
+	"BytesDownloaded"		"{size}"
+	"AutoUpdateBehavior"		"0"
+	"AllowOtherDownloadsWhileRunning"		"0"
+	"ScheduledAutoUpdate"		"0"
+	"InstalledDepots"
+	{{
+{depots}
+	}}
+	"UserConfig"
+	{{
+		"language"		"english"
+	}}
+	"MountedConfig"
+	{{
+		"language"		"english"
+	}}
+}}
+'''
+
+DEPOT_TEMPLATE = '''		"{depot}"
+		{{
+			"manifest"		"{manifest}"
+			"size"		"{size}"
+		}}'''
+
+WORDS = ['Half', 'Life', 'Portal', 'Counter', 'Strike', 'Dark', 'Souls', 'Team', 'Fortress',
+         'Elden', 'Ring', 'Stardew', 'Valley', 'Hades', 'Terraria', 'The', 'Witcher']
+
+def generate_corpus(directory, count, seed=1):
+    random.seed(seed)
+    for i in range(count):
+        appid = 10 + i * 10
+        name = ' '.join(random.choice(WORDS) for _ in range(random.randint(1, 4)))
+        depots = '\n'.join(
+            DEPOT_TEMPLATE.format(depot=appid + d + 1, manifest=random.getrandbits(63), size=random.getrandbits(32))
+            for d in range(random.randint(1, 12)))
+        content = MANIFEST_TEMPLATE.format(
+            appid=appid, name=name.replace('"', '\\"'), installdir=name, updated=random.getrandbits(31),
+            size=random.getrandbits(34), build=random.getrandbits(24), depots=depots)
+        with open(os.path.join(directory, f"appmanifest_{appid}.acf"), 'w', encoding='utf-8') as f:
+            f.write(content)
+
+def legacy_name(path):
+    """What get_steam_library used to do per manifest"""
+    with open(path, 'r', encoding='utf-8') as f:
+        manifest = f.read()
+    name_match = re.search(r'"name"\s*"([^"]+)"', manifest)
+    return name_match.group(1) if name_match else "Unknown Game"
+
+def parser_name(path):
+    with open(path, 'r', encoding='utf-8') as f:
+        return vdf_parser.find_values(f, ('AppState', 'appid'), ('AppState', 'name')).get(('AppState', 'name'))
+
+def parser_full(path):
+    with open(path, 'r', encoding='utf-8') as f:
+        return vdf_parser.load(f)
+
+def run(label, func, files, repeat):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for path in files:
+            func(path)
+        timings.append(time.perf_counter() - start)
+    per_file = [t / len(files) * 1e6 for t in timings]
+    print(f"{label:<28} {statistics.median(per_file):9.1f} us/file   "
+          f"min {min(per_file):8.1f}   max {max(per_file):8.1f}   ({len(files)} files x {repeat})")
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--corpus', help="Directory with appmanifest_*.acf files")
+    parser.add_argument('--count', type=int, default=900, help="Generated manifests when no corpus is given")
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        corpus = args.corpus
+        if not corpus:
+            generate_corpus(temp_dir, args.count)
+            corpus = temp_dir
+        files = sorted(glob.glob(os.path.join(corpus, "appmanifest_*.acf")))
+        if not files:
+            print(f"No appmanifest_*.acf files in {corpus}")
+            return 1
+
+        # The parser must agree with the regex wherever the regex is right
+        mismatches = sum(1 for path in files if legacy_name(path) != parser_name(path))
+        print(f"Corpus: {corpus} ({len(files)} manifests, {mismatches} name mismatches vs regex)\n")
+
+        run("legacy read + regex", legacy_name, files, args.repeat)
+        run("find_values (early exit)", parser_name, files, args.repeat)
+        run("load (full parse)", parser_full, files, args.repeat)
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
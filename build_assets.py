@@ -0,0 +1,363 @@
+"""Build the static asset bundle for Steam Idle Manager.
+
+Vendors Tailwind, Font Awesome and Chart.js, purges unused Tailwind and
+Font Awesome rules, minifies the CSS/JS bundles, writes content-hashed
+copies with gzip (and brotli, if installed) siblings into static/dist and
+records them in static/dist/manifest.json for the Flask asset_url helper.
+
+Usage:
+    python build_assets.py            # download missing vendor files and build
+    python build_assets.py --refresh  # re-download vendor files first
+"""
+import os
+import re
+import sys
+import json
+import gzip
+import shutil
+import hashlib
+import requests
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+try:
+    import rjsmin
+except ImportError:
+    rjsmin = None
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+STATIC_DIR = os.path.join(BASE_DIR, "static")
+VENDOR_DIR = os.path.join(STATIC_DIR, "vendor")
+DIST_DIR = os.path.join(STATIC_DIR, "dist")
+MANIFEST_FILE = os.path.join(DIST_DIR, "manifest.json")
+
+# Files scanned for class names when purging CSS
+CONTENT_FILES = [
+    os.path.join(BASE_DIR, "templates", "index.html"),
+    os.path.join(STATIC_DIR, "script.js"),
+]
+
+FONT_AWESOME_BASE = "https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.0.0"
+VENDOR_ASSETS = {
+    "tailwind.css": "https://cdn.jsdelivr.net/npm/tailwindcss@2.2.19/dist/tailwind.min.css",
+    "fontawesome.css": f"{FONT_AWESOME_BASE}/css/all.min.css",
+    "chart.js": "https://cdn.jsdelivr.net/npm/chart.js@4.4.1/dist/chart.umd.js",
+}
+
+# Bundles written to dist: logical name -> (source file, purge unused classes)
+BUNDLES = {
+    "tailwind.css": (os.path.join(VENDOR_DIR, "tailwind.css"), True),
+    "fontawesome.css": (os.path.join(VENDOR_DIR, "fontawesome.css"), True),
+    "chart.js": (os.path.join(VENDOR_DIR, "chart.js"), False),
+    "style.css": (os.path.join(STATIC_DIR, "style.css"), False),
+    "script.js": (os.path.join(STATIC_DIR, "script.js"), False),
+}
+
+# Class names that are never spelled out literally in the scanned files
+SAFELIST = {"fa", "fas", "far", "fab", "fa-solid", "fa-regular", "fa-brands"}
+
+COMPRESSIBLE = ('.css', '.js', '.svg', '.ttf')
+TOKEN_RE = re.compile(r"[A-Za-z0-9_\-:/.%]+")
+INTERPOLATION_RE = re.compile(r"([A-Za-z0-9_\-:]*)\$\{([^}]*)\}([A-Za-z0-9_\-]*)")
+STRING_LITERAL_RE = re.compile(r"'([^']*)'|\"([^\"]*)\"")
+SELECTOR_CLASS_RE = re.compile(r"\.((?:\\[0-9a-fA-F]{1,6}\s?|\\.|[A-Za-z0-9_-])+)")
+CSS_ESCAPE_RE = re.compile(r"\\([0-9a-fA-F]{1,6})\s?|\\(.)")
+FONT_URL_RE = re.compile(r"url\((['\"]?)\.\./webfonts/([^)'\"?#]+)([^)'\"]*)\1\)")
+
+def download(url, path):
+    print(f"⬇️ Downloading {url}")
+    response = requests.get(url, timeout=30)
+    response.raise_for_status()
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'wb') as f:
+        f.write(response.content)
+
+def vendor_assets(refresh=False):
+    """Fetch third-party assets (and Font Awesome's webfonts) into static/vendor"""
+    for name, url in VENDOR_ASSETS.items():
+        path = os.path.join(VENDOR_DIR, name)
+        if refresh or not os.path.exists(path):
+            download(url, path)
+
+    with open(os.path.join(VENDOR_DIR, "fontawesome.css"), 'r', encoding='utf-8') as f:
+        fonts = {match.group(2) for match in FONT_URL_RE.finditer(f.read())}
+    for font in sorted(fonts):
+        path = os.path.join(VENDOR_DIR, "webfonts", font)
+        if refresh or not os.path.exists(path):
+            download(f"{FONT_AWESOME_BASE}/webfonts/{font}", path)
+
+def collect_used_classes():
+    """Return every token in the templates and scripts that could be a class name"""
+    used = set(SAFELIST)
+    for path in CONTENT_FILES:
+        with open(path, 'r', encoding='utf-8') as f:
+            content = f.read()
+
+        # Expand `bg-${cond ? 'red' : 'green'}-500` into both class names
+        for match in INTERPOLATION_RE.finditer(content):
+            prefix, expression, suffix = match.groups()
+            for literal in STRING_LITERAL_RE.finditer(expression):
+                value = literal.group(1) if literal.group(1) is not None else literal.group(2)
+                used.add(f"{prefix}{value}{suffix}")
+
+        for token in TOKEN_RE.findall(content):
+            used.add(token)
+            used.add(token.rstrip('.:'))
+    return used
+
+def split_top_level(text, separator):
+    """Split text on separator, ignoring separators inside brackets or strings"""
+    parts, depth, quote, start = [], 0, None, 0
+    for i, char in enumerate(text):
+        if quote:
+            if char == quote and text[i - 1] != '\\':
+                quote = None
+        elif char in '"\'':
+            quote = char
+        elif char in '([':
+            depth += 1
+        elif char in ')]':
+            depth -= 1
+        elif char == separator and depth == 0:
+            parts.append(text[start:i])
+            start = i + 1
+    parts.append(text[start:])
+    return parts
+
+def strip_css_comments(css):
+    return re.sub(r"/\*.*?\*/", "", css, flags=re.S)
+
+def parse_css(css):
+    """Parse CSS into a list of (prelude, body) pairs; nested blocks have a list body"""
+    nodes, i, length = [], 0, len(css)
+    while i < length:
+        brace = css.find('{', i)
+        semicolon = css.find(';', i)
+        if brace == -1 and semicolon == -1:
+            break
+        if semicolon != -1 and (brace == -1 or semicolon < brace):
+            # Statement at-rule such as @charset or @import
+            statement = css[i:semicolon].strip()
+            if statement:
+                nodes.append((statement, None))
+            i = semicolon + 1
+            continue
+
+        prelude = css[i:brace].strip()
+        depth, j, quote = 1, brace + 1, None
+        while j < length and depth:
+            char = css[j]
+            if quote:
+                if char == quote and css[j - 1] != '\\':
+                    quote = None
+            elif char in '"\'':
+                quote = char
+            elif char == '{':
+                depth += 1
+            elif char == '}':
+                depth -= 1
+            j += 1
+        body = css[brace + 1:j - 1]
+
+        if prelude.startswith(('@media', '@supports')):
+            nodes.append((prelude, parse_css(body)))
+        else:
+            nodes.append((prelude, body))
+        i = j
+    return nodes
+
+def unescape_class(name):
+    return CSS_ESCAPE_RE.sub(lambda m: chr(int(m.group(1), 16)) if m.group(1) else m.group(2), name)
+
+def selector_is_used(selector, used):
+    classes = SELECTOR_CLASS_RE.findall(selector)
+    return all(unescape_class(name) in used for name in classes)
+
+def purge_css(nodes, used):
+    """Drop rules whose selectors reference classes that never appear in the app"""
+    purged = []
+    for prelude, body in nodes:
+        if isinstance(body, list):
+            body = purge_css(body, used)
+            if body:
+                purged.append((prelude, body))
+        elif body is None or prelude.startswith('@'):
+            purged.append((prelude, body))
+        else:
+            selectors = [s for s in split_top_level(prelude, ',') if selector_is_used(s, used)]
+            if selectors:
+                purged.append((','.join(selectors), body))
+    return purged
+
+def collapse_whitespace(text):
+    """Collapse whitespace outside of string literals"""
+    out, quote, pending_space = [], None, False
+    for i, char in enumerate(text):
+        if quote:
+            out.append(char)
+            if char == quote and text[i - 1] != '\\':
+                quote = None
+            continue
+        if char.isspace():
+            pending_space = True
+            continue
+        if pending_space and out and re.match(r"[\w\-.#\[(*\"'%+:]", char) and re.match(r"[\w\-)\]\"'%*+]", out[-1]):
+            out.append(' ')
+        pending_space = False
+        if char in '"\'':
+            quote = char
+        out.append(char)
+    return ''.join(out)
+
+def serialize_css(nodes):
+    parts = []
+    for prelude, body in nodes:
+        prelude = collapse_whitespace(prelude)
+        if body is None:
+            parts.append(f"{prelude};")
+        elif isinstance(body, list):
+            parts.append(f"{prelude}{{{serialize_css(body)}}}")
+        else:
+            parts.append(f"{prelude}{{{collapse_whitespace(body).rstrip(';')}}}")
+    return ''.join(parts)
+
+def minify_js(source):
+    """Strip comments and indentation, keeping line breaks so ASI is unaffected"""
+    if rjsmin:
+        return rjsmin.jsmin(source)
+
+    out, i, length = [], 0, len(source)
+    templates = []  # Brace depth for each open ${ } inside a template literal
+    last_significant = ''
+    while i < length:
+        char = source[i]
+        if char in '"\'':
+            end = i + 1
+            while end < length and source[end] != char:
+                end += 2 if source[end] == '\\' else 1
+            out.append(source[i:end + 1])
+            last_significant = char
+            i = end + 1
+        elif char == '`' or (char == '}' and templates and templates[-1] == 0):
+            # Template literal text, copied verbatim up to its end or next ${
+            if char == '}':
+                templates.pop()
+            end = i + 1
+            while end < length:
+                if source[end] == '\\':
+                    end += 2
+                elif source[end] == '`':
+                    end += 1
+                    break
+                elif source.startswith('${', end):
+                    templates.append(0)
+                    end += 2
+                    break
+                else:
+                    end += 1
+            out.append(source[i:end])
+            last_significant = '`'
+            i = end
+        elif source.startswith('//', i):
+            i = source.find('\n', i)
+            i = length if i == -1 else i
+        elif source.startswith('/*', i):
+            end = source.find('*/', i + 2)
+            i = length if end == -1 else end + 2
+        elif char == '/' and (not last_significant or last_significant in '(,=:[!&|?{};+-*%<>~^'
+                                or re.search(r"\b(return|typeof|case)\s*$", ''.join(out[-10:]))):
+            # Regex literal
+            end, in_class = i + 1, False
+            while end < length and (in_class or source[end] != '/'):
+                if source[end] == '\\':
+                    end += 1
+                elif source[end] == '[':
+                    in_class = True
+                elif source[end] == ']':
+                    in_class = False
+                end += 1
+            out.append(source[i:end + 1])
+            last_significant = '/'
+            i = end + 1
+        elif char == '\n':
+            while out and out[-1] in (' ', '\t'):
+                out.pop()
+            if out and out[-1] != '\n':
+                out.append('\n')
+            i += 1
+            while i < length and source[i] in ' \t':
+                i += 1
+        else:
+            if templates and char in '{}':
+                templates[-1] += 1 if char == '{' else -1
+            if not char.isspace():
+                last_significant = char
+            out.append(char)
+            i += 1
+    return ''.join(out).strip() + '\n'
+
+def fingerprint(name, data):
+    stem, ext = os.path.splitext(name)
+    return f"{stem}.{hashlib.sha256(data).hexdigest()[:10]}{ext}"
+
+def write_asset(name, data):
+    """Write a hashed asset plus precompressed siblings, returns the hashed filename"""
+    hashed = fingerprint(name, data)
+    path = os.path.join(DIST_DIR, hashed)
+    with open(path, 'wb') as f:
+        f.write(data)
+    if name.endswith(COMPRESSIBLE):
+        with open(path + '.gz', 'wb') as f:
+            f.write(gzip.compress(data, compresslevel=9, mtime=0))
+        if brotli:
+            with open(path + '.br', 'wb') as f:
+                f.write(brotli.compress(data, quality=11))
+    return hashed
+
+def build():
+    if os.path.exists(DIST_DIR):
+        shutil.rmtree(DIST_DIR)
+    os.makedirs(DIST_DIR)
+
+    used = collect_used_classes()
+    manifest = {}
+
+    # Fonts first so the Font Awesome CSS can point at their hashed names
+    fonts = {}
+    fonts_dir = os.path.join(VENDOR_DIR, "webfonts")
+    if os.path.exists(fonts_dir):
+        for font in sorted(os.listdir(fonts_dir)):
+            with open(os.path.join(fonts_dir, font), 'rb') as f:
+                fonts[font] = write_asset(font, f.read())
+
+    for name, (source, purge) in BUNDLES.items():
+        with open(source, 'r', encoding='utf-8') as f:
+            content = f.read()
+        original_size = len(content.encode('utf-8'))
+
+        if name.endswith('.css'):
+            nodes = parse_css(strip_css_comments(content))
+            if purge:
+                nodes = purge_css(nodes, used)
+            content = serialize_css(nodes)
+            if fonts:
+                content = FONT_URL_RE.sub(
+                    lambda m: f"url({fonts.get(m.group(2), m.group(2))}{m.group(3)})", content)
+        elif name == 'script.js':
+            content = minify_js(content)
+
+        data = content.encode('utf-8')
+        manifest[name] = write_asset(name, data)
+        print(f"✅ {name}: {original_size // 1024} KB -> {len(data) // 1024} KB "
+              f"({len(gzip.compress(data)) // 1024} KB gzip) as {manifest[name]}")
+
+    with open(MANIFEST_FILE, 'w') as f:
+        json.dump(manifest, f, indent=2)
+    print(f"📦 Wrote {MANIFEST_FILE}" + ("" if brotli else " (install brotli for .br files)"))
+
+if __name__ == '__main__':
+    vendor_assets(refresh='--refresh' in sys.argv)
+    build()
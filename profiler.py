@@ -0,0 +1,163 @@
+"""Request phase timing and an in-process sampling profiler.
+
+PhaseTimer splits the time of the current request into phases (disk,
+network, ...) for Server-Timing headers. Nested phases are exclusive: while
+a network call runs inside a disk phase, only the network phase is charged.
+
+SamplingProfiler snapshots every thread's stack at a fixed interval with
+sys._current_frames() and writes the counts as collapsed stacks, one
+"thread;outer;...;inner count" line per stack, the input format of
+flamegraph.pl, speedscope and inferno.
+
+    profiler = SamplingProfiler('profiles')
+    profiler.start()
+    ...
+    path = profiler.stop()
+"""
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from datetime import datetime
+
+class PhaseTimer:
+    def __init__(self):
+        self.local = threading.local()
+
+    def begin(self):
+        """Start collecting phases for the current thread's request"""
+        self.local.totals = {}
+        self.local.stack = []
+        self.local.started = time.perf_counter()
+
+    def end(self):
+        """Stop collecting, returns (total seconds, {phase: seconds}) or None outside a request"""
+        started = getattr(self.local, 'started', None)
+        if started is None:
+            return None
+        totals = self.local.totals
+        self.local.totals = self.local.stack = self.local.started = None
+        return time.perf_counter() - started, totals
+
+    @contextmanager
+    def phase(self, name):
+        stack = getattr(self.local, 'stack', None)
+        if stack is None:
+            yield
+            return
+        totals = self.local.totals
+        now = time.perf_counter()
+        if stack:
+            # Pause the enclosing phase
+            outer, outer_started = stack[-1]
+            totals[outer] = totals.get(outer, 0.0) + now - outer_started
+        stack.append([name, now])
+        try:
+            yield
+        finally:
+            now = time.perf_counter()
+            _, started = stack.pop()
+            totals[name] = totals.get(name, 0.0) + now - started
+            if stack:
+                stack[-1][1] = now
+
+def server_timing(total, phases, rest='app'):
+    """Server-Timing header value, time outside the phases is reported as `rest`"""
+    entries = [f"{name};dur={seconds * 1000:.2f}" for name, seconds in phases.items()]
+    entries.append(f"{rest};dur={max(0.0, total - sum(phases.values())) * 1000:.2f}")
+    entries.append(f"total;dur={total * 1000:.2f}")
+    return ', '.join(entries)
+
+class SamplingProfiler:
+    FLUSH_INTERVAL = 30  # Seconds between rewrites of the output file while running
+
+    def __init__(self, output_dir, interval=0.01):
+        self.output_dir = output_dir
+        self.interval = interval
+        self.lock = threading.Lock()
+        self.stacks = Counter()
+        self.labels = {}  # code object -> frame label
+        self.samples = 0
+        self.thread = None
+        self.stop_event = threading.Event()
+        self.output_path = None
+
+    @property
+    def running(self):
+        return self.thread is not None and self.thread.is_alive()
+
+    def start(self):
+        """Start sampling into a new output file, returns its path"""
+        with self.lock:
+            if self.running:
+                return self.output_path
+            os.makedirs(self.output_dir, exist_ok=True)
+            stamp = datetime.now().strftime('%Y%m%d-%H%M%S')
+            self.output_path = os.path.join(self.output_dir, f"steamidle-{stamp}.folded")
+            self.stacks = Counter()
+            self.samples = 0
+            self.stop_event.clear()
+            self.thread = threading.Thread(target=self._run, name="sampling-profiler")
+            self.thread.daemon = True
+            self.thread.start()
+            return self.output_path
+
+    def stop(self):
+        """Stop sampling and write the output file, returns its path"""
+        with self.lock:
+            thread = self.thread
+            if thread is None:
+                return None
+            self.stop_event.set()
+            self.thread = None
+        thread.join()
+        self.write()
+        return self.output_path
+
+    def _label(self, code):
+        label = self.labels.get(code)
+        if label is None:
+            label = self.labels[code] = f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+        return label
+
+    def sample(self):
+        own = threading.get_ident()
+        names = {thread.ident: thread.name for thread in threading.enumerate()}
+        for ident, frame in sys._current_frames().items():
+            if ident == own:
+                continue
+            stack = []
+            while frame is not None:
+                stack.append(self._label(frame.f_code))
+                frame = frame.f_back
+            stack.append(names.get(ident, f"thread-{ident}"))
+            stack.reverse()
+            self.stacks[tuple(stack)] += 1
+        self.samples += 1
+
+    def _run(self):
+        next_flush = time.monotonic() + self.FLUSH_INTERVAL
+        while not self.stop_event.wait(self.interval):
+            try:
+                self.sample()
+            except Exception as e:
+                print(f"Error sampling stacks: {e}")
+            if time.monotonic() >= next_flush:
+                self.write()
+                next_flush = time.monotonic() + self.FLUSH_INTERVAL
+
+    def write(self):
+        """Write the collapsed stacks collected so far"""
+        if not self.output_path:
+            return
+        stacks = list(self.stacks.items())
+        lines = [';'.join(frame.replace(';', ':') for frame in stack) + f" {count}\n" for stack, count in stacks]
+        temp_path = self.output_path + '.tmp'
+        try:
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                f.writelines(lines)
+            os.replace(temp_path, self.output_path)
+        except OSError as e:
+            print(f"Error writing profile: {e}")
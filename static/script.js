@@ -45,6 +45,211 @@ function debounce(func, wait) {
     };
 }
 
+// Cache of conditional GET responses keyed by URL ({ etag, body })
+const conditionalCache = new Map();
+
+// Fetch a read-mostly JSON endpoint, revalidating with If-None-Match.
+// Returns a fresh object every call so callers can mutate the result.
+async function cachedFetch(url) {
+    const cached = conditionalCache.get(url);
+    const headers = cached ? { 'If-None-Match': cached.etag } : {};
+    const response = await fetch(url, { headers, cache: 'no-store' });
+
+    if (response.status === 304 && cached) {
+        return JSON.parse(cached.body);
+    }
+    if (!response.ok) {
+        throw new Error(`Request to ${url} failed with status ${response.status}`);
+    }
+
+    const body = await response.text();
+    const etag = response.headers.get('ETag');
+    if (etag) {
+        conditionalCache.set(url, { etag, body });
+    }
+    return JSON.parse(body);
+}
+
+// Windowed rendering for long grids and lists. Only the rows around the viewport
+// are in the DOM, container padding stands in for the rest, and rendered elements
+// are keyed so an update patches the existing cards instead of rebuilding them.
+class VirtualList {
+    constructor(container, { keyOf, render, update, placeholder = null, onRangeChange = null, overscan = 2 }) {
+        this.container = container;
+        this.keyOf = keyOf;
+        this.render = render;
+        this.update = update;
+        this.placeholder = placeholder;
+        this.onRangeChange = onRangeChange;
+        this.overscan = overscan;
+        this.items = [];
+        this.length = 0;
+        this.nodes = new Map(); // key -> element
+        this.rowHeight = 0;
+        this.range = [0, 0];
+        this.frame = null;
+
+        const style = getComputedStyle(container);
+        this.basePaddingTop = parseFloat(style.paddingTop) || 0;
+        this.basePaddingBottom = parseFloat(style.paddingBottom) || 0;
+
+        this.scrollParent = VirtualList.findScrollParent(container);
+        const scrollTarget = this.scrollParent === document.scrollingElement ? window : this.scrollParent;
+        scrollTarget.addEventListener('scroll', () => this.schedule(), { passive: true });
+        window.addEventListener('resize', () => {
+            this.rowHeight = 0;
+            this.schedule();
+        });
+    }
+
+    static findScrollParent(element) {
+        for (let node = element.parentElement; node; node = node.parentElement) {
+            const overflowY = getComputedStyle(node).overflowY;
+            if (overflowY === 'auto' || overflowY === 'scroll') {
+                return node;
+            }
+        }
+        return document.scrollingElement;
+    }
+
+    // items may be sparse (unloaded pages), length is the full logical size
+    setItems(items, length = items.length) {
+        this.items = items;
+        this.length = length;
+        this.renderNow(true);
+    }
+
+    // Re-run update() for the rendered items, e.g. after running state changed
+    refresh() {
+        this.renderNow(true);
+    }
+
+    // Drop every rendered element, used when the card layout itself changes
+    reset() {
+        this.nodes.forEach(element => element.remove());
+        this.nodes.clear();
+        this.rowHeight = 0;
+        this.range = [0, 0];
+    }
+
+    schedule() {
+        if (this.frame) return;
+        this.frame = requestAnimationFrame(() => {
+            this.frame = null;
+            this.renderNow(false);
+        });
+    }
+
+    columns() {
+        const template = getComputedStyle(this.container).gridTemplateColumns;
+        return template && template !== 'none' ? template.split(' ').length : 1;
+    }
+
+    visibleRange(columns) {
+        if (!this.rowHeight) {
+            // Nothing measured yet, render a few rows to learn the row height
+            return [0, Math.min(this.length, columns * 4)];
+        }
+
+        const rect = this.container.getBoundingClientRect();
+        let viewportTop = 0;
+        let viewportHeight = window.innerHeight;
+        if (this.scrollParent !== document.scrollingElement) {
+            const parentRect = this.scrollParent.getBoundingClientRect();
+            viewportTop = parentRect.top;
+            viewportHeight = parentRect.height;
+        }
+
+        const offset = viewportTop - (rect.top + this.basePaddingTop);
+        const firstRow = Math.max(0, Math.floor(offset / this.rowHeight) - this.overscan);
+        const lastRow = Math.max(firstRow + 1, Math.ceil((offset + viewportHeight) / this.rowHeight) + this.overscan);
+        return [Math.min(this.length, firstRow * columns), Math.min(this.length, lastRow * columns)];
+    }
+
+    measure(elements, columns) {
+        const first = elements[0];
+        if (!first || !first.offsetHeight) return false;
+
+        const rows = Math.ceil(elements.length / columns);
+        let rowHeight;
+        if (rows > 1) {
+            // Average row pitch, including the gap between rows
+            rowHeight = (elements[(rows - 1) * columns].offsetTop - first.offsetTop) / (rows - 1);
+        } else {
+            rowHeight = first.offsetHeight + (parseFloat(getComputedStyle(this.container).rowGap) || 16);
+        }
+
+        const changed = Math.abs(rowHeight - this.rowHeight) > 1;
+        this.rowHeight = rowHeight;
+        return changed;
+    }
+
+    renderNow(force) {
+        const columns = this.columns();
+        const [start, end] = this.visibleRange(columns);
+
+        const wanted = [];
+        const keep = new Set();
+        for (let i = start; i < end; i++) {
+            const item = this.items[i];
+            const key = item === undefined ? `placeholder-${i}` : String(this.keyOf(item));
+            let element = this.nodes.get(key);
+            if (!element) {
+                element = item === undefined ? this.placeholder(i) : this.render(item);
+                this.nodes.set(key, element);
+            } else if (item !== undefined && (force || element.virtualItem !== item)) {
+                this.update(element, item);
+            }
+            element.virtualItem = item;
+            keep.add(key);
+            wanted.push(element);
+        }
+
+        this.nodes.forEach((element, key) => {
+            if (!keep.has(key)) {
+                element.remove();
+                this.nodes.delete(key);
+            }
+        });
+
+        // Move only the elements that are out of place
+        wanted.forEach((element, index) => {
+            const current = this.container.children[index];
+            if (current !== element) {
+                this.container.insertBefore(element, current || null);
+            }
+        });
+
+        // The first real measurement changes the window, so render once more
+        const measuredBefore = this.rowHeight > 0;
+        const remeasure = this.measure(wanted, columns) && !measuredBefore;
+        const totalRows = Math.ceil(this.length / columns);
+        const firstRow = Math.floor(start / columns);
+        const lastRow = Math.ceil(end / columns);
+        this.container.style.paddingTop = `${this.basePaddingTop + firstRow * this.rowHeight}px`;
+        this.container.style.paddingBottom = `${this.basePaddingBottom + Math.max(0, totalRows - lastRow) * this.rowHeight}px`;
+
+        if (start !== this.range[0] || end !== this.range[1]) {
+            this.range = [start, end];
+            if (this.onRangeChange) this.onRangeChange(start, end);
+        }
+        if (remeasure) {
+            this.schedule();
+        }
+    }
+}
+
+// Latest session/total times per game id, shared by every list that shows playtime
+let sessionTimes = {};
+
+// Fetch session times for all tracked games (or just gameIds) in one request
+async function fetchSessionTimes(gameIds = null) {
+    const url = gameIds ? `/api/session-times?ids=${encodeURIComponent(gameIds.join(','))}` : '/api/session-times';
+    const response = await fetch(url);
+    const data = await response.json();
+    return data.times || {};
+}
+
 // Initialize the application when the DOM is loaded
 document.addEventListener('DOMContentLoaded', async function() {
     await checkFirstTimeSetup();
@@ -59,10 +264,10 @@ document.addEventListener('DOMContentLoaded', async function() {
     // Add event listeners for library functionality
     const librarySearch = document.getElementById('librarySearch');
     if (librarySearch) {
-        librarySearch.addEventListener('input', (e) => {
+        librarySearch.addEventListener('input', debounce((e) => {
             searchQuery = e.target.value;
             updateLibraryDisplay();
-        });
+        }, 150));
     }
     
     // Add click outside listener for library modal
@@ -88,7 +293,9 @@ document.addEventListener('DOMContentLoaded', async function() {
 
     // Update library display when games are started/stopped
     document.addEventListener('gameStateChanged', async function() {
-        updateLibraryDisplay();
+        if (libraryVirtualList) {
+            libraryVirtualList.refresh();
+        }
         updateGamesList();
         updateRunningGamesList();
         const presets = await loadPresets(true);
@@ -97,8 +304,7 @@ document.addEventListener('DOMContentLoaded', async function() {
 
     // Load saved theme from backend
     try {
-        const response = await fetch('/api/settings');
-        const settings = await response.json();
+        const settings = await cachedFetch('/api/settings');
         if (settings.theme) {
             currentTheme = settings.theme;
             document.documentElement.setAttribute('data-theme', currentTheme);
@@ -219,13 +425,21 @@ function removeGame(gameId) {
     updateGamesList();
 }
 
+let gamesVirtualList = null;
+
 function updateGamesList() {
     const gamesList = document.getElementById('gamesList');
     const currentGamesCount = document.getElementById('currentGamesCount');
     const startStopAllBtn = document.getElementById('startStopAllBtn');
     const exportGamesBtn = document.getElementById('exportGamesBtn');
     
-    gamesList.innerHTML = '';
+    if (!gamesVirtualList) {
+        gamesVirtualList = new VirtualList(gamesList, {
+            keyOf: game => game.id,
+            render: createGameCard,
+            update: patchGameCard
+        });
+    }
     
     const gameText = currentGames.length === 1 ? 'game' : 'games';
     
@@ -251,9 +465,11 @@ function updateGamesList() {
         startStopAllBtn.classList.add('hidden');
         exportGamesBtn.classList.add('hidden');
         
+        gamesVirtualList.setItems([]);
+        
         // Add empty state message
         const emptyState = document.createElement('div');
-        emptyState.className = 'col-span-full flex flex-col items-center justify-center py-16 text-center';
+        emptyState.className = 'games-empty-state col-span-full flex flex-col items-center justify-center py-16 text-center';
         emptyState.innerHTML = `
             <div class="w-24 h-24 mb-6 relative">
                 <!-- Steam Controller Icon -->
@@ -297,95 +513,96 @@ function updateGamesList() {
                 </button>
             </div>
         `;
-        gamesList.appendChild(emptyState);
+        if (!gamesList.querySelector('.games-empty-state')) {
+            gamesList.appendChild(emptyState);
+        }
     }
     
     currentGamesCount.textContent = `(${currentGames.length} ${gameText})`;
     
-    currentGames.forEach(game => {
-        const isRunning = runningGames.has(game.id.toString());
-        const isFavorite = gameFavorites.some(fav => fav.id === game.id);
-        
-        const gameCard = document.createElement('div');
-        gameCard.className = 'game-card bg-gray-800 rounded-lg overflow-hidden relative';
-        gameCard.setAttribute('data-game-id', game.id);
-        
-        // Get playtime for running games
-        if (isRunning) {
-            fetch('/api/game-session-time', {
-                method: 'POST',
-                headers: {
-                    'Content-Type': 'application/json'
-                },
-                body: JSON.stringify({ gameId: game.id })
-            })
-            .then(response => response.json())
-            .then(data => {
-                const playtimeElement = gameCard.querySelector('.playtime-info');
-                if (playtimeElement) {
-                    playtimeElement.innerHTML = `
-                        <div class="text-green-400">Current Session: ${data.current_session}</div>
-                        <div class="text-blue-400">Total Time: ${data.total_time}</div>
-                    `;
-                }
-            })
-            .catch(error => {
-                console.error('Error fetching playtime:', error);
-            });
-        }
-        
-        gameCard.innerHTML = `
-            <div class="relative">
-                <img src="${game.image || 'https://via.placeholder.com/460x215/374151/FFFFFF?text=No+Image'}" 
-                     alt="${game.name}" 
-                     class="w-full h-48 object-cover">
-                <button onclick="toggleGameFavorite('${game.id}')" 
-                        class="favorite-button absolute top-2 right-2">
-                    <i class="fas fa-star text-xl ${isFavorite ? 'text-yellow-400 glow-yellow' : 'text-gray-500 hover:text-yellow-400'}"></i>
-                </button>
-                ${isRunning ? '<span class="absolute top-2 left-2 bg-green-500 text-white px-2 py-1 rounded text-xs">Running</span>' : ''}
+    if (currentGames.length > 0) {
+        const emptyState = gamesList.querySelector('.games-empty-state');
+        if (emptyState) emptyState.remove();
+        gamesVirtualList.setItems(currentGames);
+    }
+}
+
+function playtimeInfoHtml(gameId) {
+    const times = sessionTimes[gameId];
+    if (!times) {
+        return `
+            <div class="text-green-400">Loading session time...</div>
+            <div class="text-blue-400">Loading total time...</div>
+        `;
+    }
+    return `
+        <div class="text-green-400">Current Session: ${times.current_session}</div>
+        <div class="text-blue-400">Total Time: ${times.total_time}</div>
+    `;
+}
+
+function createGameCard(game) {
+    const gameCard = document.createElement('div');
+    gameCard.className = 'game-card bg-gray-800 rounded-lg overflow-hidden relative';
+    gameCard.setAttribute('data-game-id', game.id);
+    patchGameCard(gameCard, game);
+    return gameCard;
+}
+
+// Rebuild a card only when something it shows has changed; playtime is patched by updatePlaytimes
+function patchGameCard(gameCard, game) {
+    const isRunning = runningGames.has(game.id.toString());
+    const isFavorite = gameFavorites.some(fav => fav.id === game.id);
+    const signature = `${isRunning}|${isFavorite}|${game.name}|${game.image}`;
+    if (gameCard.dataset.signature === signature) return;
+    gameCard.dataset.signature = signature;
+    
+    gameCard.innerHTML = `
+        <div class="relative">
+            <img src="${game.image || 'https://via.placeholder.com/460x215/374151/FFFFFF?text=No+Image'}" 
+                 alt="${game.name}" 
+                 class="w-full h-48 object-cover">
+            <button onclick="toggleGameFavorite('${game.id}')" 
+                    class="favorite-button absolute top-2 right-2">
+                <i class="fas fa-star text-xl ${isFavorite ? 'text-yellow-400 glow-yellow' : 'text-gray-500 hover:text-yellow-400'}"></i>
+            </button>
+            ${isRunning ? '<span class="absolute top-2 left-2 bg-green-500 text-white px-2 py-1 rounded text-xs">Running</span>' : ''}
+        </div>
+        <div class="p-4">
+            <div class="flex justify-between items-start mb-2">
+                <h3 class="text-lg font-semibold">${game.name}</h3>
             </div>
-            <div class="p-4">
-                <div class="flex justify-between items-start mb-2">
-                    <h3 class="text-lg font-semibold">${game.name}</h3>
-                </div>
-                <div class="flex items-center gap-2 mb-4">
-                    <p class="text-sm text-gray-400">ID: ${game.id}</p>
-                    <a href="https://store.steampowered.com/app/${game.id}" 
-                       target="_blank"
-                       class="text-gray-400 hover:text-blue-400 transition-colors group relative">
-                        <i class="fab fa-steam"></i>
-                        <!-- Tooltip -->
-                        <div class="opacity-0 group-hover:opacity-100 transition-opacity absolute bottom-full left-1/2 transform -translate-x-1/2 mb-2 px-3 py-2 bg-gray-900 text-white text-sm rounded-lg whitespace-nowrap">
-                            View on Steam Store
-                            <!-- Arrow -->
-                            <div class="absolute left-1/2 transform -translate-x-1/2 top-full">
-                                <div class="w-2 h-2 bg-gray-900 transform rotate-45"></div>
-                            </div>
+            <div class="flex items-center gap-2 mb-4">
+                <p class="text-sm text-gray-400">ID: ${game.id}</p>
+                <a href="https://store.steampowered.com/app/${game.id}" 
+                   target="_blank"
+                   class="text-gray-400 hover:text-blue-400 transition-colors group relative">
+                    <i class="fab fa-steam"></i>
+                    <!-- Tooltip -->
+                    <div class="opacity-0 group-hover:opacity-100 transition-opacity absolute bottom-full left-1/2 transform -translate-x-1/2 mb-2 px-3 py-2 bg-gray-900 text-white text-sm rounded-lg whitespace-nowrap">
+                        View on Steam Store
+                        <!-- Arrow -->
+                        <div class="absolute left-1/2 transform -translate-x-1/2 top-full">
+                            <div class="w-2 h-2 bg-gray-900 transform rotate-45"></div>
                         </div>
-                    </a>
-                </div>
-                <div class="playtime-info mb-4">
-                    ${isRunning ? `
-                        <div class="text-green-400">Loading session time...</div>
-                        <div class="text-blue-400">Loading total time...</div>
-                    ` : ''}
-                </div>
-                <div class="flex gap-2">
-                    <button onclick="${isRunning ? 'stopGame' : 'startGame'}('${game.id}')" 
-                            class="flex-1 bg-${isRunning ? 'red' : 'green'}-500 hover:bg-${isRunning ? 'red' : 'green'}-600 px-4 py-2 rounded text-sm font-medium transition-colors">
-                        <i class="fas fa-${isRunning ? 'stop' : 'play'} mr-1"></i>${isRunning ? 'Stop' : 'Start'}
-                    </button>
-                    <button onclick="removeGame('${game.id}')" 
-                            class="bg-red-500 hover:bg-red-600 px-4 py-2 rounded text-sm">
-                        <i class="fas fa-trash"></i>
-                    </button>
-                </div>
+                    </div>
+                </a>
             </div>
-        `;
-        
-        gamesList.appendChild(gameCard);
-    });
+            <div class="playtime-info mb-4">
+                ${isRunning ? playtimeInfoHtml(game.id) : ''}
+            </div>
+            <div class="flex gap-2">
+                <button onclick="${isRunning ? 'stopGame' : 'startGame'}('${game.id}')" 
+                        class="flex-1 bg-${isRunning ? 'red' : 'green'}-500 hover:bg-${isRunning ? 'red' : 'green'}-600 px-4 py-2 rounded text-sm font-medium transition-colors">
+                    <i class="fas fa-${isRunning ? 'stop' : 'play'} mr-1"></i>${isRunning ? 'Stop' : 'Start'}
+                </button>
+                <button onclick="removeGame('${game.id}')" 
+                        class="bg-red-500 hover:bg-red-600 px-4 py-2 rounded text-sm">
+                    <i class="fas fa-trash"></i>
+                </button>
+            </div>
+        </div>
+    `;
 }
 
 async function savePreset() {
@@ -489,8 +706,7 @@ async function loadPresets(returnData = false) {
 
         isUpdatingPresets = true;
 
-        const response = await fetch('/api/get-presets');
-        const presets = await response.json();
+        const presets = await cachedFetch('/api/get-presets');
         
         // Update cache
         presetsCache = presets;
@@ -518,13 +734,17 @@ const debouncedUpdatePresetsList = debounce(async (presets) => {
     presetsList.innerHTML = '';
 
     // Get favorites data
-    const favoritesResponse = await fetch('/api/favorites');
-    const favoritesData = await favoritesResponse.json();
+    const favoritesData = await cachedFetch('/api/favorites');
     const favoriteNames = favoritesData.favorites.map(f => f.name);
 
+    // Get rotation status to show which preset is rotating
+    const rotationResponse = await fetch('/api/rotation');
+    const rotation = await rotationResponse.json();
+
     presets.forEach(preset => {
         const isPresetRunning = preset.games.every(game => runningGames.has(game.id.toString()));
         const isFavorited = favoriteNames.includes(preset.name);
+        const isRotating = rotation.enabled && rotation.source === preset.name;
         
         const presetCard = document.createElement('div');
         presetCard.className = 'preset-card bg-gray-800 rounded-lg p-4';
@@ -614,6 +834,10 @@ const debouncedUpdatePresetsList = debounce(async (presets) => {
                             class="bg-${isPresetRunning ? 'red' : 'green'}-500 hover:bg-${isPresetRunning ? 'red' : 'green'}-600 px-4 py-2 rounded text-sm">
                         <i class="fas fa-${isPresetRunning ? 'stop' : 'play'} mr-1"></i>${isPresetRunning ? 'Stop All' : 'Run All'}
                     </button>
+                    <button onclick="${isRotating ? 'stopRotation()' : `rotatePreset('${preset.name}')`}"
+                            class="bg-${isRotating ? 'red' : 'purple'}-500 hover:bg-${isRotating ? 'red' : 'purple'}-600 px-4 py-2 rounded text-sm">
+                        <i class="fas fa-sync-alt mr-1"></i>${isRotating ? 'Stop Rotation' : 'Rotate'}
+                    </button>
                     <button onclick="showEditPresetModal('${preset.name}')"
                             class="bg-blue-500 hover:bg-blue-600 px-4 py-2 rounded text-sm">
                         <i class="fas fa-cog mr-1"></i>Edit Games
@@ -792,6 +1016,79 @@ async function stopGame(gameId) {
     }
 }
 
+async function toggleSuspendGame(gameId) {
+    const suspended = sessionTimes[gameId] && sessionTimes[gameId].suspended;
+    try {
+        const response = await fetch(suspended ? '/api/resume-game' : '/api/suspend-game', {
+            method: 'POST',
+            headers: {
+                'Content-Type': 'application/json'
+            },
+            body: JSON.stringify({ gameId: gameId })
+        });
+
+        if (response.ok) {
+            showNotification(suspended ? 'Game resumed' : 'Game suspended');
+            updateRunningGamesList();
+        } else {
+            showNotification(`Failed to ${suspended ? 'resume' : 'suspend'} the game`, 'error');
+        }
+    } catch (error) {
+        console.error('Error suspending game:', error);
+    }
+}
+
+// Start or stop a set of games with one request, returns the per-game results
+async function startGames(gameIds) {
+    const response = await fetch('/api/games/start', {
+        method: 'POST',
+        headers: {
+            'Content-Type': 'application/json'
+        },
+        body: JSON.stringify({ gameIds: gameIds.map(String) })
+    });
+    const data = await response.json();
+
+    for (const [gameId, result] of Object.entries(data.results || {})) {
+        if (result.status === 'started') {
+            runningGames.add(gameId);
+            gameStartTimes.set(gameId, Date.now());
+        }
+    }
+    updateGameStatuses();
+    updateStatistics();
+    updateGamesList();
+    triggerGameStateChange();
+    return data;
+}
+
+async function stopGames(gameIds) {
+    const response = await fetch('/api/games/stop', {
+        method: 'POST',
+        headers: {
+            'Content-Type': 'application/json'
+        },
+        body: JSON.stringify({ gameIds: gameIds.map(String) })
+    });
+    const data = await response.json();
+
+    // Games that could not be stopped keep running and stay tracked, all of them if the request failed
+    data.failed = data.results ? [] : gameIds.map(String);
+    for (const [gameId, result] of Object.entries(data.results || {})) {
+        if (['stopped', 'killed', 'not_running'].includes(result.status)) {
+            runningGames.delete(gameId);
+            gameStartTimes.delete(gameId);
+        } else {
+            data.failed.push(gameId);
+        }
+    }
+    updateGameStatuses();
+    updateStatistics();
+    updateGamesList();
+    triggerGameStateChange();
+    return data;
+}
+
 function switchTab(tabName) {
     // Update tab buttons
     document.querySelectorAll('.tab-button').forEach(button => {
@@ -812,6 +1109,34 @@ function switchTab(tabName) {
     }
 }
 
+// Resolve game names to app IDs through the local app catalog, returns { name: id }
+async function resolveGameNames(names) {
+    const resolvedIds = {};
+    if (names.length === 0) return resolvedIds;
+    try {
+        const response = await fetch('/api/catalog/resolve', {
+            method: 'POST',
+            headers: { 'Content-Type': 'application/json' },
+            body: JSON.stringify({ names })
+        });
+        const data = await response.json();
+        if (data.status !== 'success') {
+            throw new Error(data.message);
+        }
+        for (const name of names) {
+            const match = data.results[name];
+            if (match) {
+                resolvedIds[name] = match.id.toString();
+            } else {
+                console.warn(`Could not find game: ${name}`);
+            }
+        }
+    } catch (error) {
+        console.warn('Could not resolve game names', error);
+    }
+    return resolvedIds;
+}
+
 async function importBatFile(file) {
     const loadingOverlay = document.getElementById('importLoadingOverlay');
     loadingOverlay.classList.remove('hidden');
@@ -833,37 +1158,14 @@ async function importBatFile(file) {
                     gameIds = content.match(/steam-idle\.exe\s+(\d+)/g)
                     ?.map(match => match.match(/\d+/)[0]) || [];
                 } else if (file.name.endsWith('.txt')) {
-                    // Parse TXT file - split by newlines and clean up each line
-                    const lines = content.split(/\r?\n/).filter(line => line.trim());
-                    
-                    for (const line of lines) {
-                        const trimmedLine = line.trim();
-                        if (/^\d+$/.test(trimmedLine)) {
-                            // Line contains only numbers - treat as game ID
-                            gameIds.push(trimmedLine);
-                        } else if (trimmedLine) {
-                            // Line contains text - treat as game name
-                            statusText.textContent = `Searching for game: ${trimmedLine}...`;
-                            try {
-                                const searchResponse = await fetch('/api/fetch-game', {
-                                    method: 'POST',
-                                    headers: { 'Content-Type': 'application/json' },
-                                    body: JSON.stringify({ gameId: trimmedLine })
-                                });
-                                
-                                if (searchResponse.ok) {
-                                    const gameInfo = await searchResponse.json();
-                                    if (gameInfo && gameInfo.id) {
-                                        gameIds.push(gameInfo.id.toString());
-                                    }
-                                }
-                                // Add delay between searches
-                                await new Promise(resolve => setTimeout(resolve, 500));
-                            } catch (error) {
-                                console.warn(`Could not find game: ${trimmedLine}`, error);
-                            }
-                        }
+                    // Parse TXT file - one game ID or name per line, names are resolved in one request
+                    const lines = content.split(/\r?\n/).map(line => line.trim()).filter(Boolean);
+                    const names = lines.filter(line => !/^\d+$/.test(line));
+                    if (names.length > 0) {
+                        statusText.textContent = `Searching for ${names.length} game name(s)...`;
                     }
+                    const resolvedIds = await resolveGameNames(names);
+                    gameIds = lines.map(line => /^\d+$/.test(line) ? line : resolvedIds[line]).filter(Boolean);
                 }
                 
                 if (gameIds.length === 0) {
@@ -999,19 +1301,18 @@ async function stopPreset(presetName) {
             throw new Error('Preset not found');
         }
 
-        // Keep track of stopped games
-        const stoppedGames = [];
-
-        // Stop each game in the preset
-        for (const game of preset.games) {
-            if (runningGames.has(game.id.toString())) {
-                await stopGame(game.id);
-                stoppedGames.push(game.name);
-            }
+        // Stop the preset's running games in one batch
+        const runningPresetGames = preset.games.filter(game => runningGames.has(game.id.toString()));
+        let failed = [];
+        if (runningPresetGames.length > 0) {
+            failed = (await stopGames(runningPresetGames.map(game => game.id))).failed;
         }
+        const stoppedGames = runningPresetGames.filter(game => !failed.includes(game.id.toString())).map(game => game.name);
 
-        // Remove from running presets
-        runningPresets.delete(presetName);
+        // Remove from running presets, unless some of its games are still running
+        if (failed.length === 0) {
+            runningPresets.delete(presetName);
+        }
 
         // Update UI with a single loadPresets call
         const updatedPresets = await loadPresets(true);
@@ -1019,7 +1320,9 @@ async function stopPreset(presetName) {
         updateGamesList();
         
         // Show success message with game names
-        if (stoppedGames.length > 0) {
+        if (failed.length > 0) {
+            showNotification(`Stopped ${stoppedGames.length} games in preset "${presetName}", ${failed.length} could not be stopped`, 'warning');
+        } else if (stoppedGames.length > 0) {
             const gamesList = stoppedGames.join(', ');
             showNotification(`Stopped games in preset "${presetName}": ${gamesList}`, 'success');
         } else {
@@ -1031,6 +1334,62 @@ async function stopPreset(presetName) {
     }
 }
 
+async function rotatePreset(presetName) {
+    try {
+        const response = await fetch('/api/rotation', {
+            method: 'POST',
+            headers: {
+                'Content-Type': 'application/json',
+            },
+            body: JSON.stringify({ presetName })
+        });
+        const data = await response.json();
+
+        if (data.status === 'success') {
+            showNotification(`🔁 ${data.message} from preset "${presetName}"`, 'success');
+            // Give the rotation a moment to fill its slots before refreshing
+            setTimeout(async () => {
+                const rotationResponse = await fetch('/api/rotation');
+                const rotation = await rotationResponse.json();
+                rotation.active.forEach(game => runningGames.add(game.id));
+                await updateGameStatuses();
+                const updatedPresets = await loadPresets(true);
+                await debouncedUpdatePresetsList(updatedPresets);
+                updateGamesList();
+            }, 2000);
+        } else {
+            showNotification(data.message, 'error');
+        }
+    } catch (error) {
+        console.error('Error starting rotation:', error);
+        showNotification('Failed to start rotation', 'error');
+    }
+}
+
+async function stopRotation() {
+    try {
+        const response = await fetch('/api/rotation', {
+            method: 'DELETE',
+            headers: {
+                'Content-Type': 'application/json',
+            },
+            body: JSON.stringify({ stopGames: true })
+        });
+        const data = await response.json();
+
+        if (data.status === 'success') {
+            await updateGameStatuses();
+            const updatedPresets = await loadPresets(true);
+            await debouncedUpdatePresetsList(updatedPresets);
+            updateGamesList();
+            showNotification('⏹️ Rotation stopped', 'success');
+        }
+    } catch (error) {
+        console.error('Error stopping rotation:', error);
+        showNotification('Failed to stop rotation', 'error');
+    }
+}
+
 function showNotification(message, type = 'info') {
     const notification = document.createElement('div');
     notification.className = `notification ${type} fixed bottom-4 right-4 p-4 rounded-lg flex items-center gap-3 z-50`;
@@ -1069,28 +1428,20 @@ function showNotification(message, type = 'info') {
 }
 
 async function updatePlaytimes() {
-    // Update playtimes for all running games
-    for (const gameId of runningGames) {
-        try {
-            const response = await fetch('/api/game-session-time', {
-                method: 'POST',
-                headers: {
-                    'Content-Type': 'application/json'
-                },
-                body: JSON.stringify({ gameId })
-            });
-
-            const data = await response.json();
-            
-            // Update game card playtime
+    // Update playtimes for all running games with a single request
+    if (runningGames.size === 0) return;
+    
+    try {
+        const times = await fetchSessionTimes([...runningGames]);
+        Object.assign(sessionTimes, times);
+        
+        for (const [gameId, data] of Object.entries(times)) {
+            // Update game card playtime (only cards in view are rendered)
             const gameCard = document.querySelector(`[data-game-id="${gameId}"]`);
             if (gameCard) {
                 const playtimeElement = gameCard.querySelector('.playtime-info');
-                if (playtimeElement) {
-                    playtimeElement.innerHTML = `
-                        <div class="text-green-400">Current Session: ${data.current_session}</div>
-                        <div class="text-blue-400">Total Time: ${data.total_time}</div>
-                    `;
+                if (playtimeElement && runningGames.has(gameId)) {
+                    playtimeElement.innerHTML = playtimeInfoHtml(gameId);
                 }
             }
 
@@ -1105,9 +1456,13 @@ async function updatePlaytimes() {
                     `;
                 }
             });
-        } catch (error) {
-            console.error('Error updating playtime:', error);
         }
+        
+        if (runningVirtualList) {
+            runningVirtualList.refresh();
+        }
+    } catch (error) {
+        console.error('Error updating playtime:', error);
     }
 }
 
@@ -1398,8 +1753,7 @@ async function updateQuickActions() {
 
 async function updateFavoritePresets() {
     try {
-        const response = await fetch('/api/favorites');
-        const data = await response.json();
+        const data = await cachedFetch('/api/favorites');
         const container = document.getElementById('favoritePresets');
         
         container.innerHTML = `
@@ -1449,8 +1803,7 @@ function formatTimestamp(timestamp) {
 
 async function updateRecentActions() {
     try {
-        const response = await fetch('/api/recent-actions');
-        const data = await response.json();
+        const data = await cachedFetch('/api/recent-actions');
         const container = document.getElementById('recentActions');
         
         container.innerHTML = data.actions.map(action => `
@@ -1469,8 +1822,7 @@ async function updateRecentActions() {
 
 async function updateCustomShortcuts() {
     try {
-        const response = await fetch('/api/shortcuts');
-        const data = await response.json();
+        const data = await cachedFetch('/api/shortcuts');
         const container = document.getElementById('customShortcuts');
         
         container.innerHTML = `
@@ -1812,8 +2164,7 @@ document.addEventListener('keydown', async (e) => {
     if (recordingKeys) return;
     
     try {
-        const response = await fetch('/api/shortcuts');
-        const data = await response.json();
+        const data = await cachedFetch('/api/shortcuts');
         
         for (const shortcut of data.shortcuts) {
             const keys = shortcut.key_combination.split('+');
@@ -2024,8 +2375,7 @@ function applyTheme(theme) {
 
 async function updateThemeButtons() {
     try {
-        const response = await fetch('/api/settings');
-        const settings = await response.json();
+        const settings = await cachedFetch('/api/settings');
         const currentTheme = settings.theme || 'dark';
         
         // Apply the saved theme
@@ -2054,8 +2404,7 @@ document.addEventListener('DOMContentLoaded', async function() {
 
 async function checkFirstTimeSetup() {
     try {
-        const response = await fetch('/api/settings');
-        const settings = await response.json();
+        const settings = await cachedFetch('/api/settings');
         
         const modal = document.getElementById('welcomeConfigModal');
         if (!settings.setup_completed) {
@@ -2409,8 +2758,7 @@ async function updateIdlePath() {
 
 async function updateStartupToggle() {
     try {
-        const response = await fetch('/api/settings');
-        const settings = await response.json();
+        const settings = await cachedFetch('/api/settings');
         const toggle = document.getElementById('startupToggle');
         
         if (settings.run_on_startup) {
@@ -2457,8 +2805,7 @@ async function toggleStartup() {
 
 async function updateMinimizeToTrayToggle() {
     try {
-        const response = await fetch('/api/settings');
-        const settings = await response.json();
+        const settings = await cachedFetch('/api/settings');
         const toggle = document.getElementById('minimizeToTrayToggle');
         
         if (settings.minimize_to_tray) {
@@ -2505,8 +2852,7 @@ async function toggleMinimizeToTray() {
 
 async function updateAutoReconnectToggle() {
     try {
-        const response = await fetch('/api/settings');
-        const settings = await response.json();
+        const settings = await cachedFetch('/api/settings');
         const toggle = document.getElementById('autoReconnectToggle');
         
         if (settings.auto_reconnect) {
@@ -2791,11 +3137,19 @@ async function completeWelcomeSetup() {
 // Add to the existing JavaScript code
 
 let selectedLibraryGames = new Set();
-let libraryGames = [];
+let libraryGames = []; // Loaded library entries by position, sparse until their page arrives
+let libraryGamesById = new Map();
+let libraryIdleTimes = {};
+let libraryVirtualList = null;
+let libraryPageRequests = new Map(); // page -> in-flight or finished request
+let libraryPageCursors = new Map(); // page -> cursor returned with the page before it
+let libraryGeneration = 0;
 let currentFilter = 'all';
+let librarySort = 'name';
 let searchQuery = '';
+const LIBRARY_PAGE_SIZE = 60;
 
-async function loadSteamLibrary() {
+async function loadSteamLibrary(refresh = false) {
     const modal = document.getElementById('libraryModal');
     if (!modal) {
         showNotification('Library modal not found', 'error');
@@ -2806,21 +3160,90 @@ async function loadSteamLibrary() {
     modal.classList.add('flex');
     
     try {
-        const response = await fetch('/api/steam-library');
+        libraryIdleTimes = await fetchSessionTimes();
+    } catch (error) {
+        console.error('Error fetching idle times:', error);
+    }
+    
+    await updateLibraryDisplay(refresh);
+}
+
+// Fetch one page of the (filtered) library and drop it into the virtual list
+function fetchLibraryPage(page, refresh = false) {
+    if (!libraryPageRequests.has(page)) {
+        libraryPageRequests.set(page, loadLibraryPage(page, refresh));
+    }
+    return libraryPageRequests.get(page);
+}
+
+async function loadLibraryPage(page, refresh) {
+    const generation = libraryGeneration;
+    
+    // Pages are reached by following cursors, so the page before must be loaded first
+    if (page > 0) {
+        await fetchLibraryPage(page - 1);
+        if (generation !== libraryGeneration) return;
+        if (!libraryPageCursors.has(page)) {
+            libraryPageRequests.delete(page);
+            return;
+        }
+    }
+    
+    const params = new URLSearchParams({
+        limit: LIBRARY_PAGE_SIZE,
+        q: searchQuery,
+        installed: currentFilter === 'installed' ? '1' : '0',
+        sort: librarySort
+    });
+    if (page > 0) params.set('cursor', libraryPageCursors.get(page));
+    if (refresh) params.set('refresh', '1');
+    
+    try {
+        const response = await fetch(`/api/steam-library?${params}`);
         const data = await response.json();
         
+        // Ignore pages for a search or filter that has since changed
+        if (generation !== libraryGeneration) return;
+        
         if (data.error) {
+            libraryPageRequests.delete(page);
             showNotification(data.error, 'error');
+            if (response.status === 409) {
+                updateLibraryDisplay();
+            }
             return;
         }
         
-        libraryGames = data.games;
-        updateLibraryDisplay();
+        data.games.forEach((game, index) => {
+            libraryGames[data.offset + index] = game;
+            libraryGamesById.set(game.id.toString(), game);
+        });
+        if (data.next_cursor) {
+            libraryPageCursors.set(page + 1, data.next_cursor);
+        }
+        
+        // Update game counter display
+        const gameCountDisplay = document.getElementById('gameCountDisplay');
+        if (gameCountDisplay) {
+            if (searchQuery) {
+                gameCountDisplay.textContent = `(${data.total_games} total • ${data.installed_games} installed • ${data.total} matches)`;
+            } else {
+                gameCountDisplay.textContent = `(${data.total_games} total • ${data.installed_games} installed)`;
+            }
+        }
+        
+        libraryVirtualList.setItems(libraryGames, data.total);
     } catch (error) {
+        libraryPageRequests.delete(page);
         showNotification('Error loading Steam library: ' + error, 'error');
     }
 }
 
+function setLibrarySort(sort) {
+    librarySort = sort;
+    updateLibraryDisplay();
+}
+
 function closeLibrary() {
     const modal = document.getElementById('libraryModal');
     if (!modal) return;
@@ -2832,8 +3255,7 @@ function closeLibrary() {
 
 async function updateDiscordRPCToggle() {
     try {
-        const response = await fetch('/api/settings');
-        const settings = await response.json();
+        const settings = await cachedFetch('/api/settings');
         updateToggleState('discordRpcToggle', settings.discord_rpc_enabled);
             } catch (error) {
         console.error('Error updating Discord RPC toggle:', error);
@@ -2864,19 +3286,199 @@ async function toggleDiscordRPC() {
     }
 }
 
-// Add to the existing openSettings function
-async function openSettings() {
+async function updateLaunchProfileSettings() {
     try {
-        document.getElementById('settingsLoading').classList.remove('hidden');
-        document.getElementById('settingsModal').classList.add('flex');
-        document.getElementById('settingsModal').classList.remove('hidden');
-        
-        // Update all toggles
-        await Promise.all([
+        const settings = await cachedFetch('/api/settings');
+        const profile = settings.launch_profile || {};
+        document.getElementById('launchPriority').value = profile.priority || 'normal';
+        document.getElementById('launchAffinity').value = (profile.affinity || []).join(',');
+        document.getElementById('launchIoPriority').value = profile.io_priority || '';
+    } catch (error) {
+        console.error('Error updating launch profile settings:', error);
+    }
+}
+
+async function saveLaunchProfile() {
+    const affinityText = document.getElementById('launchAffinity').value.trim();
+    const affinity = affinityText.startsWith('0x')
+        ? affinityText
+        : affinityText.split(',').map(cpu => cpu.trim()).filter(cpu => cpu !== '').map(Number);
+    try {
+        const response = await fetch('/api/settings', {
+            method: 'POST',
+            headers: {
+                'Content-Type': 'application/json'
+            },
+            body: JSON.stringify({
+                launch_profile: {
+                    priority: document.getElementById('launchPriority').value,
+                    affinity: affinity.length ? affinity : null,
+                    io_priority: document.getElementById('launchIoPriority').value || null
+                }
+            })
+        });
+        const data = await response.json();
+
+        if (response.ok) {
+            updateLaunchProfileSettings();
+            showNotification('Launch profile saved');
+        } else {
+            showNotification(data.message || 'Failed to save the launch profile', 'error');
+        }
+    } catch (error) {
+        console.error('Error saving launch profile:', error);
+        showNotification('Failed to save the launch profile', 'error');
+    }
+}
+
+async function updateGuardrailSettings() {
+    try {
+        const settings = await cachedFetch('/api/settings');
+        const guardrails = settings.guardrails || {};
+        updateToggleState('guardrailsToggle', guardrails.enabled);
+        document.getElementById('guardrailMaxRss').value = guardrails.max_rss_mb ?? 512;
+        document.getElementById('guardrailMaxTotalRss').value = guardrails.max_total_rss_mb ?? 0;
+        document.getElementById('guardrailMaxCpu').value = guardrails.max_cpu_percent ?? 25;
+        document.getElementById('guardrailCpuAction').value = guardrails.cpu_action || 'throttle';
+    } catch (error) {
+        console.error('Error updating guardrail settings:', error);
+    }
+}
+
+async function postGuardrails(guardrails, message) {
+    try {
+        const response = await fetch('/api/settings', {
+            method: 'POST',
+            headers: {
+                'Content-Type': 'application/json'
+            },
+            body: JSON.stringify({ guardrails })
+        });
+        const data = await response.json();
+
+        if (response.ok) {
+            updateGuardrailSettings();
+            showNotification(message);
+        } else {
+            showNotification(data.message || 'Failed to update guardrails', 'error');
+        }
+    } catch (error) {
+        console.error('Error updating guardrails:', error);
+        showNotification('Failed to update guardrails', 'error');
+    }
+}
+
+function toggleGuardrails() {
+    const enable = !document.getElementById('guardrailsToggle').classList.contains('bg-blue-500');
+    postGuardrails({ enabled: enable }, enable ? 'Resource guardrails enabled' : 'Resource guardrails disabled');
+}
+
+function saveGuardrails() {
+    postGuardrails({
+        max_rss_mb: Number(document.getElementById('guardrailMaxRss').value) || 0,
+        max_total_rss_mb: Number(document.getElementById('guardrailMaxTotalRss').value) || 0,
+        max_cpu_percent: Number(document.getElementById('guardrailMaxCpu').value) || 0,
+        cpu_action: document.getElementById('guardrailCpuAction').value
+    }, 'Guardrails saved');
+}
+
+async function updateDutyCycleSettings() {
+    try {
+        const settings = await cachedFetch('/api/settings');
+        const dutyCycle = settings.duty_cycle || {};
+        updateToggleState('dutyCycleToggle', dutyCycle.enabled);
+        document.getElementById('dutyCyclePeriod').value = dutyCycle.period_seconds ?? 300;
+        document.getElementById('dutyCycleActive').value = dutyCycle.active_seconds ?? 30;
+    } catch (error) {
+        console.error('Error updating duty cycle settings:', error);
+    }
+}
+
+async function postDutyCycle(dutyCycle, message) {
+    try {
+        const response = await fetch('/api/settings', {
+            method: 'POST',
+            headers: {
+                'Content-Type': 'application/json'
+            },
+            body: JSON.stringify({ duty_cycle: dutyCycle })
+        });
+        const data = await response.json();
+
+        if (response.ok) {
+            updateDutyCycleSettings();
+            showNotification(message);
+        } else {
+            showNotification(data.message || 'Failed to update the duty cycle', 'error');
+        }
+    } catch (error) {
+        console.error('Error updating duty cycle:', error);
+        showNotification('Failed to update the duty cycle', 'error');
+    }
+}
+
+function toggleDutyCycle() {
+    const enable = !document.getElementById('dutyCycleToggle').classList.contains('bg-blue-500');
+    postDutyCycle({ enabled: enable }, enable ? 'Duty cycle enabled' : 'Duty cycle disabled');
+}
+
+function saveDutyCycle() {
+    postDutyCycle({
+        period_seconds: Number(document.getElementById('dutyCyclePeriod').value) || 0,
+        active_seconds: Number(document.getElementById('dutyCycleActive').value) || 0
+    }, 'Duty cycle saved');
+}
+
+async function updateProfilerToggle() {
+    try {
+        const settings = await cachedFetch('/api/settings');
+        updateToggleState('profilerToggle', settings.profiler_running);
+    } catch (error) {
+        console.error('Error updating profiler toggle:', error);
+    }
+}
+
+async function toggleProfiler() {
+    try {
+        const enable = !document.getElementById('profilerToggle').classList.contains('bg-blue-500');
+        const response = await fetch('/api/settings', {
+            method: 'POST',
+            headers: {
+                'Content-Type': 'application/json'
+            },
+            body: JSON.stringify({ profiler_enabled: enable })
+        });
+        const data = await response.json();
+
+        if (response.ok) {
+            updateProfilerToggle();
+            showNotification(enable ? 'Profiler started' : `Profile saved to ${data.profile}`);
+        } else {
+            showNotification('Failed to toggle the profiler', 'error');
+        }
+    } catch (error) {
+        console.error('Error toggling profiler:', error);
+        showNotification('Failed to toggle the profiler', 'error');
+    }
+}
+
+// Add to the existing openSettings function
+async function openSettings() {
+    try {
+        document.getElementById('settingsLoading').classList.remove('hidden');
+        document.getElementById('settingsModal').classList.add('flex');
+        document.getElementById('settingsModal').classList.remove('hidden');
+        
+        // Update all toggles
+        await Promise.all([
             updateStartupToggle(),
             updateMinimizeToTrayToggle(),
             updateAutoReconnectToggle(),
             updateDiscordRPCToggle(),  // Add this line
+            updateProfilerToggle(),
+            updateGuardrailSettings(),
+            updateLaunchProfileSettings(),
+            updateDutyCycleSettings(),
             updateThemeButtons()
         ]);
         
@@ -2898,7 +3500,7 @@ async function openSettings() {
 
 // Add function to handle adding a game to a new preset
 async function addGameToNewPreset(gameId) {
-    const game = libraryGames.find(g => g.id.toString() === gameId.toString());
+    const game = libraryGamesById.get(gameId.toString());
     if (!game) return;
     
     // Add to current games list with all necessary properties
@@ -2924,8 +3526,9 @@ async function createPresetFromSelected() {
     }
     
     // Get selected games info with all necessary properties
-    const selectedGames = libraryGames
-        .filter(game => selectedLibraryGames.has(game.id))
+    const selectedGames = [...selectedLibraryGames]
+        .map(gameId => libraryGamesById.get(gameId.toString()))
+        .filter(game => game !== undefined)
         .map(game => ({
             id: game.id,
             name: game.name,
@@ -2967,31 +3570,19 @@ async function startSelectedGames() {
     let successCount = 0;
     let failCount = 0;
     
-    // Start each selected game
-    for (const gameId of selectedLibraryGames) {
-        try {
-            const response = await fetch('/api/start-game', {
-                method: 'POST',
-                headers: {
-                    'Content-Type': 'application/json'
-                },
-                body: JSON.stringify({ gameId })
-            });
-
-            if (response.ok) {
-                runningGames.add(gameId.toString());
-                successCount++;
-            } else {
-                failCount++;
-            }
-        } catch (error) {
-            console.error('Error starting game:', error);
-            failCount++;
-        }
+    // Start the selected games in one batch
+    try {
+        const data = await startGames([...selectedLibraryGames]);
+        const results = Object.values(data.results || {});
+        successCount = results.filter(result => result.status === 'started').length;
+        failCount = results.filter(result => result.status === 'failed').length;
+    } catch (error) {
+        console.error('Error starting games:', error);
+        failCount = selectedLibraryGames.size;
     }
     
     // Update display
-    updateLibraryDisplay();
+    libraryVirtualList.refresh();
     
     // Show result notification
     if (successCount > 0) {
@@ -3002,6 +3593,23 @@ async function startSelectedGames() {
     }
 }
 
+// Store names and images of adopted idlers arrive one by one after startup
+const refreshAdoptedGames = debounce(() => {
+    updateGamesList();
+    updateRunningGamesList();
+}, 250);
+
+function updateAdoptedGame(game) {
+    const existing = currentGames.find(g => g.id.toString() === game.id.toString());
+    if (existing) {
+        existing.name = game.name;
+        existing.image = game.image;
+    } else {
+        currentGames.push(game);
+    }
+    refreshAdoptedGames();
+}
+
 // Add this function to trigger the game state change event
 function triggerGameStateChange() {
     document.dispatchEvent(new Event('gameStateChanged'));
@@ -3128,6 +3736,10 @@ function showRunningGames() {
     });
     
     updateRunningGamesList();
+    updateIdlerResources();
+    if (!resourcesInterval) {
+        resourcesInterval = setInterval(updateIdlerResources, 5000);
+    }
 }
 
 function closeRunningGames() {
@@ -3138,14 +3750,76 @@ function closeRunningGames() {
         clearInterval(playtimeInterval);
         playtimeInterval = null;
     }
+    if (resourcesInterval) {
+        clearInterval(resourcesInterval);
+        resourcesInterval = null;
+    }
+}
+
+// CPU and memory history of the running idlers, sampled by the backend every 5 seconds
+let idlerResources = { games: {}, total: null };
+let resourcesInterval = null;
+
+async function updateIdlerResources() {
+    if (runningGames.size === 0) return;
+    try {
+        const response = await fetch('/api/resources?points=60');
+        const data = await response.json();
+        if (data.status !== 'success') return;
+        idlerResources = data;
+
+        const totalElement = document.getElementById('runningResourcesTotal');
+        if (totalElement) {
+            totalElement.textContent = data.total
+                ? `Idlers: ${data.total.latest.cpu.toFixed(1)}% CPU, ${formatBytes(data.total.latest.rss)}`
+                : '';
+        }
+        if (runningVirtualList) {
+            runningVirtualList.refresh();
+        }
+    } catch (error) {
+        console.error('Error fetching idler resources:', error);
+    }
 }
 
+function formatBytes(bytes) {
+    if (bytes >= 1024 * 1024 * 1024) return `${(bytes / (1024 * 1024 * 1024)).toFixed(1)} GB`;
+    if (bytes >= 1024 * 1024) return `${(bytes / (1024 * 1024)).toFixed(1)} MB`;
+    return `${Math.round(bytes / 1024)} KB`;
+}
+
+function sparklineSvg(values, color, width = 80, height = 20) {
+    if (!values || values.length < 2) {
+        return `<svg width="${width}" height="${height}"></svg>`;
+    }
+    const max = Math.max(...values);
+    const min = Math.min(...values);
+    const range = max - min || 1;
+    const step = width / (values.length - 1);
+    const points = values
+        .map((value, index) => `${(index * step).toFixed(1)},${(height - 1 - ((value - min) / range) * (height - 2)).toFixed(1)}`)
+        .join(' ');
+    return `<svg width="${width}" height="${height}" class="inline-block align-middle">
+        <polyline points="${points}" fill="none" stroke="${color}" stroke-width="1.5"/>
+    </svg>`;
+}
+
+let runningVirtualList = null;
+
 async function updateRunningGamesList() {
     const gamesList = document.getElementById('runningGamesList');
     const modalCount = document.getElementById('runningGamesModalCount');
     const headerCount = document.getElementById('runningGamesCount');
     const totalPlaytimeCounter = document.getElementById('totalPlaytimeCounter');
     
+    if (!runningVirtualList) {
+        runningVirtualList = new VirtualList(gamesList, {
+            keyOf: entry => entry.id,
+            render: createRunningGameCard,
+            update: patchRunningGameCard
+        });
+    }
+    
     // Update counts
     const runningCount = runningGames.size;
     modalCount.textContent = `(${runningCount} ${runningCount === 1 ? 'game' : 'games'})`;
@@ -3156,6 +3830,8 @@ async function updateRunningGamesList() {
         playtimeInterval = null;
     }
     
+    const emptyState = gamesList.querySelector('.running-empty-state');
+    
     // Update header badge
     if (runningCount > 0) {
         headerCount.textContent = runningCount;
@@ -3164,89 +3840,56 @@ async function updateRunningGamesList() {
         headerCount.classList.add('hidden');
         totalPlaytimeCounter.textContent = 'Total: 00:00:00';
         gameStartTimes.clear();
+        runningVirtualList.setItems([]);
         // Show no games running message
-        gamesList.innerHTML = `
-            <div class="text-center text-gray-400 py-8">
-                <i class="fas fa-gamepad text-4xl mb-4"></i>
-                <p class="text-lg">No games currently running</p>
-            </div>
-        `;
+        if (!emptyState) {
+            gamesList.insertAdjacentHTML('beforeend', `
+                <div class="running-empty-state text-center text-gray-400 py-8">
+                    <i class="fas fa-gamepad text-4xl mb-4"></i>
+                    <p class="text-lg">No games currently running</p>
+                </div>
+            `);
+        }
         return;
     }
     
-    // Clear the list and show loading state if there are games
-    if (runningCount > 0) {
-        gamesList.innerHTML = `
-            <div class="text-center text-gray-400 py-4">
-                <i class="fas fa-spinner fa-spin text-2xl mb-2"></i>
-                <p>Loading ${runningCount} games...</p>
-            </div>
-        `;
-    }
+    if (emptyState) emptyState.remove();
     
-    // Prepare array to hold all game data
-    const gamePromises = [];
+    const runningGameIds = [...runningGames];
     
-    // Get playtime for each running game
-    for (const gameId of runningGames) {
-        const promise = (async () => {
-            try {
-                // Get game session time
-                const timeResponse = await fetch('/api/game-session-time', {
-                    method: 'POST',
-                    headers: { 'Content-Type': 'application/json' },
-                    body: JSON.stringify({ gameId })
-                });
-                const timeData = await timeResponse.json();
-                
-                // Store or update start time for this game
-                if (!gameStartTimes.has(gameId)) {
-                    gameStartTimes.set(gameId, Date.now());
-                }
-                
-                // First try to find game info in currentGames
-                let gameInfo = currentGames.find(g => g.id.toString() === gameId.toString());
-                
-                // If not found in currentGames, try to fetch it
-                if (!gameInfo) {
-                    const gameResponse = await fetch('/api/fetch-game', {
-                        method: 'POST',
-                        headers: { 'Content-Type': 'application/json' },
-                        body: JSON.stringify({ gameId })
-                    });
-                    gameInfo = await gameResponse.json();
-                    
-                    // Add to currentGames if not already there
-                    if (gameInfo && !currentGames.some(g => g.id === gameInfo.id)) {
-                        currentGames.push(gameInfo);
-                    }
-                }
-                
-                if (!gameInfo) return null;
-                
-                return {
-                    gameInfo,
-                    timeData,
-                    gameId
-                };
-            } catch (error) {
-                console.error('Error fetching game data:', error);
-                return null;
-            }
-        })();
-        
-        gamePromises.push(promise);
+    // Store or update start time for each game
+    for (const gameId of runningGameIds) {
+        if (!gameStartTimes.has(gameId)) {
+            gameStartTimes.set(gameId, Date.now());
+        }
     }
     
-    // Wait for all game data to be fetched
-    const gamesData = await Promise.all(gamePromises);
-    
-    // Clear the list again to remove loading state
-    gamesList.innerHTML = '';
+    // Fetch info for games that are not in currentGames, all in parallel
+    const missingIds = runningGameIds.filter(gameId =>
+        !currentGames.some(g => g.id.toString() === gameId.toString()));
+    await Promise.all(missingIds.map(async gameId => {
+        try {
+            const gameResponse = await fetch('/api/fetch-game', {
+                method: 'POST',
+                headers: { 'Content-Type': 'application/json' },
+                body: JSON.stringify({ gameId })
+            });
+            const gameInfo = await gameResponse.json();
+            
+            // Add to currentGames if not already there
+            if (gameInfo && !gameInfo.error && !currentGames.some(g => g.id === gameInfo.id)) {
+                currentGames.push(gameInfo);
+            }
+        } catch (error) {
+            console.error('Error fetching game data:', error);
+        }
+    }));
     
-    // Filter out null results and sort games by name
-    const validGamesData = gamesData.filter(data => data !== null)
-        .sort((a, b) => a.gameInfo.name.localeCompare(b.gameInfo.name));
+    try {
+        Object.assign(sessionTimes, await fetchSessionTimes(runningGameIds));
+    } catch (error) {
+        console.error('Error fetching session times:', error);
+    }
     
     // Set up real-time counter
     playtimeInterval = setInterval(() => {
@@ -3269,42 +3912,72 @@ async function updateRunningGamesList() {
         totalPlaytimeCounter.textContent = `Total: ${formattedTime}`;
     }, 1000);
     
-    // If no valid games are running, show a message
-    if (validGamesData.length === 0) {
-        gamesList.innerHTML = `
-            <div class="text-center text-gray-400 py-8">
-                <i class="fas fa-gamepad text-4xl mb-2"></i>
-                <p>No games currently running</p>
+    // Sort games by name, keyed by id so unchanged cards stay in place
+    const entries = runningGameIds
+        .map(gameId => {
+            const gameInfo = currentGames.find(g => g.id.toString() === gameId.toString());
+            return gameInfo ? { id: gameId, name: gameInfo.name, image: gameInfo.image } : null;
+        })
+        .filter(entry => entry !== null)
+        .sort((a, b) => a.name.localeCompare(b.name));
+    
+    runningVirtualList.setItems(entries);
+}
+
+function createRunningGameCard(entry) {
+    const gameCard = document.createElement('div');
+    gameCard.className = 'bg-gray-700 rounded-lg p-4 flex items-center gap-4 mb-4 last:mb-0';
+    gameCard.innerHTML = `
+        <img src="${entry.image || 'https://via.placeholder.com/460x215/374151/FFFFFF?text=No+Image'}" 
+             alt="${entry.name}" 
+             class="w-16 h-16 rounded object-cover">
+        <div class="flex-1 min-w-0">
+            <h3 class="font-semibold text-lg truncate" title="${entry.name}">${entry.name}</h3>
+            <div class="text-sm text-gray-400 truncate">ID: ${entry.id}</div>
+            <div class="mt-1">
+                <div class="running-session text-green-400 text-sm"></div>
+                <div class="running-total text-blue-400 text-sm"></div>
+                <div class="running-duty text-gray-400 text-xs"></div>
             </div>
+            <div class="running-resources mt-1 text-xs text-gray-400 flex items-center gap-2"></div>
+        </div>
+        <div class="flex gap-2 flex-shrink-0">
+            <button onclick="toggleSuspendGame('${entry.id}')" 
+                    class="running-suspend bg-gray-600 hover:bg-gray-500 px-4 py-2 rounded text-sm font-medium transition-colors">
+            </button>
+            <button onclick="stopGame('${entry.id}')" 
+                    class="bg-red-500 hover:bg-red-600 px-4 py-2 rounded text-sm font-medium transition-colors">
+                <i class="fas fa-stop mr-1"></i>Stop
+            </button>
+        </div>
+    `;
+    patchRunningGameCard(gameCard, entry);
+    return gameCard;
+}
+
+function patchRunningGameCard(gameCard, entry) {
+    const times = sessionTimes[entry.id] || { current_session: '00:00:00', total_time: '00:00:00' };
+    gameCard.querySelector('.running-session').textContent = `Session: ${times.current_session}`;
+    gameCard.querySelector('.running-total').textContent = `Total: ${times.total_time}`;
+    gameCard.querySelector('.running-duty').textContent = times.active_time
+        ? `Active: ${times.active_time}, suspended: ${times.suspended_time}`
+        : '';
+    gameCard.querySelector('.running-suspend').innerHTML = times.suspended
+        ? '<i class="fas fa-play mr-1"></i>Resume'
+        : '<i class="fas fa-pause mr-1"></i>Suspend';
+
+    const resources = idlerResources.games[entry.id];
+    const resourcesElement = gameCard.querySelector('.running-resources');
+    if (resources) {
+        const { latest, history } = resources;
+        resourcesElement.innerHTML = `
+            <span title="CPU">${sparklineSvg(history.cpu, '#34d399')} ${latest.cpu.toFixed(1)}%</span>
+            <span title="Memory">${sparklineSvg(history.rss, '#60a5fa')} ${formatBytes(latest.rss)}</span>
+            <span>${latest.threads} threads, ${latest.handles} handles</span>
         `;
-        return;
+    } else {
+        resourcesElement.innerHTML = '';
     }
-    
-    // Create and append all game cards
-    validGamesData.forEach(({ gameInfo, timeData, gameId }) => {
-        const gameCard = document.createElement('div');
-        gameCard.className = 'bg-gray-700 rounded-lg p-4 flex items-center gap-4 mb-4 last:mb-0';
-        gameCard.innerHTML = `
-            <img src="${gameInfo.image || 'https://via.placeholder.com/460x215/374151/FFFFFF?text=No+Image'}" 
-                 alt="${gameInfo.name}" 
-                 class="w-16 h-16 rounded object-cover">
-            <div class="flex-1 min-w-0">
-                <h3 class="font-semibold text-lg truncate" title="${gameInfo.name}">${gameInfo.name}</h3>
-                <div class="text-sm text-gray-400 truncate">ID: ${gameInfo.id}</div>
-                <div class="mt-1">
-                    <div class="text-green-400 text-sm">Session: ${timeData.current_session}</div>
-                    <div class="text-blue-400 text-sm">Total: ${timeData.total_time}</div>
-                </div>
-            </div>
-            <div class="flex gap-2 flex-shrink-0">
-                <button onclick="stopGame('${gameId}')" 
-                        class="bg-red-500 hover:bg-red-600 px-4 py-2 rounded text-sm font-medium transition-colors">
-                    <i class="fas fa-stop mr-1"></i>Stop
-                </button>
-            </div>
-        `;
-        gamesList.appendChild(gameCard);
-    });
 }
 
 function showEmergencyStopConfirmation() {
@@ -3454,112 +4127,105 @@ async function toggleMinimizeAllGames() {
     }
 }
 
-async function updateLibraryDisplay() {
+// Start the library view over, e.g. after the search, filter or view size changed
+async function updateLibraryDisplay(refresh = false) {
     const libraryDiv = document.getElementById('steamLibrary');
-    libraryDiv.innerHTML = '';
     
     // Set view size class
     libraryDiv.className = `${currentViewSize}-view p-6`;
     
-    // Filter games based on current filter and search
-    const filteredGames = libraryGames.filter(game => {
-        const matchesFilter = 
-            currentFilter === 'all' ||
-            (currentFilter === 'installed' && game.installed === true);
-            
-        const matchesSearch = 
-            !searchQuery ||
-            game.name.toLowerCase().includes(searchQuery.toLowerCase());
-            
-        return matchesFilter && matchesSearch;
-    });
-
-    // Update game counter display
-    const totalGames = libraryGames.length;
-    const installedGames = libraryGames.filter(game => game.installed === true).length;
-    const filteredCount = filteredGames.length;
-    const gameCountDisplay = document.getElementById('gameCountDisplay');
-    if (gameCountDisplay) {
-        if (searchQuery) {
-            gameCountDisplay.textContent = `(${totalGames} total • ${installedGames} installed • ${filteredCount} matches)`;
-        } else {
-            gameCountDisplay.textContent = `(${totalGames} total • ${installedGames} installed)`;
-        }
+    if (!libraryVirtualList) {
+        libraryVirtualList = new VirtualList(libraryDiv, {
+            keyOf: game => game.id,
+            render: createLibraryCard,
+            update: patchLibraryCard,
+            placeholder: () => {
+                const placeholder = document.createElement('div');
+                placeholder.className = `game-card ${currentViewSize}-card animate-pulse`;
+                return placeholder;
+            },
+            onRangeChange: (start, end) => {
+                if (end <= start) return;
+                const firstPage = Math.floor(start / LIBRARY_PAGE_SIZE);
+                const lastPage = Math.floor((end - 1) / LIBRARY_PAGE_SIZE);
+                for (let page = firstPage; page <= lastPage; page++) {
+                    fetchLibraryPage(page);
+                }
+            }
+        });
     }
+    
+    libraryGeneration++;
+    libraryPageRequests.clear();
+    libraryPageCursors.clear();
+    libraryGames = [];
+    libraryVirtualList.reset();
+    if (libraryVirtualList.scrollParent !== document.scrollingElement) {
+        libraryVirtualList.scrollParent.scrollTop = 0;
+    }
+    
+    await fetchLibraryPage(0, refresh);
+}
 
-    // Get idle hours for each game
-    const idleHoursPromises = filteredGames.map(async game => {
-        try {
-            const response = await fetch('/api/game-session-time', {
-                method: 'POST',
-                headers: { 'Content-Type': 'application/json' },
-                body: JSON.stringify({ gameId: game.id })
-            });
-            const data = await response.json();
-            return { gameId: game.id, idleTime: data.total_time };
-        } catch (error) {
-            console.error('Error fetching idle time:', error);
-            return { gameId: game.id, idleTime: '00:00:00' };
-        }
-    });
-
-    const idleHours = await Promise.all(idleHoursPromises);
-    const idleHoursMap = new Map(idleHours.map(({ gameId, idleTime }) => [gameId, idleTime]));
+function createLibraryCard(game) {
+    const gameCard = document.createElement('div');
+    patchLibraryCard(gameCard, game);
+    return gameCard;
+}
 
-    // Create and append all game cards
-    filteredGames.forEach(game => {
-        const isRunning = runningGames.has(game.id.toString());
-        const gameCard = document.createElement('div');
-        gameCard.className = `game-card ${currentViewSize}-card`;
-        
-        // Get idle time for this game
-        const idleTime = idleHoursMap.get(game.id) || '00:00:00';
-        
-        gameCard.innerHTML = `
-            <div class="relative">
-                <img src="${game.icon || 'https://via.placeholder.com/460x215/374151/FFFFFF?text=No+Image'}" 
-                     alt="${game.name}" 
-                     class="w-full">
-                <div class="absolute top-2 right-2 flex gap-2">
-                    <input type="checkbox" id="game-${game.id}" 
-                           class="w-5 h-5 rounded border-gray-600 text-blue-500 focus:ring-blue-500"
-                           onchange="toggleGameSelection('${game.id}')"
-                           ${selectedLibraryGames.has(game.id) ? 'checked' : ''}>
-                </div>
-                ${game.installed ? 
-                    '<span class="absolute top-2 left-2 bg-green-500 text-white px-2 py-1 rounded text-xs">Installed</span>' :
-                    ''}
-                ${isRunning ? 
-                    '<span class="absolute top-2 left-24 bg-blue-500 text-white px-2 py-1 rounded text-xs">Running</span>' :
-                    ''}
+function patchLibraryCard(gameCard, game) {
+    const isRunning = runningGames.has(game.id.toString());
+    
+    // Get idle time for this game
+    const idleTime = (libraryIdleTimes[game.id] || {}).total_time || '00:00:00';
+    
+    const signature = `${currentViewSize}|${isRunning}|${selectedLibraryGames.has(game.id)}|${idleTime}`;
+    if (gameCard.dataset.signature === signature) return;
+    gameCard.dataset.signature = signature;
+    gameCard.className = `game-card ${currentViewSize}-card`;
+    
+    gameCard.innerHTML = `
+        <div class="relative">
+            <img src="${game.icon || 'https://via.placeholder.com/460x215/374151/FFFFFF?text=No+Image'}" 
+                 alt="${game.name}" 
+                 class="w-full">
+            <div class="absolute top-2 right-2 flex gap-2">
+                <input type="checkbox" id="game-${game.id}" 
+                       class="w-5 h-5 rounded border-gray-600 text-blue-500 focus:ring-blue-500"
+                       onchange="toggleGameSelection('${game.id}')"
+                       ${selectedLibraryGames.has(game.id) ? 'checked' : ''}>
             </div>
-            <div class="p-4">
-                <h3 class="text-lg font-semibold mb-2">${game.name}</h3>
-                <div class="text-sm text-gray-400">
-                    <p class="text-green-400">Idle Hours: ${idleTime}</p>
-                    <p class="text-xs mt-2">Game ID: ${game.id}</p>
-                </div>
-                <div class="mt-4 flex gap-2">
-                    ${isRunning ?
-                        `<button onclick="stopGame('${game.id}')" 
-                                class="flex-1 bg-red-500 hover:bg-red-600 px-4 py-2 rounded text-sm">
-                            <i class="fas fa-stop mr-1"></i>Stop
-                        </button>` :
-                        `<button onclick="startGame('${game.id}')" 
-                                class="flex-1 bg-blue-500 hover:bg-blue-600 px-4 py-2 rounded text-sm">
-                            <i class="fas fa-play mr-1"></i>Start
-                        </button>`
-                    }
-                    <button onclick="addGameToNewPreset('${game.id}')" 
-                            class="flex-1 bg-green-500 hover:bg-green-600 px-4 py-2 rounded text-sm">
-                        <i class="fas fa-plus mr-1"></i>Add to Preset
-                    </button>
-                </div>
+            ${game.installed ? 
+                '<span class="absolute top-2 left-2 bg-green-500 text-white px-2 py-1 rounded text-xs">Installed</span>' :
+                ''}
+            ${isRunning ? 
+                '<span class="absolute top-2 left-24 bg-blue-500 text-white px-2 py-1 rounded text-xs">Running</span>' :
+                ''}
+        </div>
+        <div class="p-4">
+            <h3 class="text-lg font-semibold mb-2">${game.name}</h3>
+            <div class="text-sm text-gray-400">
+                <p class="text-green-400">Idle Hours: ${idleTime}</p>
+                <p class="text-xs mt-2">Game ID: ${game.id}</p>
             </div>
-        `;
-        
-        libraryDiv.appendChild(gameCard);
-    });
+            <div class="mt-4 flex gap-2">
+                ${isRunning ?
+                    `<button onclick="stopGame('${game.id}')" 
+                            class="flex-1 bg-red-500 hover:bg-red-600 px-4 py-2 rounded text-sm">
+                        <i class="fas fa-stop mr-1"></i>Stop
+                    </button>` :
+                    `<button onclick="startGame('${game.id}')" 
+                            class="flex-1 bg-blue-500 hover:bg-blue-600 px-4 py-2 rounded text-sm">
+                        <i class="fas fa-play mr-1"></i>Start
+                    </button>`
+                }
+                <button onclick="addGameToNewPreset('${game.id}')" 
+                        class="flex-1 bg-green-500 hover:bg-green-600 px-4 py-2 rounded text-sm">
+                    <i class="fas fa-plus mr-1"></i>Add to Preset
+                </button>
+            </div>
+        </div>
+    `;
 }
 
 function setViewSize(size) {
@@ -3598,7 +4264,7 @@ function toggleFilter(filter) {
 
 function refreshLibrary() {
     clearLibrarySelection();
-    loadSteamLibrary();
+    loadSteamLibrary(true);
 }
 
 function toggleGameSelection(gameId) {
@@ -3646,10 +4312,10 @@ document.addEventListener('DOMContentLoaded', function() {
     // Library search input
     const librarySearch = document.getElementById('librarySearch');
     if (librarySearch) {
-        librarySearch.addEventListener('input', (e) => {
+        librarySearch.addEventListener('input', debounce((e) => {
             searchQuery = e.target.value;
             updateLibraryDisplay();
-        });
+        }, 150));
     }
     
     // Library modal click outside
@@ -3681,20 +4347,13 @@ let gameSearchTimeout = null;
 document.addEventListener('DOMContentLoaded', async function() {
     // Initialize history and favorites from backend
     try {
-        const [historyResponse, favoritesResponse] = await Promise.all([
-            fetch('/api/game-history'),
-            fetch('/api/game-favorites')
+        const [historyData, favoritesData] = await Promise.all([
+            cachedFetch('/api/game-history'),
+            cachedFetch('/api/game-favorites')
         ]);
         
-        if (historyResponse.ok) {
-            const historyData = await historyResponse.json();
-            gameHistory = historyData.history || [];
-        }
-        
-        if (favoritesResponse.ok) {
-            const favoritesData = await favoritesResponse.json();
-            gameFavorites = favoritesData.favorites || [];
-        }
+        gameHistory = historyData.history || [];
+        gameFavorites = favoritesData.favorites || [];
     } catch (error) {
         console.error('Error loading history/favorites:', error);
         showNotification('Failed to load history and favorites', 'error');
@@ -4074,8 +4733,7 @@ function formatTimeAgo(timestamp) {
 // Add a function to refresh the presets cache
 async function refreshPresetsCache() {
     try {
-        const response = await fetch('/api/get-presets');
-        const presets = await response.json();
+        const presets = await cachedFetch('/api/get-presets');
         presetsCache = presets;
         return presets;
     } catch (error) {
@@ -4104,42 +4762,6 @@ function clearAllGames() {
 
 // ... existing code ...
 
-// Function to update playtimes for running games
-async function updateGamePlaytimes() {
-    for (const gameId of runningGames) {
-        try {
-            const response = await fetch('/api/game-session-time', {
-                method: 'POST',
-                headers: {
-                    'Content-Type': 'application/json'
-                },
-                body: JSON.stringify({ gameId })
-            });
-
-            const data = await response.json();
-            
-            // Update game card playtime
-            const gameCard = document.querySelector(`[data-game-id="${gameId}"]`);
-            if (gameCard) {
-                const playtimeElement = gameCard.querySelector('.playtime-info');
-                if (playtimeElement) {
-                    playtimeElement.innerHTML = `
-                        <div class="text-green-400">Current Session: ${data.current_session}</div>
-                        <div class="text-blue-400">Total Time: ${data.total_time}</div>
-                    `;
-                }
-            }
-        } catch (error) {
-            console.error('Error updating playtime:', error);
-        }
-    }
-}
-
-// Start updating playtimes periodically
-setInterval(updateGamePlaytimes, 1000);
-
-// ... existing code ...
-
 async function importGamesFromFile(file) {
     const loadingOverlay = document.getElementById('gameImportLoadingOverlay');
     loadingOverlay.classList.remove('hidden');
@@ -4162,37 +4784,14 @@ async function importGamesFromFile(file) {
                         gameIds = matches.map(match => match.match(/\d+/)[0]);
                     }
                 } else {
-                    // Parse TXT file - split by newlines and clean up each line
-                    const lines = content.split(/\r?\n/).filter(line => line.trim());
-                    
-                    for (const line of lines) {
-                        const trimmedLine = line.trim();
-                        if (/^\d+$/.test(trimmedLine)) {
-                            // Line contains only numbers - treat as game ID
-                            gameIds.push(trimmedLine);
-                        } else if (trimmedLine) {
-                            // Line contains text - treat as game name
-                            statusText.textContent = `Searching for game: ${trimmedLine}...`;
-                            try {
-                                const searchResponse = await fetch('/api/fetch-game', {
-                                    method: 'POST',
-                                    headers: { 'Content-Type': 'application/json' },
-                                    body: JSON.stringify({ gameId: trimmedLine })
-                                });
-                                
-                                if (searchResponse.ok) {
-                                    const gameInfo = await searchResponse.json();
-                                    if (gameInfo && gameInfo.id) {
-                                        gameIds.push(gameInfo.id.toString());
-                                    }
-                                }
-                                // Add delay between searches
-                                await new Promise(resolve => setTimeout(resolve, 500));
-                            } catch (error) {
-                                console.warn(`Could not find game: ${trimmedLine}`, error);
-                            }
-                        }
+                    // Parse TXT file - one game ID or name per line, names are resolved in one request
+                    const lines = content.split(/\r?\n/).map(line => line.trim()).filter(Boolean);
+                    const names = lines.filter(line => !/^\d+$/.test(line));
+                    if (names.length > 0) {
+                        statusText.textContent = `Searching for ${names.length} game name(s)...`;
                     }
+                    const resolvedIds = await resolveGameNames(names);
+                    gameIds = lines.map(line => /^\d+$/.test(line) ? line : resolvedIds[line]).filter(Boolean);
                 }
                 
                 if (gameIds.length === 0) {
@@ -4542,19 +5141,13 @@ async function stopAllGamesSequentially() {
     stopButton.innerHTML = '<i class="fas fa-spinner fa-spin mr-2"></i>Stopping Games...';
 
     try {
-        for (let i = 0; i < runningGameIds.length; i++) {
-            const gameId = runningGameIds[i];
-            await stopGame(gameId);
-            
-            // Show progress in the button text
-            const remainingGames = runningGameIds.length - (i + 1);
-            stopButton.innerHTML = `<i class="fas fa-spinner fa-spin mr-2"></i>Stopping Games (${remainingGames} remaining)`;
-            
-            // Add a small delay between stopping each game
-            await new Promise(resolve => setTimeout(resolve, 1000));
-        }
+        const data = await stopGames(runningGameIds);
 
-        showNotification('All games have been stopped successfully', 'success');
+        if (data.failed.length > 0) {
+            showNotification(data.message, 'warning');
+        } else {
+            showNotification('All games have been stopped successfully', 'success');
+        }
     } catch (error) {
         console.error('Error stopping games:', error);
         showNotification('Failed to stop all games', 'error');
@@ -4596,22 +5189,18 @@ async function toggleAllHistoryGames() {
     const allRunning = gameHistory.every(game => runningGames.has(game.id.toString()));
     const button = document.getElementById('historyStartStopAllBtn');
     
-    if (allRunning) {
-        // Stop all running games
-        for (const game of gameHistory) {
-            if (runningGames.has(game.id.toString())) {
-                await stopGame(game.id);
-                showNotification(`Stopping ${game.name}`, 'info');
-            }
-        }
-    } else {
-        // Start all games that aren't running
-        for (const game of gameHistory) {
-            if (!runningGames.has(game.id.toString())) {
-                await startGame(game.id);
-                showNotification(`Starting ${game.name}`, 'info');
-            }
+    try {
+        if (allRunning) {
+            // Stop all running games
+            const data = await stopGames(gameHistory.map(game => game.id));
+            showNotification(data.message, data.failed.length > 0 ? 'warning' : 'info');
+        } else {
+            // Start all games that aren't running
+            const data = await startGames(gameHistory.filter(game => !runningGames.has(game.id.toString())).map(game => game.id));
+            showNotification(data.message, data.status === 'success' ? 'info' : 'warning');
         }
+    } catch (error) {
+        console.error('Error toggling games:', error);
     }
     
     // Update the button state
@@ -4627,22 +5216,18 @@ async function toggleAllFavoriteGames() {
     const allRunning = gameFavorites.every(game => runningGames.has(game.id.toString()));
     const button = document.getElementById('favoritesStartStopAllBtn');
     
-    if (allRunning) {
-        // Stop all running games
-        for (const game of gameFavorites) {
-            if (runningGames.has(game.id.toString())) {
-                await stopGame(game.id);
-                showNotification(`Stopping ${game.name}`, 'info');
-            }
-        }
-    } else {
-        // Start all games that aren't running
-        for (const game of gameFavorites) {
-            if (!runningGames.has(game.id.toString())) {
-                await startGame(game.id);
-                showNotification(`Starting ${game.name}`, 'info');
-            }
+    try {
+        if (allRunning) {
+            // Stop all running games
+            const data = await stopGames(gameFavorites.map(game => game.id));
+            showNotification(data.message, data.failed.length > 0 ? 'warning' : 'info');
+        } else {
+            // Start all games that aren't running
+            const data = await startGames(gameFavorites.filter(game => !runningGames.has(game.id.toString())).map(game => game.id));
+            showNotification(data.message, data.status === 'success' ? 'info' : 'warning');
         }
+    } catch (error) {
+        console.error('Error toggling games:', error);
     }
     
     // Update the button state
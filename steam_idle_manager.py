@@ -1,50 +1,156 @@
 import os
 import sys
 import json
-import subprocess
 import webview
 import requests
 import psutil
-import winreg
-import socket
-from flask import Flask, render_template, request, jsonify, send_file
+from flask import Flask, render_template, request, jsonify, send_file, send_from_directory, url_for
+from flask.json.provider import DefaultJSONProvider
 from bs4 import BeautifulSoup
 from datetime import datetime, timedelta
 import pystray
 from PIL import Image
 import threading
+import functools
+from collections import namedtuple
+from contextlib import contextmanager
+from types import MappingProxyType
 from pypresence import Presence
 import time
-import asyncio
-import nest_asyncio
 import csv
 import re
-import win32gui
-import win32con
-import win32process
-
-# Try to patch asyncio to allow nested event loops
-try:
-    nest_asyncio.apply()
-except Exception:
-    pass
+import heapq
+import zlib
+import math
+import bisect
+import base64
+from array import array
+from urllib.parse import urlsplit
+import difflib
+import random
+import queue
+from concurrent.futures import ThreadPoolExecutor, wait
+import vdf_parser
+import backends
+import metrics
+import profiler
 
 # Initialize Flask app
 app = Flask(__name__)
 
+# Processes, windows, registry and folder notifications, the fake backend runs headless anywhere
+backend = backends.get_backend()
+
+# Instrumentation served at /metrics
+registry = metrics.Registry()
+http_requests = registry.counter('steamidle_http_requests_total', "Requests served per route",
+                                 ('route', 'method', 'status'))
+http_request_seconds = registry.histogram('steamidle_http_request_duration_seconds', "Request latency per route",
+                                          ('route', 'method'))
+loop_runs = registry.counter('steamidle_loop_runs_total', "Background loop runs", ('loop',))
+loop_errors = registry.counter('steamidle_loop_errors_total', "Background loop runs that raised", ('loop',))
+loop_seconds = registry.histogram('steamidle_loop_duration_seconds', "Background loop run time", ('loop',))
+loop_lag_seconds = registry.histogram('steamidle_loop_lag_seconds',
+                                      "Delay between when a loop was due and when it started", ('loop',))
+file_reads = registry.counter('steamidle_file_reads_total', "JSON files read", ('file',))
+file_read_bytes = registry.counter('steamidle_file_read_bytes_total', "Bytes of JSON files read", ('file',))
+file_writes = registry.counter('steamidle_file_writes_total', "JSON files written", ('file',))
+file_write_bytes = registry.counter('steamidle_file_write_bytes_total', "Bytes of JSON files written", ('file',))
+outbound_seconds = registry.histogram('steamidle_outbound_request_duration_seconds',
+                                      "Outbound HTTP request latency per host", ('host',))
+outbound_errors = registry.counter('steamidle_outbound_request_errors_total',
+                                   "Outbound HTTP requests that failed to complete", ('host',))
+idler_terminations = registry.counter('steamidle_idler_terminations_total',
+                                     "Idlers stopped, by whether they exited, needed a kill or survived", ('outcome',))
+process_scan_seconds = registry.histogram('steamidle_process_scan_duration_seconds',
+                                          "Time spent walking the process list", ('scan',))
+registry.gauge('steamidle_idlers_running', "Idlers currently tracked as running",
+               function=lambda: len(game_state.snapshot().running_games))
+registry.gauge('steamidle_start_time_seconds', "Unix time the manager started",
+               function=lambda: START_TIME)
+START_TIME = time.time()
+
+def json_file_label(path):
+    """Metric label for a data file, presets are grouped so the label set stays small"""
+    directory, name = os.path.split(path)
+    if os.path.normcase(directory) == os.path.normcase(PRESETS_DIR) and name != 'goals.json':
+        return 'presets/*.json'
+    return name
+
+# Per-request time split into phases, sent back as Server-Timing headers
+request_phases = profiler.PhaseTimer()
+
+def read_json(f):
+    """json.load that is counted in the file metrics"""
+    with request_phases.phase('disk'):
+        text = f.read()
+    with request_phases.phase('serialise'):
+        data = json.loads(text)
+    label = json_file_label(f.name)
+    file_reads.inc(file=label)
+    try:
+        file_read_bytes.inc(os.fstat(f.fileno()).st_size, file=label)
+    except (OSError, AttributeError):
+        pass
+    return data
+
+def write_json(data, f, **kwargs):
+    """json.dump that is counted in the file metrics"""
+    with request_phases.phase('serialise'):
+        text = json.dumps(data, **kwargs)
+    with request_phases.phase('disk'):
+        f.write(text)
+    label = json_file_label(f.name)
+    file_writes.inc(file=label)
+    file_write_bytes.inc(len(text), file=label)
+
+class InstrumentedSession(requests.Session):
+    """Session that records the latency and failures of every outbound request per host"""
+
+    def request(self, method, url, *args, **kwargs):
+        host = urlsplit(url).hostname or 'unknown'
+        start = time.perf_counter()
+        try:
+            with request_phases.phase('network'):
+                return super().request(method, url, *args, **kwargs)
+        except requests.RequestException:
+            outbound_errors.inc(host=host)
+            raise
+        finally:
+            outbound_seconds.observe(time.perf_counter() - start, host=host)
+
+http = InstrumentedSession()
+
+@contextmanager
+def process_scan(scan):
+    """Time a walk over processes for /metrics and the request's Server-Timing"""
+    with request_phases.phase('process'), process_scan_seconds.time(scan=scan):
+        yield
+
+class TimedJSONProvider(DefaultJSONProvider):
+    """Charges jsonify to the serialise phase"""
+
+    def dumps(self, obj, **kwargs):
+        with request_phases.phase('serialise'):
+            return super().dumps(obj, **kwargs)
+
+app.json = TimedJSONProvider(app)
+
 # Global variables
 icon = None
-IDLER_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "steam-idle.exe")
+window = None
+IDLER_PATH = backend.default_idler_path()
 minimize_to_tray = False
 AUTO_RECONNECT = False
-DISCORD_RPC = None
 DISCORD_RPC_ENABLED = True  # Default enabled
+GUARDRAILS = None  # Resource guardrail policy, set from settings by load_settings()
+DUTY_CYCLE = None  # Duty cycle policy, set from settings by load_settings()
 
 # Discord RPC Client ID
 DISCORD_CLIENT_ID = '1341211129153716316'
 
 # Set up AppData paths
-APPDATA_PATH = os.path.join(os.getenv('APPDATA'), 'SteamIdler')
+APPDATA_PATH = os.path.join(backend.appdata_dir(), 'SteamIdler')
 PRESETS_DIR = os.path.join(APPDATA_PATH, "presets")
 STATS_FILE = os.path.join(APPDATA_PATH, "stats.json")
 SETTINGS_FILE = os.path.join(APPDATA_PATH, "settings.json")
@@ -61,135 +167,638 @@ RECONNECT_INTERVAL = 300  # 5 minutes in seconds
 HISTORY_FILE = os.path.join(APPDATA_PATH, "game_history.json")
 GAME_FAVORITES_FILE = os.path.join(APPDATA_PATH, "game_favorites.json")
 
+# Library rotation constants
+ROTATION_FILE = os.path.join(APPDATA_PATH, "rotation.json")
+MAX_IDLE_SLOTS = 32  # Steam only counts playtime for 32 games at once
+DEFAULT_ROTATION_SLICE_MINUTES = 120
+ROTATION_CHECKPOINT_INTERVAL = 300  # Persist rotation progress at least every 5 minutes
+ROTATION_RETRY_INTERVAL = 60  # Retry filling slots every minute while Steam is unavailable
+
+# Scheduled preset launches
+SCHEDULES_FILE = os.path.join(APPDATA_PATH, "schedules.json")
+
+# Installed apps index built from appmanifest files
+MANIFEST_INDEX_FILE = os.path.join(APPDATA_PATH, "manifest_index.json")
+MANIFEST_REFRESH_INTERVAL = 600  # Fallback rescan when no folder change was signalled
+
+# Offline appid <-> name catalog
+CATALOG_FILE = os.path.join(APPDATA_PATH, "app_catalog.json")
+CATALOG_URL = "https://api.steampowered.com/ISteamApps/GetAppList/v2/"
+CATALOG_MAX_AGE = 7 * 24 * 3600  # Re-download the bulk app list weekly
+CATALOG_CHECK_INTERVAL = 3600
+CATALOG_RETRY_INTERVAL = 60  # First retry after a failed download, doubled per failure
+CATALOG_RETRY_MAX = 3600
+CATALOG_MATCH_THRESHOLD = 0.75  # Lower scoring names fall back to the store search
+CATALOG_RESOLVE_WORKERS = 8  # Store searches run at once by batch resolves, shared by all requests
+STORE_SEARCH_TIMEOUT = 10
+CATALOG_RESOLVE_DEADLINE = 15  # Seconds a batch resolve waits on the store before using the catalog
+
+# Offline operation, network reads are served from these caches while Steam's web services are unreachable
+GAME_METADATA_FILE = os.path.join(APPDATA_PATH, "game_metadata.json")
+LIBRARY_CACHE_FILE = os.path.join(APPDATA_PATH, "library_cache.json")
+CONNECTIVITY_URL = "https://steamcommunity.com/"
+CONNECTIVITY_INTERVAL = 60
+CONNECTIVITY_RETRY_INTERVAL = 10  # Probe more often while offline so we notice the network coming back
+CONNECTIVITY_TIMEOUT = 5
+
+# Sampling profiler, toggled with the profiler_enabled setting, writes collapsed stacks for flamegraphs
+PROFILES_DIR = os.path.join(APPDATA_PATH, "profiles")
+PROFILER_INTERVAL = 0.01  # 100 samples per second
+
+# Idler lifecycle event log (spawn, running, stopped, crashed, restart), rotated by size
+LIFECYCLE_LOG_FILE = os.path.join(APPDATA_PATH, "idler_lifecycle.jsonl")
+RUNNING_STATE_FILE = os.path.join(APPDATA_PATH, "running_state.json")  # Idlers to adopt after a restart
+LIFECYCLE_LOG_MAX_BYTES = 1024 * 1024
+LIFECYCLE_LOG_BACKUPS = 3
+LIFECYCLE_CHECK_INTERVAL = 10  # Liveness check of the tracked idlers
+LIFECYCLE_FAST_INTERVAL = 1  # While launches wait to be confirmed or exits to be collected
+LIFECYCLE_EXIT_TIMEOUT = 10  # Give up waiting for an exit code after this many seconds
+IDLER_SPAWN_WORKERS = 8  # Idlers started at once by a batch start
+IDLER_TERMINATE_TIMEOUT = 3  # Seconds idlers get to exit after terminate() before they are killed
+IDLER_KILL_TIMEOUT = 2  # Seconds to wait for killed idlers
+
+# Per-idler CPU/memory sampling, RESOURCE_HISTORY_SIZE samples are kept per game
+RESOURCE_SAMPLE_INTERVAL = 5
+RESOURCE_HISTORY_SIZE = 360  # 30 minutes at one sample every 5 seconds
+
+# Resource guardrails, the policy lives in settings.json under "guardrails"
+DEFAULT_GUARDRAILS = {
+    "enabled": False,
+    "max_rss_mb": 512,  # Recycle an idler using more memory than this, 0 disables
+    "growth_mb": 64,  # Recycle an idler whose memory grew steadily by this much...
+    "growth_minutes": 15,  # ...over this many minutes (at most the 30 minutes of history)
+    "max_cpu_percent": 25,  # Idlers sit near 0%, act on one above this...
+    "cpu_minutes": 2,  # ...for this many minutes
+    "cpu_action": "throttle",  # "throttle" drops its priority to idle, "restart" recycles it
+    "max_total_rss_mb": 0  # Stop games, lowest priority first, while all idlers use more, 0 disables
+}
+GUARDRAIL_MAX_MINUTES = RESOURCE_HISTORY_SIZE * RESOURCE_SAMPLE_INTERVAL // 60  # Longest window the history covers
+GUARDRAIL_COOLDOWN = 300  # Leave a recycled game alone for this many seconds
+GUARDRAIL_STEADY_FRACTION = 0.9  # Share of samples that must not shrink for growth to count as steady
+
+# Launch profiles: priority, CPU affinity and I/O priority of the idlers. The global profile lives in
+# settings.json under "launch_profile", per preset overrides in LAUNCH_PROFILES_FILE
+LAUNCH_PROFILES_FILE = os.path.join(APPDATA_PATH, "launch_profiles.json")
+DEFAULT_LAUNCH_PROFILE = {
+    "priority": "normal",  # normal, below_normal or idle
+    "affinity": None,  # List of CPU indexes, None for all
+    "io_priority": None  # normal, low or very_low, None leaves it alone
+}
+LAUNCH_PROFILE = dict(DEFAULT_LAUNCH_PROFILE)  # Global launch profile, set from settings by load_settings()
+
+# Duty cycle: idlers stay suspended except for a staggered active window every period,
+# the policy lives in settings.json under "duty_cycle"
+DEFAULT_DUTY_CYCLE = {
+    "enabled": False,
+    "period_seconds": 300,
+    "active_seconds": 30
+}
+DUTY_CYCLE_MIN_ACTIVE = 5  # Shorter windows risk Steam not seeing the idler at all
+
 # Create necessary directories if they don't exist
 if not os.path.exists(APPDATA_PATH):
     os.makedirs(APPDATA_PATH)
 if not os.path.exists(PRESETS_DIR):
     os.makedirs(PRESETS_DIR)
 
-running_games = {}
-game_sessions = {}  # Store game session data: {game_id: {'start_time': datetime, 'total_time': seconds}}
-
-def initialize_discord_rpc():
-    global DISCORD_RPC
-    try:
-        if DISCORD_RPC:
+StateSnapshot = namedtuple('StateSnapshot', ['version', 'running_games', 'game_sessions'])
+
+class GameState:
+    """Owns the running games ({game_id: pid}) and game sessions
+    ({game_id: {'start_time': datetime, 'total_time': seconds, 'name', 'image'}}).
+    A suspended idler's session also has 'suspended_since' (datetime), and 'suspended_time'
+    sums the seconds spent suspended; they are part of total_time, Steam keeps counting them.
+
+    Every change happens under the lock and then publishes a new read-only snapshot.
+    Readers (stats, tray, Discord RPC, exports) call snapshot() and work on that without
+    locking, so they never see a dict change size under them. Sessions that didn't change
+    are shared between snapshots, which keeps publishing cheap for large libraries.
+    """
+
+    def __init__(self):
+        self.lock = threading.RLock()
+        self.running_games = {}
+        self.game_sessions = {}
+        self.version = 0
+        self._depth = 0
+        self._dirty = set()
+        self._dirty_all = False
+        self._frozen_sessions = {}
+        self._snapshot = StateSnapshot(0, MappingProxyType({}), MappingProxyType({}))
+        self._listeners = []
+
+    def snapshot(self):
+        """Get the latest published state, safe to read from any thread"""
+        return self._snapshot
+
+    def subscribe(self, callback):
+        """Call `callback` after every published change, it runs under the lock and must not block"""
+        self._listeners.append(callback)
+
+    @contextmanager
+    def mutate(self, *game_ids):
+        """Lock the maps for a change to the given games (all games when none are given),
+        a single snapshot is published when the outermost change is done"""
+        with self.lock:
+            self._depth += 1
             try:
-                DISCORD_RPC.close()
-            except:
-                pass
-        DISCORD_RPC = Presence(DISCORD_CLIENT_ID)
-        DISCORD_RPC.connect()
-        update_discord_rpc()
-    except Exception as e:
-        print(f"Failed to initialize Discord RPC: {e}")
-        DISCORD_RPC = None
-
-def update_discord_rpc():
-    """Update Discord Rich Presence status"""
-    global DISCORD_RPC
-    
-    if not DISCORD_RPC_ENABLED:
-        return
-        
-    try:
-        if not DISCORD_RPC:
-            initialize_discord_rpc()
-            if not DISCORD_RPC:  # If initialization failed
+                yield self.running_games, self.game_sessions
+            finally:
+                if game_ids:
+                    self._dirty.update(game_ids)
+                else:
+                    self._dirty_all = True
+                self._depth -= 1
+                if self._depth == 0:
+                    self._publish()
+
+    def _publish(self):
+        if self._dirty_all:
+            self._frozen_sessions = {}
+            self._dirty = set(self.game_sessions)
+        frozen = dict(self._frozen_sessions)
+        for game_id in self._dirty:
+            if game_id in self.game_sessions:
+                frozen[game_id] = MappingProxyType(dict(self.game_sessions[game_id]))
+            else:
+                frozen.pop(game_id, None)
+        self._dirty = set()
+        self._dirty_all = False
+        self._frozen_sessions = frozen
+        self.version += 1
+        self._snapshot = StateSnapshot(
+            self.version, MappingProxyType(dict(self.running_games)), MappingProxyType(frozen))
+        for callback in self._listeners:
+            callback()
+
+    def load_sessions(self, sessions):
+        with self.mutate() as (running_games, game_sessions):
+            game_sessions.clear()
+            game_sessions.update(sessions)
+
+    def reset_sessions(self):
+        with self.mutate() as (running_games, game_sessions):
+            game_sessions.clear()
+
+    def start_session(self, game_id, pid, name=None, image=None, start_time=None):
+        """Track a running idler and open its session"""
+        with self.mutate(game_id) as (running_games, game_sessions):
+            running_games[game_id] = pid
+            if game_id not in game_sessions:
+                game_sessions[game_id] = {
+                    'total_time': 0,
+                    'name': name or f'Game {game_id}',
+                    'image': image or ''
+                }
+            game_sessions[game_id]['start_time'] = start_time or datetime.now()
+            game_sessions[game_id].pop('suspended_since', None)
+
+    def end_session(self, game_id, end_time=None):
+        """Stop tracking an idler and add its current session to the total playtime.
+        Returns the idler's PID, or None if it wasn't tracked"""
+        with self.mutate(game_id) as (running_games, game_sessions):
+            pid = running_games.pop(game_id, None)
+            session = game_sessions.get(game_id)
+            if session and 'start_time' in session:
+                session_duration = ((end_time or datetime.now()) - session['start_time']).total_seconds()
+                session['total_time'] = session.get('total_time', 0) + session_duration
+                session.pop('start_time', None)
+            if session:
+                self._close_suspension(session, end_time)
+            return pid
+
+    @staticmethod
+    def _close_suspension(session, end_time=None):
+        since = session.pop('suspended_since', None)
+        if since is not None:
+            suspended = ((end_time or datetime.now()) - since).total_seconds()
+            session['suspended_time'] = session.get('suspended_time', 0) + max(0.0, suspended)
+
+    def set_suspended(self, game_id, suspended, when=None):
+        """Open or close a suspended interval of a running idler's session"""
+        with self.mutate(game_id) as (running_games, game_sessions):
+            session = game_sessions.get(game_id)
+            if session is None or game_id not in running_games:
                 return
+            if suspended:
+                session.setdefault('suspended_since', when or datetime.now())
+            else:
+                self._close_suspension(session, when)
+
+    def drop_running(self, game_id):
+        """Stop tracking an idler whose process is gone, leaving its session as is"""
+        with self.mutate(game_id) as (running_games, game_sessions):
+            return running_games.pop(game_id, None)
 
-        # Get total playtime and running games
-        total_playtime = 0
-        current_session_playtime = 0
-        first_start_time = None
-        running_game_names = []
+    def set_pid(self, game_id, pid):
+        with self.mutate(game_id) as (running_games, game_sessions):
+            running_games[game_id] = pid
 
-        # Calculate total playtime only for running games
-        for game_id in running_games.keys():
+    def set_info(self, game_id, name, image):
+        """Update the name and image of an existing session"""
+        with self.mutate(game_id) as (running_games, game_sessions):
             if game_id in game_sessions:
-                session = game_sessions[game_id]
-                # Add completed session time for this game
-                total_playtime += session.get('total_time', 0)
-                
-                # Add current session time
-                if 'start_time' in session:
-                    current_session = (datetime.now() - session['start_time']).total_seconds()
-                    current_session_playtime += current_session
-                    total_playtime += current_session
-                    if not first_start_time or session['start_time'] < first_start_time:
-                        first_start_time = session['start_time']
-                    running_game_names.append(session.get('name', f'Game {game_id}'))
-
-        # Set the status based on whether games are running
-        if running_game_names:
-            details = f"🎮 Idling {len(running_game_names)} games"
-            state = f"🕒 Session: {format_duration(int(current_session_playtime))} 📅 Total: {format_duration(int(total_playtime))}"
+                game_sessions[game_id]['name'] = name
+                game_sessions[game_id]['image'] = image
+
+game_state = GameState()
+
+def get_running_games():
+    """Read-only view of {game_id: pid} for the running idlers"""
+    return game_state.snapshot().running_games
+
+class Runtime:
+    """Runs every background job of the app from one scheduler thread.
+
+    Jobs are kept in a heap by due time and the scheduler sleeps until the earliest one,
+    then hands it to a pool of worker threads. A job never runs twice at once, so the pool
+    grows to one worker per registered job and a slow job (a Steam download, a launch batch
+    or a stop waiting on kill()) never delays a timing sensitive one like the duty cycle or
+    the resource sampler. Jobs due within `slack` seconds of each other
+    share a wakeup. The next run is planned from when a job finishes, so ticks missed while
+    the machine slept or a job overran are coalesced into a single run. A job may return a
+    number of seconds to override its next delay; jobs without an interval only run when
+    triggered or when they ask for a delay.
+    """
+
+    def __init__(self, slack=1.0):
+        self.jobs = {}
+        self.heap = []
+        self.counter = 0
+        self.slack = slack
+        self.workers = 0
+        self.lock = threading.Lock()
+        self.wakeup = threading.Event()
+        self.work_queue = queue.Queue()
+        self.started = False
+
+    def add_job(self, name, func, interval=None, jitter=0, run_at_start=True):
+        with self.lock:
+            self.jobs[name] = {
+                "name": name,
+                "func": func,
+                "interval": interval,
+                "jitter": jitter,
+                "next_run": None,
+                "running": False,
+                "pending": False,
+                "runs": 0,
+                "last_run": None,
+                "last_duration": 0,
+                "due": None
+            }
+            if interval is not None and run_at_start:
+                self._schedule(self.jobs[name], time.monotonic())
+            if self.started:
+                self._add_workers()
+        self.wakeup.set()
+
+    def _add_workers(self):
+        while self.workers < len(self.jobs):
+            worker = threading.Thread(target=self._worker, name=f"runtime-worker-{self.workers}")
+            worker.daemon = True
+            worker.start()
+            self.workers += 1
+
+    def _schedule(self, job, when):
+        self.counter += 1
+        job['next_run'] = when
+        heapq.heappush(self.heap, (when, self.counter, job['name']))
+
+    def trigger(self, name):
+        """Run a job as soon as possible, or once more right after its current run"""
+        with self.lock:
+            job = self.jobs.get(name)
+            if not job:
+                return
+            if job['running']:
+                job['pending'] = True
+            else:
+                self._schedule(job, time.monotonic())
+        self.wakeup.set()
+
+    def start(self):
+        if self.started:
+            return
+        self.started = True
+        with self.lock:
+            self._add_workers()
+        scheduler = threading.Thread(target=self._scheduler, name="runtime-scheduler")
+        scheduler.daemon = True
+        scheduler.start()
+
+    def _scheduler(self):
+        while True:
+            self.wakeup.clear()
+            with self.lock:
+                now = time.monotonic()
+                timeout = None
+                while self.heap:
+                    when, _, name = self.heap[0]
+                    job = self.jobs[name]
+                    if job['next_run'] != when:
+                        # Superseded by a later trigger or reschedule
+                        heapq.heappop(self.heap)
+                        continue
+                    if when > now + self.slack:
+                        timeout = when - now
+                        break
+                    heapq.heappop(self.heap)
+                    job['next_run'] = None
+                    if job['running']:
+                        job['pending'] = True
+                        continue
+                    job['running'] = True
+                    job['due'] = when
+                    self.work_queue.put(job)
+            self.wakeup.wait(timeout)
+
+    def _worker(self):
+        while True:
+            job = self.work_queue.get()
+            started = time.monotonic()
+            loop_lag_seconds.observe(max(0.0, started - job['due']), loop=job['name'])
+            result = None
             try:
-                DISCORD_RPC.update(
-                    large_image="Logo1",
-                    large_text="Steam Idle Manager",
-                    small_image="orange",  # Show orange status when games are running
-                    small_text=f"🎮 Idling {len(running_game_names)}",
-                    details=details,
-                    state=state,
-                    start=int(first_start_time.timestamp()) if first_start_time else None
-                )
+                result = job['func']()
             except Exception as e:
-                if "pipe" in str(e).lower() or "client" in str(e).lower():
-                    DISCORD_RPC = None
-                    time.sleep(1)
-                    initialize_discord_rpc()
-        else:
-            # Check Steam status when no games are running
-            steam_status = check_steam_status()
-            status_text = "🚫 Steam is not running"
-            small_image = "offline"
-            details = "🚫 Not ready to idle"  # Default to not ready
-            
-            if steam_status["running"]:
-                if steam_status["online"]:
-                    status_text = "🌐 Steam is online"
-                    small_image = "online"
-                    details = "✅ Ready to idle"  # Only ready when Steam is online
+                loop_errors.inc(loop=job['name'])
+                print(f"Error in background job {job['name']}: {e}")
+            loop_runs.inc(loop=job['name'])
+            loop_seconds.observe(time.monotonic() - started, loop=job['name'])
+            with self.lock:
+                job['running'] = False
+                job['runs'] += 1
+                job['last_run'] = datetime.now()
+                job['last_duration'] = time.monotonic() - started
+                if job['pending']:
+                    job['pending'] = False
+                    delay = 0
+                elif isinstance(result, (int, float)) and not isinstance(result, bool):
+                    delay = result
                 else:
-                    status_text = "📴 Steam is offline"
-                    small_image = "offline"
-            
+                    delay = job['interval']
+                if delay is not None:
+                    if delay and job['jitter']:
+                        delay += random.uniform(0, job['jitter'])
+                    self._schedule(job, time.monotonic() + delay)
+            self.wakeup.set()
+
+runtime = Runtime()
+
+def build_discord_payload():
+    """Build the Rich Presence fields from the current state, without any network calls"""
+    snapshot = game_state.snapshot()
+    total_playtime = 0
+    current_session_playtime = 0
+    first_start_time = None
+    running_game_names = []
+    now = datetime.now()
+
+    # Calculate total playtime only for running games
+    for game_id in snapshot.running_games:
+        session = snapshot.game_sessions.get(game_id)
+        if session:
+            # Add completed session time for this game
+            total_playtime += session.get('total_time', 0)
+
+            # Add current session time
+            if 'start_time' in session:
+                current_session = (now - session['start_time']).total_seconds()
+                current_session_playtime += current_session
+                total_playtime += current_session
+                if not first_start_time or session['start_time'] < first_start_time:
+                    first_start_time = session['start_time']
+                running_game_names.append(session.get('name', f'Game {game_id}'))
+
+    if running_game_names:
+        # Durations are shown to the minute, Discord counts the seconds itself from `start`
+        return {
+            "large_image": "Logo1",
+            "large_text": "Steam Idle Manager",
+            "small_image": "orange",  # Show orange status when games are running
+            "small_text": f"🎮 Idling {len(running_game_names)}",
+            "details": f"🎮 Idling {len(running_game_names)} games",
+            "state": f"🕒 Session: {format_duration_short(current_session_playtime)} 📅 Total: {format_duration_short(total_playtime)}",
+            "start": int(first_start_time.timestamp()) if first_start_time else None
+        }
+
+    # Use the last known Steam status instead of probing steamcommunity.com again
+    status_text = "🚫 Steam is not running"
+    small_image = "offline"
+    details = "🚫 Not ready to idle"  # Default to not ready
+    if is_steam_running():
+        if last_steam_status and last_steam_status["online"]:
+            status_text = "🌐 Steam is online"
+            small_image = "online"
+            details = "✅ Ready to idle"  # Only ready when Steam is online
+        else:
+            status_text = "📴 Steam is offline"
+
+    return {
+        "large_image": "Logo1",
+        "large_text": "Steam Idle Manager",
+        "small_image": small_image,
+        "small_text": status_text,
+        "details": details,
+        "state": f"📝 {status_text}"
+    }
+
+class DiscordPresencePublisher:
+    """Publishes Discord Rich Presence from its own thread.
+
+    The thread wakes when the game state or settings change (and once a minute to refresh
+    the playtimes), builds the payload and only sends it if it differs from the last one,
+    never faster than Discord's update rate limit. pypresence is only ever used from this
+    thread, and a lost connection is retried with exponential backoff, so callers never
+    block on the Discord pipe.
+    """
+
+    MIN_UPDATE_INTERVAL = 15  # Discord only accepts one presence update every 15 seconds
+    REFRESH_INTERVAL = 60
+    MAX_BACKOFF = 300
+
+    def __init__(self, client_id):
+        self.client_id = client_id
+        self.client = None
+        self.last_payload = None
+        self.last_sent = 0
+        self.backoff = 0
+        self.retry_at = 0
+        self.wakeup = threading.Event()
+        self.started = False
+
+    def start(self):
+        if self.started:
+            return
+        self.started = True
+        thread = threading.Thread(target=self._run, name="discord-rpc")
+        thread.daemon = True
+        thread.start()
+
+    def wake(self):
+        """Ask the publisher to check for changes, never blocks"""
+        self.wakeup.set()
+
+    def _run(self):
+        timeout = None
+        while True:
+            due = time.monotonic() + timeout if timeout is not None else None
+            woken = self.wakeup.wait(timeout)
+            self.wakeup.clear()
+            started = time.monotonic()
+            if not woken and due is not None:
+                loop_lag_seconds.observe(max(0.0, started - due), loop='discord_rpc')
             try:
-                DISCORD_RPC.update(
-                    large_image="Logo1",
-                    large_text="Steam Idle Manager",
-                    small_image=small_image,
-                    small_text=status_text,
-                    details=details,
-                    state=f"📝 {status_text}"
-                )
+                timeout = self._publish()
             except Exception as e:
-                if "pipe" in str(e).lower() or "client" in str(e).lower():
-                    DISCORD_RPC = None
-                    time.sleep(1)
-                    initialize_discord_rpc()
-    except Exception as e:
-        print(f"Failed to update Discord RPC: {e}")
-        if "pipe" in str(e).lower() or "client" in str(e).lower():
-            DISCORD_RPC = None
-            time.sleep(1)
-            initialize_discord_rpc()
-
-def discord_rpc_thread():
-    """Thread to update Discord Rich Presence status"""
-    while True:
+                loop_errors.inc(loop='discord_rpc')
+                print(f"Error in Discord RPC publisher: {e}")
+                timeout = self.REFRESH_INTERVAL
+            loop_runs.inc(loop='discord_rpc')
+            loop_seconds.observe(time.monotonic() - started, loop='discord_rpc')
+
+    def _disconnect(self):
+        if self.client:
+            try:
+                self.client.close()
+            except:
+                pass
+        self.client = None
+        self.last_payload = None
+
+    def _fail(self, error):
+        """Drop the connection and wait longer before every new attempt"""
+        print(f"Discord RPC error: {error}")
+        self._disconnect()
+        self.backoff = min(self.MAX_BACKOFF, max(1, self.backoff * 2))
+        self.retry_at = time.monotonic() + self.backoff
+        return self.backoff
+
+    def _publish(self):
+        """Send the presence if it changed, returns how long to sleep"""
+        if not DISCORD_RPC_ENABLED:
+            self._disconnect()
+            return None
+
+        now = time.monotonic()
+        if now < self.retry_at:
+            return self.retry_at - now
+
+        if self.client is None:
+            try:
+                self.client = Presence(self.client_id)
+                self.client.connect()
+            except Exception as e:
+                return self._fail(e)
+
+        payload = build_discord_payload()
+        if payload == self.last_payload:
+            return self.REFRESH_INTERVAL
+
+        wait = self.last_sent + self.MIN_UPDATE_INTERVAL - now
+        if wait > 0:
+            # Coalesce changes until Discord accepts the next update
+            return wait
+
         try:
-            if DISCORD_RPC_ENABLED:
-                update_discord_rpc()
+            self.client.update(**payload)
         except Exception as e:
-            print(f"Error in Discord RPC thread: {e}")
-        time.sleep(15)  # Update every 15 seconds
-
-# Start the Discord RPC thread
-discord_thread = threading.Thread(target=discord_rpc_thread)
-discord_thread.daemon = True
-discord_thread.start()
+            return self._fail(e)
+        # Only a delivered update proves the connection works
+        self.backoff = 0
+        self.last_payload = payload
+        self.last_sent = now
+        return self.REFRESH_INTERVAL
+
+discord_publisher = DiscordPresencePublisher(DISCORD_CLIENT_ID)
+game_state.subscribe(discord_publisher.wake)
+
+sampling_profiler = profiler.SamplingProfiler(PROFILES_DIR, PROFILER_INTERVAL)
+
+def set_profiler_enabled(enabled):
+    """Start or stop the sampling profiler, returns the profile path"""
+    if enabled:
+        path = sampling_profiler.start()
+        print(f"Profiling to {path}")
+        return path
+    path = sampling_profiler.stop()
+    if path:
+        print(f"Profile written to {path}")
+    return path
+
+# Conditional GET support for read-mostly endpoints
+BOOT_ID = format(int(time.time() * 1000), 'x')  # Invalidates client ETags across restarts
+resource_versions = {}
+resource_cache = {}  # resource -> (etag, body bytes)
+resource_lock = threading.Lock()
+
+def bump_resource(*names):
+    """Mark resources as changed so their next GET is served fresh"""
+    with resource_lock:
+        for name in names:
+            resource_versions[name] = resource_versions.get(name, 0) + 1
+            resource_cache.pop(name, None)
+
+def resource_etag(name):
+    return f"{name}-{BOOT_ID}-{resource_versions.get(name, 0)}"
+
+def conditional_get(resource, live=None):
+    """Serve GET requests with a versioned ETag, answering 304 when the client is current.
+    `live` returns the values the view reads from outside the app's files (the registry,
+    running threads), they are hashed into the ETag since no bump_resource() tracks them"""
+    def decorator(view):
+        @functools.wraps(view)
+        def wrapper(*args, **kwargs):
+            if request.method != 'GET':
+                return view(*args, **kwargs)
+
+            version = etag = resource_etag(resource)
+            if live is not None:
+                etag = f"{version}-{zlib.crc32(repr(live()).encode()):08x}"
+            if request.if_none_match.contains(etag):
+                response = app.response_class(status=304)
+            else:
+                cached = resource_cache.get(resource)
+                if cached and cached[0] == etag:
+                    body = cached[1]
+                else:
+                    response = app.make_response(view(*args, **kwargs))
+                    if response.status_code != 200:
+                        return response
+                    body = response.get_data()
+                    with resource_lock:
+                        # Skip caching when the resource changed while the view ran
+                        if resource_etag(resource) == version:
+                            resource_cache[resource] = (etag, body)
+                response = app.response_class(body, mimetype='application/json')
+
+            response.set_etag(etag)
+            response.headers['Cache-Control'] = 'no-cache'
+            return response
+        return wrapper
+    return decorator
+
+# Request metrics, labelled by route pattern so /api/game/<id> stays a single series
+@app.before_request
+def start_request_timer():
+    request_phases.begin()
+
+@app.after_request
+def record_request_metrics(response):
+    timing = request_phases.end()
+    if timing is not None:
+        total, phases = timing
+        route = request.url_rule.rule if request.url_rule else 'unmatched'
+        http_requests.inc(route=route, method=request.method, status=response.status_code)
+        http_request_seconds.observe(total, route=route, method=request.method)
+        response.headers['Server-Timing'] = profiler.server_timing(total, phases)
+    return response
+
+@app.route('/metrics')
+def prometheus_metrics():
+    """Prometheus text exposition of the request, loop, file and process metrics"""
+    return app.response_class(registry.render(), mimetype='text/plain; version=0.0.4')
 
 def resource_path(relative_path):
     """Get absolute path to resource, works for dev and for PyInstaller"""
@@ -205,9 +814,10 @@ def load_settings():
     if os.path.exists(SETTINGS_FILE):
         try:
             with open(SETTINGS_FILE, 'r') as f:
-                settings = json.load(f)
+                settings = read_json(f)
                 # Update IDLER_PATH if it was previously configured
-                global IDLER_PATH, minimize_to_tray, AUTO_RECONNECT, DISCORD_RPC_ENABLED
+                global IDLER_PATH, minimize_to_tray, AUTO_RECONNECT, DISCORD_RPC_ENABLED, GUARDRAILS, LAUNCH_PROFILE
+                global DUTY_CYCLE
                 
                 # First check if there's a valid saved path
                 if 'idler_path' in settings and os.path.exists(settings['idler_path']):
@@ -232,6 +842,18 @@ def load_settings():
                 # Load Discord RPC setting (default to True if not set)
                 DISCORD_RPC_ENABLED = settings.get('discord_rpc_enabled', True)
                 
+                # Load the resource guardrail policy over the defaults
+                GUARDRAILS = dict(DEFAULT_GUARDRAILS, **settings.get('guardrails', {}))
+                settings['guardrails'] = GUARDRAILS
+                
+                # Load the launch profile applied to new and adopted idlers
+                LAUNCH_PROFILE = dict(DEFAULT_LAUNCH_PROFILE, **settings.get('launch_profile', {}))
+                settings['launch_profile'] = LAUNCH_PROFILE
+                
+                # Load the duty cycle policy
+                DUTY_CYCLE = dict(DEFAULT_DUTY_CYCLE, **settings.get('duty_cycle', {}))
+                settings['duty_cycle'] = DUTY_CYCLE
+                
                 # Ensure theme setting exists
                 if 'theme' not in settings:
                     settings['theme'] = 'dark'  # Default theme
@@ -246,7 +868,8 @@ def load_settings():
 def save_settings(settings):
     try:
         with open(SETTINGS_FILE, 'w') as f:
-            json.dump(settings, f)
+            write_json(settings, f)
+        bump_resource('settings')
         return True
     except Exception as e:
         print(f"Error saving settings: {e}")
@@ -302,64 +925,162 @@ def load_statistics():
     if os.path.exists(STATS_FILE):
         try:
             with open(STATS_FILE, 'r') as f:
-                return json.load(f)
+                return read_json(f)
         except:
             return {"game_sessions": {}}
     return {"game_sessions": {}}
 
 def save_statistics():
+    snapshot = game_state.snapshot()
     stats_data = {
         "game_sessions": {
             game_id: {
                 "total_time": session.get('total_time', 0),
+                "suspended_time": session.get('suspended_time', 0),
                 "name": session.get('name', 'Unknown Game'),
                 "image": session.get('image', '')
             }
-            for game_id, session in game_sessions.items()
+            for game_id, session in snapshot.game_sessions.items()
         }
     }
     with open(STATS_FILE, 'w') as f:
-        json.dump(stats_data, f)
+        write_json(stats_data, f)
 
 # Load saved statistics when starting up
 saved_stats = load_statistics()
-game_sessions = {
+game_state.load_sessions({
     game_id: {
         'total_time': data['total_time'],
+        'suspended_time': data.get('suspended_time', 0),
         'name': data['name'],
         'image': data['image']
     }
     for game_id, data in saved_stats['game_sessions'].items()
-}
+})
 
 def get_steam_path():
-    try:
-        # Try to get Steam path from registry
-        hkey = winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, "SOFTWARE\\WOW6432Node\\Valve\\Steam")
-        steam_path = winreg.QueryValueEx(hkey, "InstallPath")[0]
-        winreg.CloseKey(hkey)
+    # Try to get Steam path from registry
+    steam_path = backend.steam_install_path()
+    if steam_path:
         return steam_path
-    except:
-        # Default Steam paths if registry fails
-        default_paths = [
-            "C:\\Program Files (x86)\\Steam",
-            "C:\\Program Files\\Steam",
-        ]
-        for path in default_paths:
-            if os.path.exists(path):
-                return path
+    # Default Steam paths if registry fails
+    default_paths = [
+        "C:\\Program Files (x86)\\Steam",
+        "C:\\Program Files\\Steam",
+    ]
+    for path in default_paths:
+        if os.path.exists(path):
+            return path
     return None
 
 def is_steam_running():
-    for proc in psutil.process_iter(['name']):
-        try:
-            if proc.name().lower() == 'steam.exe':
-                return True
-        except (psutil.NoSuchProcess, psutil.AccessDenied):
-            pass
-    return False
+    with process_scan('steam'):
+        return backend.is_steam_running()
+
+class ConnectivityMonitor:
+    """Tracks whether Steam's web services are reachable.
+
+    The connectivity job probes them in the background and network code reads
+    the last result instead of waiting on a socket timeout. Work that needs the
+    network while offline is deferred by key and replayed once a probe
+    succeeds again.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.is_online = None
+        self.checked_at = None
+        self.changed_at = None
+        self.first_check = threading.Event()
+        self.deferred = {}  # key -> (func, args), a later deferral of the same key replaces it
+
+    @property
+    def online(self):
+        # Only the very first reads can wait, for the startup probe
+        if not self.first_check.is_set():
+            self.first_check.wait(CONNECTIVITY_TIMEOUT)
+        return bool(self.is_online)
+
+    def check(self):
+        """Probe once, returns the delay until the next probe"""
+        online = check_internet_connection()
+        self._set(online)
+        return CONNECTIVITY_INTERVAL if online else CONNECTIVITY_RETRY_INTERVAL
+
+    def _set(self, online):
+        with self.lock:
+            changed = online != self.is_online
+            self.is_online = online
+            self.checked_at = datetime.now()
+            if changed:
+                self.changed_at = self.checked_at
+        self.first_check.set()
+        if changed:
+            print(f"Steam web services are {'reachable' if online else 'unreachable'}")
+            check_steam_status()
+            if online:
+                runtime.trigger('replay_deferred')
+
+    def mark_offline(self):
+        """A request failed to connect, go offline now and let the next probe confirm"""
+        if self.is_online:
+            self._set(False)
+            runtime.trigger('connectivity')
+
+    def request_failed(self, error):
+        """Go offline for a failed request only if it was to the probed host.
+
+        Another host failing, the store or the Web API, says that host is down
+        and not that the network is.
+        """
+        request = getattr(error, 'request', None)
+        if request is not None and urlsplit(request.url).hostname == urlsplit(CONNECTIVITY_URL).hostname:
+            self.mark_offline()
+
+    def defer(self, key, func, *args):
+        with self.lock:
+            self.deferred[key] = (func, args)
+
+    def replay(self):
+        """Run the work deferred while offline"""
+        with self.lock:
+            deferred, self.deferred = self.deferred, {}
+        for key, (func, args) in deferred.items():
+            if not self.is_online:
+                self.defer(key, func, *args)
+                continue
+            try:
+                func(*args)
+            except requests.RequestException as e:
+                print(f"Error replaying {key}: {e}")
+                self.request_failed(e)
+                self.defer(key, func, *args)
+            except Exception as e:
+                print(f"Error replaying {key}: {e}")
+
+connectivity = ConnectivityMonitor()
+
+# Last result of check_steam_status, the Discord publisher reads it instead of probing again
+last_steam_status = None
 
 def check_steam_status():
+    """Check if Steam is running and online, and remember the result"""
+    global last_steam_status
+    status = fetch_steam_status()
+    if status != last_steam_status:
+        last_steam_status = status
+        discord_publisher.wake()
+    return status
+
+def steam_not_ready(steam_status):
+    """Why idlers can't be started right now, or None if Steam is running and online"""
+    if not steam_status['running']:
+        return "🚫 Steam is not running. Please start Steam first."
+    if not steam_status['online']:
+        return "📡 Steam appears to be offline. Please ensure Steam is online."
+    return None
+
+def fetch_steam_status():
     if not is_steam_running():
         return {
             "running": False,
@@ -367,27 +1088,18 @@ def check_steam_status():
             "message": "🚫 Steam is not running"
         }
     
-    # Check if Steam is online by attempting to access the Steam Web API
-    try:
-        response = requests.get("https://steamcommunity.com/", timeout=5)
-        if response.status_code == 200:
-            return {
-                "running": True,
-                "online": True,
-                "message": "🌐 Steam is running and online"
-            }
-        else:
-            return {
-                "running": True,
-                "online": False,
-                "message": "📴 Steam is running but appears to be offline"
-            }
-    except:
+    # Online is the connectivity monitor's last probe of the Steam community site
+    if connectivity.online:
         return {
             "running": True,
-            "online": False,
-            "message": "📴 Steam is running but appears to be offline"
+            "online": True,
+            "message": "🌐 Steam is running and online"
         }
+    return {
+        "running": True,
+        "online": False,
+        "message": "📴 Steam is running but appears to be offline"
+    }
 
 def launch_steam():
     steam_path = get_steam_path()
@@ -395,7 +1107,7 @@ def launch_steam():
         try:
             steam_exe = os.path.join(steam_path, "Steam.exe")
             if os.path.exists(steam_exe):
-                subprocess.Popen([steam_exe])
+                backend.launch_steam(steam_exe)
                 return True
         except Exception as e:
             print(f"Error launching Steam: {e}")
@@ -407,43 +1119,168 @@ def format_duration(seconds):
     seconds = seconds % 60
     return f"{int(hours):02d}:{int(minutes):02d}:{int(seconds):02d}"
 
+def format_duration_short(seconds):
+    """Format a duration to the minute, e.g. 3h 05m"""
+    hours = int(seconds) // 3600
+    minutes = (int(seconds) % 3600) // 60
+    return f"{hours}h {minutes:02d}m"
+
+def load_game_metadata():
+    """Load the cached store names and images"""
+    if os.path.exists(GAME_METADATA_FILE):
+        try:
+            with open(GAME_METADATA_FILE, 'r', encoding='utf-8') as f:
+                return read_json(f)
+        except Exception as e:
+            print(f"Error loading game metadata: {e}")
+    return {}
+
+def save_game_metadata():
+    try:
+        with open(GAME_METADATA_FILE, 'w', encoding='utf-8') as f:
+            write_json(game_metadata, f)
+    except Exception as e:
+        print(f"Error saving game metadata: {e}")
+
+game_metadata = load_game_metadata()
+game_metadata_lock = threading.Lock()
+
+def local_game_info(game_id, name):
+    """Game info that needs no store request, the header image URL is fixed per app"""
+    return {
+        "id": game_id,
+        "name": name,
+        "image": f"https://cdn.cloudflare.steamstatic.com/steam/apps/{game_id}/header.jpg"
+    }
+
+def fetch_store_game_info(game_id):
+    """Scrape a game's name and header image from its store page and cache them"""
+    response = http.get(f"https://store.steampowered.com/app/{game_id}", timeout=10)
+    soup = BeautifulSoup(response.text, 'html.parser')
+
+    game_name = soup.find('div', {'class': 'apphub_AppName'})
+    game_image = soup.find('img', {'class': 'game_header_image_full'})
+    info = {
+        "id": game_id,
+        "name": game_name.text if game_name else (app_catalog.name_of(game_id) or "Unknown Game"),
+        "image": game_image['src'] if game_image else ""
+    }
+    if game_name:
+        with game_metadata_lock:
+            game_metadata[game_id] = {"name": info['name'], "image": info['image'], "fetched_at": time.time()}
+            save_game_metadata()
+    return info
+
+def refresh_game_metadata(game_id):
+    """Fetch store info deferred while offline and update the game's session with it"""
+    info = fetch_store_game_info(game_id)
+    game_state.set_info(game_id, info['name'], info['image'])
+
+def cached_game_info(game_id):
+    """Game info from the local manifests and the store metadata cache, None if it needs a request"""
+    # Installed games are named by their local manifest, no store request needed
+    installed = manifest_index.installed_apps().get(game_id)
+    if installed:
+        return local_game_info(game_id, installed['name'])
+    cached = game_metadata.get(game_id)
+    if cached:
+        return {"id": game_id, "name": cached['name'], "image": cached['image']}
+    return None
+
 def fetch_game_info(game_input):
     try:
         # Check if input is a numeric ID
         if game_input.isdigit():
             game_id = game_input
-            url = f"https://store.steampowered.com/app/{game_id}"
         else:
-            # Search by game name
-            search_url = f"https://store.steampowered.com/search/?term={requests.utils.quote(game_input)}"
-            search_response = requests.get(search_url)
-            search_soup = BeautifulSoup(search_response.text, 'html.parser')
-            
-            # Find the first search result
-            first_result = search_soup.find('a', {'class': 'search_result_row'})
-            if not first_result:
+            # Search by game name, the local catalog answers confident matches without a request
+            match = resolve_game_name(game_input)
+            if not match:
                 return {"error": "🚫 Game not found"}
-            
-            game_id = first_result['data-ds-appid']
-            url = f"https://store.steampowered.com/app/{game_id}"
+            if match['source'] == 'catalog':
+                return local_game_info(match['id'], match['name'])
+            game_id = match['id']
 
-        response = requests.get(url)
-        soup = BeautifulSoup(response.text, 'html.parser')
-        
-        game_name = soup.find('div', {'class': 'apphub_AppName'})
-        game_name = game_name.text if game_name else "Unknown Game"
-        
-        game_image = soup.find('img', {'class': 'game_header_image_full'})
-        game_image = game_image['src'] if game_image else ""
-        
-        return {
-            "id": game_id,
-            "name": game_name,
-            "image": game_image
-        }
+        cached = cached_game_info(game_id)
+        if cached:
+            return cached
+
+        if connectivity.online:
+            try:
+                return fetch_store_game_info(game_id)
+            except requests.RequestException as e:
+                print(f"Error fetching store page for {game_id}: {e}")
+                connectivity.request_failed(e)
+
+        # Offline, answer from the catalog now and fetch the store page once back online
+        connectivity.defer(f"game:{game_id}", refresh_game_metadata, game_id)
+        return local_game_info(game_id, app_catalog.name_of(game_id) or f"Game {game_id}")
     except Exception as e:
         return {"error": "❌ Error fetching game info"}
 
+# Static asset bundle produced by build_assets.py
+ASSETS_DIR = os.path.join(app.static_folder, 'dist')
+ASSET_CACHE_CONTROL = 'public, max-age=31536000, immutable'
+# Explicit types, the Windows registry often maps .js to text/plain
+ASSET_MIMETYPES = {
+    '.css': 'text/css',
+    '.js': 'application/javascript',
+    '.woff2': 'font/woff2',
+    '.ttf': 'font/ttf',
+}
+
+# CDN copies of the vendored assets, only used until build_assets.py has run
+ASSET_FALLBACKS = {
+    'tailwind.css': 'https://cdn.jsdelivr.net/npm/tailwindcss@2.2.19/dist/tailwind.min.css',
+    'fontawesome.css': 'https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.0.0/css/all.min.css',
+    'chart.js': 'https://cdn.jsdelivr.net/npm/chart.js@4.4.1/dist/chart.umd.js',
+}
+
+def load_asset_manifest():
+    manifest_file = os.path.join(ASSETS_DIR, 'manifest.json')
+    if os.path.exists(manifest_file):
+        try:
+            with open(manifest_file, 'r') as f:
+                return read_json(f)
+        except Exception as e:
+            print(f"Error loading asset manifest: {e}")
+    return {}
+
+asset_manifest = load_asset_manifest()
+
+def missing_assets():
+    """Vendored assets the build hasn't produced, the UI can't load offline without them"""
+    return [name for name in ASSET_FALLBACKS if name not in asset_manifest]
+
+if missing_assets():
+    print(f"⚠️ Static assets not built ({', '.join(missing_assets())}), loading them from their CDNs. "
+          "Run `python build_assets.py` once with network access so the UI also loads offline.")
+
+@app.template_global()
+def asset_url(name):
+    """URL for a bundled asset, preferring the fingerprinted local build"""
+    if name in asset_manifest:
+        return url_for('serve_asset', filename=asset_manifest[name])
+    if name in ASSET_FALLBACKS:
+        return ASSET_FALLBACKS[name]
+    return url_for('static', filename=name)
+
+@app.route('/assets/<path:filename>')
+def serve_asset(filename):
+    """Serve fingerprinted assets, using precompressed copies when the client accepts them"""
+    response = None
+    mimetype = ASSET_MIMETYPES.get(os.path.splitext(filename)[1], 'application/octet-stream')
+    for encoding, suffix in (('br', '.br'), ('gzip', '.gz')):
+        if encoding in request.accept_encodings and os.path.exists(os.path.join(ASSETS_DIR, filename + suffix)):
+            response = send_from_directory(ASSETS_DIR, filename + suffix, mimetype=mimetype)
+            response.headers['Content-Encoding'] = encoding
+            break
+    if response is None:
+        response = send_from_directory(ASSETS_DIR, filename, mimetype=mimetype)
+    response.headers['Cache-Control'] = ASSET_CACHE_CONTROL
+    response.headers['Vary'] = 'Accept-Encoding'
+    return response
+
 @app.route('/')
 def home():
     """Serve the main application page"""
@@ -467,7 +1304,7 @@ def save_preset():
     # Save preset as JSON
     preset_json_path = os.path.join(PRESETS_DIR, f"{preset_name}.json")
     with open(preset_json_path, 'w') as f:
-        json.dump(games, f)
+        write_json(games, f)
     
     # Create BAT file in the same directory
     bat_content = "@echo off\n"
@@ -478,23 +1315,46 @@ def save_preset():
     bat_path = os.path.join(PRESETS_DIR, f"{preset_name}.bat")
     with open(bat_path, 'w') as f:
         f.write(bat_content)
+    bump_resource('presets')
     
     return jsonify({"status": "success"})
 
 @app.route('/api/get-presets')
+@conditional_get('presets')
 def get_presets():
     presets = []
+    launch_profiles = load_preset_launch_profiles()
     for filename in os.listdir(PRESETS_DIR):
         if filename.endswith('.json'):
             preset_name = filename[:-5]
             with open(os.path.join(PRESETS_DIR, filename), 'r') as f:
-                games = json.load(f)
+                games = read_json(f)
             presets.append({
                 "name": preset_name,
-                "games": games
+                "games": games,
+                "launch_profile": launch_profiles.get(preset_name)
             })
     return jsonify(presets)
 
+@app.route('/api/preset-launch-profile', methods=['POST'])
+def preset_launch_profile():
+    """Set a preset's launch profile, a null profile makes it use the global one"""
+    data = request.get_json()
+    preset_name = data.get('name')
+    if not preset_name or not os.path.exists(os.path.join(PRESETS_DIR, f"{preset_name}.json")):
+        return jsonify({"status": "error", "message": "❌ Preset not found"}), 404
+    try:
+        profiles = load_preset_launch_profiles()
+        if data.get('profile'):
+            profiles[preset_name] = normalize_launch_profile(data['profile'])
+        else:
+            profiles.pop(preset_name, None)
+        save_preset_launch_profiles(profiles)
+        save_recent_action(f"Updated launch profile of preset {preset_name}")
+        return jsonify({"status": "success", "profile": profiles.get(preset_name)})
+    except ValueError as e:
+        return jsonify({"status": "error", "message": f"❌ {e}"}), 400
+
 @app.route('/api/steam-status')
 def steam_status():
     return jsonify(check_steam_status())
@@ -514,37 +1374,22 @@ def start_game():
     
     # Check Steam status first
     steam_status = check_steam_status()
-    if not steam_status['running']:
-        return jsonify({
-            "status": "error", 
-            "message": "🚫 Steam is not running. Please start Steam first.",
-            "steam_status": steam_status
-        }), 400
-    
-    if not steam_status['online']:
-        return jsonify({
-            "status": "error", 
-            "message": "📡 Steam appears to be offline. Please ensure Steam is online.",
-            "steam_status": steam_status
-        }), 400
+    error = steam_not_ready(steam_status)
+    if error:
+        return jsonify({"status": "error", "message": error, "steam_status": steam_status}), 400
     
     # Check if game is already running
-    if game_id in running_games:
+    if game_id in get_running_games():
         return jsonify({"status": "error", "message": "🚫 Game is already running"}), 400
     
     try:
-        process = subprocess.Popen([IDLER_PATH, game_id], shell=True)
-        running_games[game_id] = process.pid
-        
         # Initialize or update game session
-        if game_id not in game_sessions:
+        name = image = None
+        if game_id not in game_state.snapshot().game_sessions:
             game_info = fetch_game_info(game_id)
-            game_sessions[game_id] = {
-                'total_time': 0,
-                'name': game_info['name'],
-                'image': game_info['image']
-            }
-        game_sessions[game_id]['start_time'] = datetime.now()
+            name, image = game_info['name'], game_info['image']
+        process = spawn_idler(game_id, 'start')
+        game_state.start_session(game_id, process.pid, name, image)
         
         # Save statistics
         save_statistics()
@@ -561,54 +1406,79 @@ def stop_game():
     data = request.get_json()
     game_id = str(data.get('gameId'))
     
-    if game_id not in running_games:
+    if game_id not in get_running_games():
         return jsonify({"status": "error", "message": "🚫 Game is not running"}), 400
     
     try:
-        pid = running_games[game_id]
-        process = psutil.Process(pid)
-        for child in process.children(recursive=True):
-            child.terminate()
-        process.terminate()
-        
-        # Update total playtime
-        if game_id in game_sessions and 'start_time' in game_sessions[game_id]:
-            session_duration = (datetime.now() - game_sessions[game_id]['start_time']).total_seconds()
-            game_sessions[game_id]['total_time'] += session_duration
-            game_sessions[game_id].pop('start_time', None)
-            
-            # Save statistics
-            save_statistics()
-        
-        del running_games[game_id]
-        
-        # Update tray menu
-        update_tray_menu()
-        
-        return jsonify({"status": "success"})
-    except psutil.NoSuchProcess:
-        # If process is already gone, just remove it from our tracking
-        del running_games[game_id]
-        update_tray_menu()
+        if terminate_idlers([game_id])[game_id]['status'] == 'failed':
+            return jsonify({"status": "error", "message": "❌ The idler could not be stopped"}), 500
         return jsonify({"status": "success"})
     except Exception as e:
         return jsonify({"status": "error", "message": str(e)}), 500
 
+@app.route('/api/games/start', methods=['POST'])
+def start_games():
+    """Start a list of games in one batch, {"gameIds": [...]}"""
+    data = request.get_json()
+    game_ids = [str(game_id) for game_id in data.get('gameIds', [])]
+    if not game_ids:
+        return jsonify({"status": "error", "message": "🚫 No games given"}), 400
+    
+    steam_status = check_steam_status()
+    error = steam_not_ready(steam_status)
+    if error:
+        return jsonify({"status": "error", "message": error, "steam_status": steam_status}), 400
+    
+    results = launch_idlers([{"id": game_id} for game_id in game_ids], 'start')
+    started = sum(1 for result in results.values() if result['status'] == 'started')
+    failed = sum(1 for result in results.values() if result['status'] == 'failed')
+    if failed:
+        message = f"⚠️ Started {started} games, {failed} failed to start"
+    else:
+        message = f"▶️ Started {started} games"
+    return jsonify({
+        "status": "success" if not failed else ("partial" if started else "error"),
+        "message": message,
+        "results": results
+    })
+
+@app.route('/api/games/stop', methods=['POST'])
+def stop_games():
+    """Stop a list of games in one batch, {"gameIds": [...]}"""
+    data = request.get_json()
+    game_ids = [str(game_id) for game_id in data.get('gameIds', [])]
+    if not game_ids:
+        return jsonify({"status": "error", "message": "🚫 No games given"}), 400
+    
+    try:
+        results = terminate_idlers(game_ids)
+    except Exception as e:
+        return jsonify({"status": "error", "message": str(e)}), 500
+    stopped = len(stopped_game_ids(results))
+    failed = sum(1 for result in results.values() if result['status'] == 'failed')
+    if failed:
+        message = f"⚠️ Stopped {stopped} games, {failed} could not be stopped"
+    else:
+        message = f"⏹️ Stopped {stopped} games"
+    return jsonify({"status": "success" if not failed else "partial", "message": message, "results": results})
+
 @app.route('/api/game-status', methods=['POST'])
 def game_status():
     data = request.get_json()
     game_id = str(data.get('gameId'))
     
+    running_games = get_running_games()
     is_running = game_id in running_games
     if is_running:
         try:
             # Verify process is actually still running
-            process = psutil.Process(running_games[game_id])
-            if not process.is_running():
-                del running_games[game_id]
+            with process_scan('status'):
+                alive = backend.process(running_games[game_id]).is_running()
+            if not alive:
+                game_state.drop_running(game_id)
                 is_running = False
         except (psutil.NoSuchProcess, psutil.AccessDenied):
-            del running_games[game_id]
+            game_state.drop_running(game_id)
             is_running = False
     
     return jsonify({"status": "success", "running": is_running})
@@ -627,6 +1497,10 @@ def delete_preset():
             os.remove(json_path)
         if os.path.exists(bat_path): 
             os.remove(bat_path)
+        profiles = load_preset_launch_profiles()
+        if profiles.pop(preset_name, None) is not None:
+            save_preset_launch_profiles(profiles)
+        bump_resource('presets')
         return jsonify({"status": "success"})
     except Exception as e:
         return jsonify({"status": "error", "message": str(e)}), 500
@@ -635,19 +1509,20 @@ def delete_preset():
 def game_session_time():
     data = request.get_json()
     game_id = str(data.get('gameId'))
+    snapshot = game_state.snapshot()
     
-    if game_id not in game_sessions:
+    if game_id not in snapshot.game_sessions:
         return jsonify({
             "current_session": "00:00:00",
             "total_time": "00:00:00"
         })
     
-    session = game_sessions[game_id]
+    session = snapshot.game_sessions[game_id]
     total_seconds = session.get('total_time', 0)
     
     # Calculate current session time if game is running
     current_session_seconds = 0
-    if game_id in running_games and 'start_time' in session:
+    if game_id in snapshot.running_games and 'start_time' in session:
         current_session_seconds = (datetime.now() - session['start_time']).total_seconds()
     
     return jsonify({
@@ -655,6 +1530,37 @@ def game_session_time():
         "total_time": format_duration(total_seconds + current_session_seconds)
     })
 
+@app.route('/api/session-times')
+def session_times():
+    """Session and total times for every tracked game (or the comma separated ids) in one call"""
+    snapshot = game_state.snapshot()
+    ids = request.args.get('ids')
+    game_ids = ids.split(',') if ids else snapshot.game_sessions.keys()
+    now = datetime.now()
+
+    times = {}
+    for game_id in game_ids:
+        session = snapshot.game_sessions.get(game_id)
+        if session is None:
+            continue
+        current_session_seconds = 0
+        if game_id in snapshot.running_games and 'start_time' in session:
+            current_session_seconds = (now - session['start_time']).total_seconds()
+        suspended_seconds = session.get('suspended_time', 0)
+        if 'suspended_since' in session:
+            suspended_seconds += (now - session['suspended_since']).total_seconds()
+        total_seconds = session.get('total_time', 0) + current_session_seconds
+        times[game_id] = {
+            "current_session": format_duration(current_session_seconds),
+            "total_time": format_duration(total_seconds),
+            "active_time": format_duration(max(0, total_seconds - suspended_seconds)),
+            "suspended_time": format_duration(suspended_seconds),
+            "suspended": 'suspended_since' in session,
+            "running": game_id in snapshot.running_games
+        }
+
+    return jsonify({"status": "success", "times": times})
+
 @app.route('/api/run-preset', methods=['POST'])
 def run_preset():
     data = request.get_json()
@@ -662,19 +1568,9 @@ def run_preset():
     
     # Check Steam status first
     steam_status = check_steam_status()
-    if not steam_status['running']:
-        return jsonify({
-            "status": "error", 
-            "message": "🚫 Steam is not running. Please start Steam first.",
-            "steam_status": steam_status
-        }), 400
-    
-    if not steam_status['online']:
-        return jsonify({
-            "status": "error", 
-            "message": "📡 Steam appears to be offline. Please ensure Steam is online.",
-            "steam_status": steam_status
-        }), 400
+    error = steam_not_ready(steam_status)
+    if error:
+        return jsonify({"status": "error", "message": error, "steam_status": steam_status}), 400
     
     # Get the preset data from JSON file
     json_path = os.path.join(PRESETS_DIR, f"{preset_name}.json")
@@ -682,139 +1578,66 @@ def run_preset():
         return jsonify({"status": "error", "message": "❌ Preset not found"}), 404
         
     try:
-        # Read the games from the preset
-        with open(json_path, 'r') as f:
-            games = json.load(f)
-        
-        # Keep track of started games and failed games
-        started_games = []
-        failed_games = []
-        
-        # First attempt to start all games
-        for game in games:
-            game_id = str(game['id'])
-            if game_id not in running_games:  # Only start if not already running
-                try:
-                    process = subprocess.Popen([IDLER_PATH, game_id], shell=True)
-                    running_games[game_id] = process.pid
-                    started_games.append(game_id)
-                    
-                    # Initialize or update game session
-                    if game_id not in game_sessions:
-                        game_sessions[game_id] = {
-                            'total_time': 0,
-                            'name': game['name'],
-                            'image': game['image']
-                        }
-                    game_sessions[game_id]['start_time'] = datetime.now()
-                except Exception as e:
-                    print(f"Failed to start game {game_id}: {e}")
-                    failed_games.append(game)
-        
-        # Wait a moment for processes to initialize
-        time.sleep(2)
-        
-        # Verify all games are running and retry failed ones
-        max_retries = 3
-        retry_count = 0
-        
-        while retry_count < max_retries:
-            # Check which games failed to start
-            failed_games = []
-            for game in games:
-                game_id = str(game['id'])
-                if game_id in running_games:
-                    try:
-                        # Verify process is actually running
-                        process = psutil.Process(running_games[game_id])
-                        if not process.is_running():
-                            failed_games.append(game)
-                            del running_games[game_id]
-                    except (psutil.NoSuchProcess, psutil.AccessDenied):
-                        failed_games.append(game)
-                        del running_games[game_id]
-                else:
-                    failed_games.append(game)
-            
-            # If all games are running, break the retry loop
-            if not failed_games:
-                break
-                
-            # Retry failed games
-            retry_count += 1
-            if retry_count < max_retries:
-                print(f"Retrying {len(failed_games)} failed games (attempt {retry_count + 1})")
-                for game in failed_games:
-                    game_id = str(game['id'])
-                    try:
-                        process = subprocess.Popen([IDLER_PATH, game_id], shell=True)
-                        running_games[game_id] = process.pid
-                        started_games.append(game_id)
-                        
-                        # Initialize or update game session
-                        if game_id not in game_sessions:
-                            game_sessions[game_id] = {
-                                'total_time': 0,
-                                'name': game['name'],
-                                'image': game['image']
-                            }
-                        game_sessions[game_id]['start_time'] = datetime.now()
-                    except Exception as e:
-                        print(f"Failed to start game {game_id} on retry: {e}")
-                
-                # Wait between retries
-                time.sleep(2)
-        
-        save_statistics()
-        
-        # Notify the UI to update through the window's evaluate_js method
-        if window:
-            window.evaluate_js("""
-                runningGames.clear();
-                %s.forEach(gameId => runningGames.add(gameId));
-                updateGamesList();
-                loadPresets(true).then(presets => {
-                    updatePresetsList(presets);
-                    updateRunningGamesList();
-                });
-            """ % json.dumps([str(game['id']) for game in games]))
-        
-        # Prepare status message
-        if failed_games:
-            message = f"Started {len(started_games)} games, but {len(failed_games)} failed to start"
-            icon.notify(f"⚠️ {message}", "Preset Started with Issues")
-            save_recent_action(f"⚠️ Started preset {preset_name} with issues")
-        else:
-            message = f"Started {len(started_games)} games from preset {preset_name}"
-            icon.notify(f"▶️ {message}", "Preset Started")
-            save_recent_action(f"▶️ Started preset {preset_name}")
-        
-        update_tray_menu()
-        
-        return jsonify({
-            "status": "success" if not failed_games else "partial",
-            "message": message,
-            "gameIds": started_games,
-            "failedGames": [{"id": g["id"], "name": g["name"]} for g in failed_games]
-        })
+        return jsonify(start_preset(preset_name))
     except Exception as e:
-        icon.notify(f"❌ Error running preset: {str(e)}", "Error")
+        if icon:
+            icon.notify(f"❌ Error running preset: {str(e)}", "Error")
         return jsonify({
             "status": "error",
             "message": str(e)
         }), 500
 
+def start_preset(preset_name):
+    """Start a preset's games with its launch profile, retrying the ones that don't stay up"""
+    with open(os.path.join(PRESETS_DIR, f"{preset_name}.json"), 'r') as f:
+        games = read_json(f)
+    results = launch_idlers(games, 'preset', get_preset_launch_profile(preset_name), retries=2)
+    started_games = [game_id for game_id, result in results.items() if result['status'] == 'started']
+    failed_games = [game for game in games if results[str(game['id'])]['status'] == 'failed']
+    
+    # Notify the UI to update through the window's evaluate_js method
+    if window:
+        window.evaluate_js("""
+            runningGames.clear();
+            %s.forEach(gameId => runningGames.add(gameId));
+            updateGamesList();
+            loadPresets(true).then(presets => {
+                updatePresetsList(presets);
+                updateRunningGamesList();
+            });
+        """ % json.dumps(list(get_running_games())))
+    
+    # Prepare status message
+    if failed_games:
+        message = f"Started {len(started_games)} games, but {len(failed_games)} failed to start"
+        if icon:
+            icon.notify(f"⚠️ {message}", "Preset Started with Issues")
+        save_recent_action(f"⚠️ Started preset {preset_name} with issues")
+    else:
+        message = f"Started {len(started_games)} games from preset {preset_name}"
+        if icon:
+            icon.notify(f"▶️ {message}", "Preset Started")
+        save_recent_action(f"▶️ Started preset {preset_name}")
+    
+    return {
+        "status": "success" if not failed_games else "partial",
+        "message": message,
+        "gameIds": started_games,
+        "failedGames": [{"id": g["id"], "name": g["name"]} for g in failed_games]
+    }
+
 @app.route('/api/stats/total-playtime')
 def get_total_playtime():
+    snapshot = game_state.snapshot()
     total_seconds = 0
     current_time = datetime.now()
     
-    for game_id, session in game_sessions.items():
+    for game_id, session in snapshot.game_sessions.items():
         # Add completed session time
         total_seconds += session.get('total_time', 0)
         
         # Add current session time if game is running
-        if game_id in running_games and 'start_time' in session:
+        if game_id in snapshot.running_games and 'start_time' in session:
             current_session = (current_time - session['start_time']).total_seconds()
             total_seconds += current_session
     
@@ -831,14 +1654,15 @@ def get_total_playtime():
 
 @app.route('/api/stats/most-idled')
 def get_most_idled():
+    snapshot = game_state.snapshot()
     games_list = []
     current_time = datetime.now()
     
-    for game_id, session in game_sessions.items():
+    for game_id, session in snapshot.game_sessions.items():
         total_seconds = session.get('total_time', 0)
         
         # Add current session time if game is running
-        if game_id in running_games and 'start_time' in session:
+        if game_id in snapshot.running_games and 'start_time' in session:
             current_session = (current_time - session['start_time']).total_seconds()
             total_seconds += current_session
         
@@ -858,6 +1682,7 @@ def get_most_idled():
 
 @app.route('/api/stats/playtime-history/<period>')
 def get_playtime_history(period):
+    snapshot = game_state.snapshot()
     current_time = datetime.now()
     history = []
     
@@ -868,7 +1693,7 @@ def get_playtime_history(period):
             hour_end = current_time - timedelta(hours=i)
             total_seconds = 0
             
-            for session in game_sessions.values():
+            for session in snapshot.game_sessions.values():
                 if 'start_time' in session and session['start_time'] >= hour_start and session['start_time'] < hour_end:
                     session_end = min(hour_end, datetime.now())
                     session_duration = (session_end - session['start_time']).total_seconds()
@@ -886,7 +1711,7 @@ def get_playtime_history(period):
             day_end = (current_time - timedelta(days=i)).replace(hour=0, minute=0, second=0)
             total_seconds = 0
             
-            for session in game_sessions.values():
+            for session in snapshot.game_sessions.values():
                 if 'start_time' in session and session['start_time'] >= day_start and session['start_time'] < day_end:
                     session_end = min(day_end, datetime.now())
                     session_duration = (session_end - session['start_time']).total_seconds()
@@ -904,7 +1729,7 @@ def get_playtime_history(period):
             week_end = current_time - timedelta(days=i*7)
             total_seconds = 0
             
-            for session in game_sessions.values():
+            for session in snapshot.game_sessions.values():
                 if 'start_time' in session and session['start_time'] >= week_start and session['start_time'] < week_end:
                     session_end = min(week_end, datetime.now())
                     session_duration = (session_end - session['start_time']).total_seconds()
@@ -925,14 +1750,14 @@ def manage_goals():
     if request.method == 'GET':
         if os.path.exists(goals_file):
             with open(goals_file, 'r') as f:
-                return jsonify(json.load(f))
+                return jsonify(read_json(f))
         return jsonify([])
     
     elif request.method == 'POST':
         data = request.get_json()
         if os.path.exists(goals_file):
             with open(goals_file, 'r') as f:
-                goals = json.load(f)
+                goals = read_json(f)
         else:
             goals = []
         
@@ -943,8 +1768,7 @@ def manage_goals():
             "created_at": datetime.now().isoformat()
         })
         
-        with open(goals_file, 'w') as f:
-            json.dump(goals, f)
+        save_goals(goals)
         
         return jsonify({"status": "success"})
     
@@ -952,14 +1776,13 @@ def manage_goals():
         data = request.get_json()
         if os.path.exists(goals_file):
             with open(goals_file, 'r') as f:
-                goals = json.load(f)
+                goals = read_json(f)
                 for goal in goals:
                     if goal['id'] == data['id']:
                         goal.update(data)
                         break
             
-            with open(goals_file, 'w') as f:
-                json.dump(goals, f)
+            save_goals(goals)
         
         return jsonify({"status": "success"})
     
@@ -967,12 +1790,11 @@ def manage_goals():
         data = request.get_json()
         if os.path.exists(goals_file):
             with open(goals_file, 'r') as f:
-                goals = json.load(f)
+                goals = read_json(f)
             
             goals = [g for g in goals if g['id'] != data['id']]
             
-            with open(goals_file, 'w') as f:
-                json.dump(goals, f)
+            save_goals(goals)
         
         return jsonify({"status": "success"})
 
@@ -980,20 +1802,21 @@ def load_favorites():
     if os.path.exists(FAVORITES_FILE):
         try:
             with open(FAVORITES_FILE, 'r') as f:
-                return json.load(f)
+                return read_json(f)
         except:
             return {"favorites": []}
     return {"favorites": []}
 
 def save_favorites(favorites):
     with open(FAVORITES_FILE, 'w') as f:
-        json.dump(favorites, f)
+        write_json(favorites, f)
+    bump_resource('favorites')
 
 def load_recent_actions():
     if os.path.exists(RECENT_ACTIONS_FILE):
         try:
             with open(RECENT_ACTIONS_FILE, 'r') as f:
-                return json.load(f)
+                return read_json(f)
         except:
             return {"actions": []}
     return {"actions": []}
@@ -1007,22 +1830,25 @@ def save_recent_action(action):
     # Keep only last 10 actions
     actions["actions"] = actions["actions"][:10]
     with open(RECENT_ACTIONS_FILE, 'w') as f:
-        json.dump(actions, f)
+        write_json(actions, f)
+    bump_resource('recent_actions')
 
 def load_shortcuts():
     if os.path.exists(SHORTCUTS_FILE):
         try:
             with open(SHORTCUTS_FILE, 'r') as f:
-                return json.load(f)
+                return read_json(f)
         except:
             return {"shortcuts": []}
     return {"shortcuts": []}
 
 def save_shortcuts(shortcuts):
     with open(SHORTCUTS_FILE, 'w') as f:
-        json.dump(shortcuts, f)
+        write_json(shortcuts, f)
+    bump_resource('shortcuts')
 
 @app.route('/api/favorites', methods=['GET', 'POST', 'DELETE'])
+@conditional_get('favorites')
 def manage_favorites():
     if request.method == 'GET':
         return jsonify(load_favorites())
@@ -1038,7 +1864,7 @@ def manage_favorites():
             for preset in presets:
                 if preset.replace('.json', '') == preset_name:
                     with open(os.path.join(PRESETS_DIR, preset), 'r') as f:
-                        preset_data = json.load(f)
+                        preset_data = read_json(f)
                         favorites['favorites'].append({
                             'name': preset_name,
                             'games': preset_data
@@ -1061,10 +1887,12 @@ def manage_favorites():
         return jsonify({"status": "success"})
 
 @app.route('/api/recent-actions')
+@conditional_get('recent_actions')
 def get_recent_actions():
     return jsonify(load_recent_actions())
 
 @app.route('/api/shortcuts', methods=['GET', 'POST', 'DELETE'])
+@conditional_get('shortcuts')
 def manage_shortcuts():
     if request.method == 'GET':
         return jsonify(load_shortcuts())
@@ -1094,27 +1922,11 @@ def manage_shortcuts():
 
 @app.route('/api/emergency-stop')
 def emergency_stop():
-    stopped_games = []
-    for game_id in list(running_games.keys()):
-        try:
-            pid = running_games[game_id]
-            process = psutil.Process(pid)
-            for child in process.children(recursive=True):
-                child.terminate()
-            process.terminate()
-            stopped_games.append(game_id)
-            del running_games[game_id]
-            
-            # Update game session
-            if game_id in game_sessions and 'start_time' in game_sessions[game_id]:
-                session_duration = (datetime.now() - game_sessions[game_id]['start_time']).total_seconds()
-                game_sessions[game_id]['total_time'] += session_duration
-                game_sessions[game_id].pop('start_time', None)
-        except (psutil.NoSuchProcess, psutil.AccessDenied):
-            del running_games[game_id]
+    # Keep the rotation from refilling the slots we are about to free
+    stop_rotation(stop_games=False)
+    stopped_games = stopped_game_ids(terminate_idlers(get_running_games()))
     
     save_recent_action(f"🛑 Emergency stop - Stopped {len(stopped_games)} games")
-    save_statistics()
     
     return jsonify({
         "status": "success",
@@ -1141,32 +1953,11 @@ def startup_status():
             }), 500
 
 def get_startup_status():
-    try:
-        key = winreg.OpenKey(
-            winreg.HKEY_CURRENT_USER,
-            r"Software\Microsoft\Windows\CurrentVersion\Run",
-            0,
-            winreg.KEY_READ
-        )
-        try:
-            winreg.QueryValueEx(key, "SteamIdleManager")
-            return True
-        except WindowsError:
-            return False
-        finally:
-            winreg.CloseKey(key)
-    except WindowsError:
-        return False
+    return backend.get_startup_command() is not None
 
 def set_startup_status(enable):
     try:
-        key = winreg.OpenKey(
-            winreg.HKEY_CURRENT_USER,
-            r"Software\Microsoft\Windows\CurrentVersion\Run",
-            0,
-            winreg.KEY_SET_VALUE
-        )
-        
+        app_path = None
         if enable:
             # Get the path to the executable
             if getattr(sys, 'frozen', False):
@@ -1175,29 +1966,17 @@ def set_startup_status(enable):
             else:
                 # Running as script
                 app_path = f'pythonw "{os.path.abspath(__file__)}"'
-            
-            winreg.SetValueEx(
-                key,
-                "SteamIdleManager",
-                0,
-                winreg.REG_SZ,
-                app_path
-            )
-        else:
-            try:
-                winreg.DeleteValue(key, "SteamIdleManager")
-            except WindowsError:
-                pass
-        
+        backend.set_startup_command(app_path)
         return True
     except Exception as e:
         print(f"Error setting startup status: {e}")
         return False
-    finally:
-        winreg.CloseKey(key)
 
 def update_tray_menu():
     """Update the system tray menu with current running games and other dynamic content"""
+    if icon is None:
+        return
+    snapshot = game_state.snapshot()
     try:
         menu_items = []
         
@@ -1206,15 +1985,15 @@ def update_tray_menu():
         menu_items.append(pystray.Menu.SEPARATOR)
         
         # Running Games submenu
-        if running_games:
+        if snapshot.running_games:
             running_items = []
             
             # Add total playtime and most idled game at the top
             total_seconds = 0
             current_time = datetime.now()
-            for game_id, session in game_sessions.items():
+            for game_id, session in snapshot.game_sessions.items():
                 total_seconds += session.get('total_time', 0)
-                if game_id in running_games and 'start_time' in session:
+                if game_id in snapshot.running_games and 'start_time' in session:
                     current_session = (current_time - session['start_time']).total_seconds()
                     total_seconds += current_session
             
@@ -1225,7 +2004,7 @@ def update_tray_menu():
             
             # Add total running games counter
             running_items.append(pystray.MenuItem(
-                f"🎮 Idling ({len(running_games)} games)", 
+                f"🎮 Idling ({len(snapshot.running_games)} games)", 
                 lambda item: None, enabled=False))
             
             # Add most idled game
@@ -1237,14 +2016,14 @@ def update_tray_menu():
             running_items.append(pystray.Menu.SEPARATOR)
             
             # Add running games with their total playtime
-            for game_id in running_games:
-                if game_id in game_sessions and 'name' in game_sessions[game_id]:
-                    game_name = game_sessions[game_id]['name']
-                    total_seconds = game_sessions[game_id].get('total_time', 0)
+            for game_id in snapshot.running_games:
+                if game_id in snapshot.game_sessions and 'name' in snapshot.game_sessions[game_id]:
+                    game_name = snapshot.game_sessions[game_id]['name']
+                    total_seconds = snapshot.game_sessions[game_id].get('total_time', 0)
                     
                     # Add current session time if game is running
-                    if 'start_time' in game_sessions[game_id]:
-                        current_session = (current_time - game_sessions[game_id]['start_time']).total_seconds()
+                    if 'start_time' in snapshot.game_sessions[game_id]:
+                        current_session = (current_time - snapshot.game_sessions[game_id]['start_time']).total_seconds()
                         total_seconds += current_session
                     
                     # Create a function that captures game_id in its scope
@@ -1291,26 +2070,16 @@ def update_tray_menu():
         menu_items.append(pystray.MenuItem("🚀 Launch Steam", launch_steam_tray, 
                                          enabled=lambda item: not is_steam_running()))
         menu_items.append(pystray.Menu.SEPARATOR)
+        if rotation_state['enabled']:
+            menu_items.append(pystray.MenuItem(
+                f"🔁 Stop Rotation ({len(rotation_state['active'])} idling)", stop_rotation_tray))
         menu_items.append(pystray.MenuItem("🛑 Emergency Stop", emergency_stop_tray, 
-                                         enabled=lambda item: bool(running_games)))
+                                         enabled=lambda item: bool(get_running_games())))
         
         # Add Minimize/Maximize Toggle button
-        if running_games:
+        if snapshot.running_games:
             # Check if any game window is minimized to determine the button text
-            windows = []
-            def check_window_state(hwnd, windows):
-                if win32gui.IsWindowVisible(hwnd):
-                    try:
-                        _, pid = win32process.GetWindowThreadProcessId(hwnd)
-                        process = psutil.Process(pid)
-                        if 'steam-idle' in process.name().lower():
-                            # Store window handle and state
-                            is_minimized = win32gui.IsIconic(hwnd)
-                            windows.append(is_minimized)
-                    except Exception:
-                        pass
-            
-            win32gui.EnumWindows(check_window_state, windows)
+            windows = [minimized for _, minimized in backend.idler_windows()]
             
             # If any window is not minimized, show "Maximize All", otherwise show "Minimize All"
             all_minimized = all(windows) if windows else False
@@ -1335,31 +2104,13 @@ def toggle_minimize_all_tray(icon, item, minimize=True):
     """Handle minimize/maximize all games from tray icon"""
     try:
         # Get all running game windows
-        windows = []
-        
-        def callback(hwnd, windows):
-            if win32gui.IsWindowVisible(hwnd):
-                try:
-                    # Get the process ID for this window
-                    _, pid = win32process.GetWindowThreadProcessId(hwnd)
-                    process = psutil.Process(pid)
-                    
-                    # Check if this is a steam-idle process
-                    if 'steam-idle' in process.name().lower():
-                        windows.append(hwnd)
-                except Exception:
-                    pass
-        
-        win32gui.EnumWindows(callback, windows)
+        windows = [hwnd for hwnd, _ in backend.idler_windows()]
         
         # Minimize or restore all game windows
         success_count = 0
         for hwnd in windows:
             try:
-                if minimize:
-                    win32gui.ShowWindow(hwnd, win32con.SW_MINIMIZE)
-                else:
-                    win32gui.ShowWindow(hwnd, win32con.SW_RESTORE)
+                backend.show_window(hwnd, minimize)
                 success_count += 1
             except Exception as e:
                 print(f"Error toggling window state: {str(e)}")
@@ -1390,31 +2141,13 @@ def toggle_minimize_games(minimize=True):
     with app.app_context():
         try:
             # Get all running game windows
-            windows = []
-            
-            def callback(hwnd, windows):
-                if win32gui.IsWindowVisible(hwnd):
-                    try:
-                        # Get the process ID for this window
-                        _, pid = win32process.GetWindowThreadProcessId(hwnd)
-                        process = psutil.Process(pid)
-                        
-                        # Check if this is a steam-idle process
-                        if 'steam-idle' in process.name().lower():
-                            windows.append(hwnd)
-                    except Exception:
-                        pass
-            
-            win32gui.EnumWindows(callback, windows)
+            windows = [hwnd for hwnd, _ in backend.idler_windows()]
             
             # Minimize or restore all game windows
             success_count = 0
             for hwnd in windows:
                 try:
-                    if minimize:
-                        win32gui.ShowWindow(hwnd, win32con.SW_MINIMIZE)
-                    else:
-                        win32gui.ShowWindow(hwnd, win32con.SW_RESTORE)
+                    backend.show_window(hwnd, minimize)
                     success_count += 1
                 except Exception as e:
                     print(f"Error toggling window state: {str(e)}")
@@ -1510,24 +2243,24 @@ def handle_minimize_event():
 
 def check_and_restart_games():
     """Check if any running games have crashed and restart them if auto-reconnect is enabled"""
-    while True:
-        if AUTO_RECONNECT:
-            for game_id in list(running_games.keys()):
-                try:
-                    process = psutil.Process(running_games[game_id])
-                    if not process.is_running():
-                        print(f"Game {game_id} crashed, restarting...")
-                        restart_game(game_id)
-                except (psutil.NoSuchProcess, psutil.AccessDenied):
-                    print(f"Game {game_id} crashed, restarting...")
-                    restart_game(game_id)
-        time.sleep(RECONNECT_INTERVAL)
+    if not AUTO_RECONNECT:
+        return
+    for game_id, pid in get_running_games().items():
+        try:
+            process = backend.process(pid)
+            if not process.is_running():
+                print(f"Game {game_id} crashed, restarting...")
+                restart_game(game_id)
+        except (psutil.NoSuchProcess, psutil.AccessDenied):
+            print(f"Game {game_id} crashed, restarting...")
+            restart_game(game_id)
 
 def restart_game(game_id):
     """Restart a crashed game"""
     try:
-        process = subprocess.Popen([IDLER_PATH, game_id], shell=True)
-        running_games[game_id] = process.pid
+        idler_lifecycle.record('restart', game_id, previous_pid=get_running_games().get(game_id))
+        process = spawn_idler(game_id, 'restart')
+        game_state.set_pid(game_id, process.pid)
         if icon:
             icon.notify(f"🔄 Game {game_id} was restarted automatically", "Auto-Reconnect")
     except Exception as e:
@@ -1535,39 +2268,37 @@ def restart_game(game_id):
 
 def check_game_goals():
     """Check if any game has reached its playtime goal"""
-    while True:
-        goals = load_goals()
-        for goal in goals:
-            game_id = goal['game_id']
-            target_hours = goal['target_hours']
+    snapshot = game_state.snapshot()
+    goals = load_goals()
+    for goal in goals:
+        game_id = goal['game_id']
+        target_hours = goal['target_hours']
+        
+        if game_id in snapshot.game_sessions:
+            session = snapshot.game_sessions[game_id]
+            total_seconds = session.get('total_time', 0)
             
-            if game_id in game_sessions:
-                session = game_sessions[game_id]
-                total_seconds = session.get('total_time', 0)
-                
-                # Add current session time if game is running
-                if game_id in running_games and 'start_time' in session:
-                    current_session = (datetime.now() - session['start_time']).total_seconds()
-                    total_seconds += current_session
-                
-                total_hours = total_seconds / 3600
-                if total_hours >= target_hours and not goal.get('notified', False):
-                    if icon:
-                        icon.notify(
-                            f"🏆 Game {session.get('name', game_id)} has reached the target playtime of {target_hours} hours!",
-                            "Goal Reached"
-                        )
-                    goal['notified'] = True
-                    save_goals(goals)
-        
-        time.sleep(60)  # Check every minute
+            # Add current session time if game is running
+            if game_id in snapshot.running_games and 'start_time' in session:
+                current_session = (datetime.now() - session['start_time']).total_seconds()
+                total_seconds += current_session
+            
+            total_hours = total_seconds / 3600
+            if total_hours >= target_hours and not goal.get('notified', False):
+                if icon:
+                    icon.notify(
+                        f"🏆 Game {session.get('name', game_id)} has reached the target playtime of {target_hours} hours!",
+                        "Goal Reached"
+                    )
+                goal['notified'] = True
+                save_goals(goals)
 
 def load_goals():
     goals_file = os.path.join(PRESETS_DIR, 'goals.json')
     if os.path.exists(goals_file):
         try:
             with open(goals_file, 'r') as f:
-                return json.load(f)
+                return read_json(f)
         except:
             return []
     return []
@@ -1575,10 +2306,1399 @@ def load_goals():
 def save_goals(goals):
     goals_file = os.path.join(PRESETS_DIR, 'goals.json')
     with open(goals_file, 'w') as f:
-        json.dump(goals, f)
+        write_json(goals, f)
+    bump_resource('presets')
+
+class IdlerLifecycle:
+    """Structured lifecycle log of every idler process.
+
+    spawn_idler() records the launch, changes to the running games are picked up from
+    GameState, and a runtime job confirms that new idlers are running, notices idlers
+    that died without anyone looking and collects exit codes. An idler removed with
+    end_session() was stopped, one removed with drop_running() or replaced by set_pid()
+    had died, so it crashed, unless it exited with the code psutil terminates with.
+
+    Events are appended as JSON lines to LIFECYCLE_LOG_FILE, which is rotated by size.
+    """
+
+    TERMINATED_EXIT_CODE = 15  # psutil's terminate() on Windows, cmd /c passes it on
+
+    def __init__(self, path):
+        self.path = path
+        self.lock = threading.Lock()
+        self.file_lock = threading.Lock()
+        self.spawned = {}  # pid -> launch info, until the pid shows up in the running games
+        self.tracked = {}  # pid -> {'game_id', 'handle', 'created', 'requested', 'confirmed'}
+        self.exiting = {}  # pid -> (tracked entry, event, detected at)
+        self.changes = []  # Running games diffs queued by the GameState listener
+        self.last_running = {}
+
+    def record(self, event, game_id, **fields):
+        entry = {"ts": round(time.time(), 3), "event": event, "game_id": str(game_id)}
+        entry.update(fields)
+        line = json.dumps(entry) + '\n'
+        with self.file_lock:
+            try:
+                if os.path.exists(self.path) and os.path.getsize(self.path) + len(line) > LIFECYCLE_LOG_MAX_BYTES:
+                    self._rotate()
+                with open(self.path, 'a') as f:
+                    f.write(line)
+            except OSError as e:
+                print(f"Error writing idler lifecycle log: {e}")
+
+    def _rotate(self):
+        for index in range(LIFECYCLE_LOG_BACKUPS - 1, 0, -1):
+            older = f"{self.path}.{index}"
+            if os.path.exists(older):
+                os.replace(older, f"{self.path}.{index + 1}")
+        os.replace(self.path, f"{self.path}.1")
+
+    def spawn(self, game_id, reason, priority='normal'):
+        """Spawn an idler through the backend and record its launch"""
+        self.record('spawn_requested', game_id, reason=reason)
+        requested = time.monotonic()
+        try:
+            handle = backend.spawn_idler(IDLER_PATH, game_id, priority)
+        except Exception as e:
+            self.record('spawn_failed', game_id, reason=reason, error=str(e))
+            raise
+        launch_ms = round((time.monotonic() - requested) * 1000, 2)
+        with self.lock:
+            self.spawned[handle.pid] = {"game_id": game_id, "handle": handle, "requested": requested}
+        self.record('process_created', game_id, pid=handle.pid, reason=reason, launch_ms=launch_ms)
+        return handle
+
+    def on_state_change(self):
+        """GameState listener, runs under its lock so it only queues the diff"""
+        snapshot = game_state.snapshot()
+        running = snapshot.running_games
+        if running == self.last_running:
+            return
+        now = time.monotonic()
+        for game_id, pid in self.last_running.items():
+            if running.get(game_id) != pid:
+                session = snapshot.game_sessions.get(game_id) or {}
+                # end_session() closes the session, drop_running() and set_pid() leave it open
+                event = 'crashed' if 'start_time' in session else 'stopped'
+                self.changes.append(('removed', game_id, pid, event, now))
+        for game_id, pid in running.items():
+            if self.last_running.get(game_id) != pid:
+                self.changes.append(('added', game_id, pid, None, now))
+        self.last_running = running
+        runtime.trigger('idler_lifecycle')
+
+    def _apply_changes(self):
+        with game_state.lock:
+            changes, self.changes = self.changes, []
+        for change, game_id, pid, event, detected in changes:
+            if change == 'added':
+                with self.lock:
+                    launch = self.spawned.pop(pid, None)
+                    self.tracked[pid] = {
+                        "game_id": game_id,
+                        "handle": launch["handle"] if launch else None,
+                        "requested": launch["requested"] if launch else None,
+                        "created": time.time(),
+                        "confirmed": launch is None
+                    }
+                if launch is None:
+                    self.record('adopted', game_id, pid=pid)
+            else:
+                with self.lock:
+                    entry = self.tracked.pop(pid, None)
+                    if entry is not None:
+                        self.exiting[pid] = (entry, event, detected)
+
+    def _is_idling(self, pid):
+        process = backend.process(pid)
+        if process.name().lower() == 'steam-idle.exe':
+            return process.is_running()
+        return any(child.name().lower() == 'steam-idle.exe' for child in process.children())
+
+    def _exit_code(self, handle):
+        """Exit code of a finished idler we spawned, None for adopted ones"""
+        if handle is not None and hasattr(handle, 'poll'):
+            return handle.poll()
+        return None
+
+    def _has_exited(self, pid, handle):
+        if handle is not None and hasattr(handle, 'poll'):
+            return handle.poll() is not None
+        try:
+            return not backend.process(pid).is_running()
+        except (psutil.NoSuchProcess, psutil.AccessDenied):
+            return True
+
+    def check(self):
+        """Runtime job: confirm launches, notice dead idlers and log exits"""
+        self._apply_changes()
+        now = time.monotonic()
+        with self.lock:
+            tracked = list(self.tracked.items())
+            exiting = list(self.exiting.items())
+            # Spawns that never made it into the running games
+            for pid, launch in list(self.spawned.items()):
+                if now - launch["requested"] > LIFECYCLE_EXIT_TIMEOUT:
+                    del self.spawned[pid]
+
+        for pid, entry in tracked:
+            try:
+                idling = self._is_idling(pid)
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                idling = False
+            if idling:
+                if not entry["confirmed"]:
+                    entry["confirmed"] = True
+                    self.record('running', entry["game_id"], pid=pid,
+                                time_to_running_ms=round((now - entry["requested"]) * 1000, 2))
+                    # steam-idle.exe may have started after the profile was applied to the shell
+                    apply_launch_profile(pid, idler_profiles.get(entry["game_id"]))
+            elif self._has_exited(pid, entry["handle"]):
+                # Died while still listed as running
+                with self.lock:
+                    if self.tracked.pop(pid, None) is None:
+                        continue
+                    self.exiting[pid] = (entry, 'crashed', now)
+                exiting.append((pid, (entry, 'crashed', now)))
+
+        for pid, (entry, event, detected) in exiting:
+            handle = entry["handle"]
+            exited = self._has_exited(pid, handle)
+            if not exited and now - detected < LIFECYCLE_EXIT_TIMEOUT:
+                continue
+            with self.lock:
+                if self.exiting.pop(pid, None) is None:
+                    continue
+            fields = {"pid": pid, "uptime_s": round(time.time() - entry["created"], 1),
+                      "exit_code": self._exit_code(handle) if exited else None}
+            if fields["exit_code"] == self.TERMINATED_EXIT_CODE:
+                # Stopped by us, the shell went away before end_session() got to it
+                event = 'stopped'
+            if event == 'crashed' and not entry["confirmed"]:
+                fields["before_running"] = True
+            self.record(event, entry["game_id"], **fields)
+
+        with self.lock:
+            waiting = self.exiting or self.spawned or any(not e["confirmed"] for e in self.tracked.values())
+        return LIFECYCLE_FAST_INTERVAL if waiting else None
+
+    def read_events(self, since=None):
+        """Logged events, oldest first, including the rotated files"""
+        paths = [f"{self.path}.{index}" for index in range(LIFECYCLE_LOG_BACKUPS, 0, -1)] + [self.path]
+        events = []
+        with self.file_lock:
+            for path in paths:
+                if not os.path.exists(path):
+                    continue
+                with open(path, 'r') as f:
+                    for line in f:
+                        try:
+                            event = json.loads(line)
+                        except ValueError:
+                            continue
+                        if since is None or event.get('ts', 0) >= since:
+                            events.append(event)
+        return events
+
+idler_lifecycle = IdlerLifecycle(LIFECYCLE_LOG_FILE)
+game_state.subscribe(idler_lifecycle.on_state_change)
+
+idler_profiles = {}  # game_id -> launch profile its idler was started with
+
+def normalize_launch_profile(profile):
+    """Validate a launch profile, affinity may be a list of CPU indexes or a bit mask"""
+    priority = profile.get('priority') or 'normal'
+    if priority not in backends.PRIORITIES:
+        raise ValueError(f"priority must be one of {', '.join(backends.PRIORITIES)}")
+    io_priority = profile.get('io_priority') or None
+    if io_priority is not None and io_priority not in backends.IO_PRIORITIES:
+        raise ValueError(f"io_priority must be one of {', '.join(backends.IO_PRIORITIES)}")
+
+    affinity = profile.get('affinity')
+    if isinstance(affinity, str):
+        affinity = int(affinity, 0) if affinity.strip() else None
+    if isinstance(affinity, int) and not isinstance(affinity, bool):
+        affinity = [cpu for cpu in range(affinity.bit_length()) if affinity >> cpu & 1]
+    if affinity:
+        cpu_count = psutil.cpu_count() or 1
+        affinity = sorted({int(cpu) for cpu in affinity})
+        if affinity[0] < 0 or affinity[-1] >= cpu_count:
+            raise ValueError(f"affinity CPUs must be between 0 and {cpu_count - 1}")
+    return {"priority": priority, "affinity": affinity or None, "io_priority": io_priority}
+
+def apply_launch_profile(pid, profile):
+    """Apply a launch profile to an idler and its child processes"""
+    if not profile or profile == DEFAULT_LAUNCH_PROFILE:
+        return
+    try:
+        process = backend.process(pid)
+        targets = [process] + process.children(recursive=True)
+    except (psutil.NoSuchProcess, psutil.AccessDenied):
+        return
+    for target in targets:
+        try:
+            target.nice(backends.priority_value(profile['priority']))
+            if profile['affinity']:
+                target.cpu_affinity(profile['affinity'])
+            if profile['io_priority']:
+                target.ionice(*backends.io_priority_args(profile['io_priority']))
+        except (psutil.NoSuchProcess, psutil.AccessDenied):
+            continue
+        except (AttributeError, NotImplementedError, ValueError) as e:
+            print(f"Error applying launch profile to PID {target.pid}: {e}")
+
+def load_preset_launch_profiles():
+    if os.path.exists(LAUNCH_PROFILES_FILE):
+        try:
+            with open(LAUNCH_PROFILES_FILE, 'r') as f:
+                return read_json(f)
+        except Exception as e:
+            print(f"Error loading launch profiles: {e}")
+    return {}
+
+def save_preset_launch_profiles(profiles):
+    with open(LAUNCH_PROFILES_FILE, 'w') as f:
+        write_json(profiles, f)
+    bump_resource('presets')
+
+def get_preset_launch_profile(preset_name):
+    """The preset's own launch profile, or the global one"""
+    profile = load_preset_launch_profiles().get(preset_name)
+    return dict(DEFAULT_LAUNCH_PROFILE, **profile) if profile else LAUNCH_PROFILE
+
+def spawn_idler(game_id, reason, profile=None):
+    """Start steam-idle.exe for a game with a launch profile, logging the launch in the lifecycle log.
+    Restarts keep the profile the game was started with, other launches default to the global one"""
+    if profile is None:
+        if reason in ('restart', 'recycle') and game_id in idler_profiles:
+            profile = idler_profiles[game_id]
+        else:
+            profile = LAUNCH_PROFILE
+    process = idler_lifecycle.spawn(game_id, reason, profile['priority'])
+    idler_profiles[game_id] = profile
+    apply_launch_profile(process.pid, profile)
+    return process
+
+def percentiles(values, points=(50, 95, 99)):
+    """Nearest-rank percentiles, {'p50': ...}, empty for no values"""
+    if not values:
+        return {}
+    ordered = sorted(values)
+    return {f"p{point}": ordered[min(len(ordered) - 1, max(0, -(-point * len(ordered) // 100) - 1))]
+            for point in points}
+
+def lifecycle_aggregates(events):
+    """Launch latency percentiles, crash rates and mean time between failures per game"""
+    launch_ms = []
+    running_ms = []
+    games = {}
+    for event in events:
+        kind = event.get('event')
+        game = games.setdefault(event.get('game_id'), {
+            "spawns": 0, "spawn_failures": 0, "crashes": 0, "stops": 0, "restarts": 0,
+            "recycles": 0, "throttles": 0, "sheds": 0, "uptime_s": 0.0
+        })
+        if kind == 'process_created':
+            game["spawns"] += 1
+            launch_ms.append(event.get('launch_ms', 0))
+        elif kind == 'spawn_failed':
+            game["spawn_failures"] += 1
+        elif kind == 'running':
+            running_ms.append(event.get('time_to_running_ms', 0))
+        elif kind == 'crashed':
+            game["crashes"] += 1
+            game["uptime_s"] += event.get('uptime_s', 0)
+        elif kind == 'stopped':
+            game["stops"] += 1
+            game["uptime_s"] += event.get('uptime_s', 0)
+        elif kind == 'restart':
+            game["restarts"] += 1
+        elif kind in ('recycle', 'throttle', 'shed'):
+            game[kind + 's'] += 1
+
+    per_game = {}
+    for game_id, game in games.items():
+        runs = game["crashes"] + game["stops"]
+        game["crash_rate"] = round(game["crashes"] / runs, 3) if runs else 0.0
+        game["mtbf_s"] = round(game["uptime_s"] / game["crashes"], 1) if game["crashes"] else None
+        game["uptime_s"] = round(game["uptime_s"], 1)
+        per_game[game_id] = game
+
+    return {
+        "events": len(events),
+        "launch_latency_ms": percentiles(launch_ms),
+        "time_to_running_ms": percentiles(running_ms),
+        "games": per_game
+    }
+
+class RingBuffer:
+    """Fixed-size array-backed series, the oldest sample is overwritten once it's full"""
+
+    __slots__ = ('data', 'size', 'start', 'count')
+
+    def __init__(self, typecode, size):
+        self.data = array(typecode, [0]) * size
+        self.size = size
+        self.start = 0
+        self.count = 0
+
+    def append(self, value):
+        self.data[(self.start + self.count) % self.size] = value
+        if self.count < self.size:
+            self.count += 1
+        else:
+            self.start = (self.start + 1) % self.size
+
+    def latest(self):
+        return self.data[(self.start + self.count - 1) % self.size] if self.count else None
+
+    def values(self, last=None):
+        """The last `last` samples (all by default), oldest first"""
+        count = self.count if last is None else max(0, min(last, self.count))
+        begin = self.start + self.count - count
+        return [self.data[(begin + i) % self.size] for i in range(count)]
+
+class ResourceSampler:
+    """Samples CPU, memory, handles and threads of every idler and its child processes.
+
+    Idlers are launched through the shell, so each game's usage is the sum over the tracked
+    PID and its descendants, found with one process walk per sample. psutil.Process objects
+    are kept between samples since cpu_percent() measures from the previous call. Each game
+    gets a ring buffer per field, and buffers of games that stopped are dropped, so memory
+    is bounded by the number of running games.
+    """
+
+    # Field -> array typecode: CPU percent of one core, RSS in bytes, open handles, threads
+    FIELDS = (('cpu', 'f'), ('rss', 'd'), ('handles', 'I'), ('threads', 'I'))
+
+    def __init__(self, size=RESOURCE_HISTORY_SIZE):
+        self.size = size
+        self.lock = threading.Lock()
+        self.series = {}  # game_id -> {'ts': RingBuffer, field: RingBuffer}
+        self.total = None  # Sum over all idlers, same layout
+        self.processes = {}  # pid -> psutil.Process reused across samples
+
+    def _new_series(self):
+        series = {'ts': RingBuffer('d', self.size)}
+        for field, typecode in self.FIELDS:
+            series[field] = RingBuffer(typecode, self.size)
+        return series
+
+    def _process(self, pid):
+        process = self.processes.get(pid)
+        if process is None:
+            process = self.processes[pid] = backend.process(pid)
+        return process
+
+    @staticmethod
+    def _handles(process):
+        if hasattr(process, 'num_handles'):
+            return process.num_handles()
+        if hasattr(process, 'num_fds'):
+            return process.num_fds()
+        return 0
+
+    def _usage(self, pids):
+        usage = {field: 0 for field, _ in self.FIELDS}
+        for pid in pids:
+            try:
+                process = self._process(pid)
+                with process.oneshot():
+                    usage['cpu'] += process.cpu_percent(None)
+                    usage['rss'] += process.memory_info().rss
+                    usage['threads'] += process.num_threads()
+                    usage['handles'] += self._handles(process)
+            except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
+                self.processes.pop(pid, None)
+        return usage
+
+    def sample(self):
+        running = get_running_games()
+        if not running and not self.series and self.total is None:
+            return
+        # One walk over the process list to find the children of every idler
+        children = {}
+        if running:
+            with process_scan('resources'):
+                for process in backend.process_iter(['pid', 'ppid']):
+                    children.setdefault(process.info.get('ppid'), []).append(process.info['pid'])
+
+        now = time.time()
+        sampled = {}
+        seen = set()
+        for game_id, pid in running.items():
+            pids = [pid]
+            for parent in pids:
+                pids.extend(children.get(parent, ()))
+            seen.update(pids)
+            sampled[game_id] = self._usage(pids)
+
+        with self.lock:
+            for game_id in list(self.series):
+                if game_id not in sampled:
+                    del self.series[game_id]
+            totals = {field: 0 for field, _ in self.FIELDS}
+            for game_id, usage in sampled.items():
+                series = self.series.get(game_id)
+                if series is None:
+                    series = self.series[game_id] = self._new_series()
+                series['ts'].append(now)
+                for field, _ in self.FIELDS:
+                    series[field].append(usage[field])
+                    totals[field] += usage[field]
+            if not sampled:
+                self.total = None
+            else:
+                if self.total is None:
+                    self.total = self._new_series()
+                self.total['ts'].append(now)
+                for field, _ in self.FIELDS:
+                    self.total[field].append(totals[field])
+        for pid in list(self.processes):
+            if pid not in seen:
+                del self.processes[pid]
+
+    def recent(self, game_id, seconds, since=None):
+        """Samples of a game from the last `seconds` (and after `since`), {'ts': [...], field: [...]}"""
+        cutoff = time.time() - seconds
+        if since is not None:
+            cutoff = max(cutoff, since)
+        with self.lock:
+            series = self.series.get(game_id)
+            if series is None:
+                return None
+            timestamps = series['ts'].values()
+            start = bisect.bisect_right(timestamps, cutoff)
+            count = len(timestamps) - start
+            window = {name: buffer.values(count) for name, buffer in series.items()}
+        return window
+
+    def latest(self):
+        """{game_id: {field: value}} of the last sample"""
+        with self.lock:
+            return {game_id: {field: series[field].latest() for field, _ in self.FIELDS}
+                    for game_id, series in self.series.items()}
+
+    def _export(self, series, points):
+        history = {name: buffer.values(points) for name, buffer in series.items()}
+        history['cpu'] = [round(value, 1) for value in history['cpu']]
+        history['ts'] = [round(value, 1) for value in history['ts']]
+        latest = {field: history[field][-1] if history[field] else 0 for field, _ in self.FIELDS}
+        return {"latest": latest, "history": history}
+
+    def export(self, points=None):
+        """{'games': {game_id: {'latest', 'history'}}, 'total': ...} with the last `points` samples"""
+        with self.lock:
+            games = {game_id: self._export(series, points) for game_id, series in self.series.items()}
+            total = self._export(self.total, points) if self.total is not None else None
+        return {"games": games, "total": total}
+
+resource_sampler = ResourceSampler()
+
+class ResourceGuardrails:
+    """Applies the guardrail policy to the sampled idler usage after every sample.
+
+    A leaking idler (over max_rss_mb, or growing steadily by growth_mb over growth_minutes)
+    is recycled: its session is closed with end_session() so the playtime so far is added
+    to the total, and a new idler opens a new session. One stuck above max_cpu_percent for
+    cpu_minutes is throttled to idle priority or recycled. While all idlers together use
+    more than max_total_rss_mb, games are stopped, plain ones before ones with a playtime
+    goal and favorites last, the biggest first within each group.
+    """
+
+    def __init__(self, sampler):
+        self.sampler = sampler
+        self.recycled = {}  # game_id -> time.time() of the last recycle
+        self.throttled = set()  # PIDs already dropped to idle priority
+
+    def _leak_reason(self, game_id, policy, since):
+        window_seconds = max(policy['growth_minutes'], 0) * 60
+        samples = self.sampler.recent(game_id, max(window_seconds, RESOURCE_SAMPLE_INTERVAL), since)
+        if not samples or not samples['rss']:
+            return None
+        rss = samples['rss']
+        max_rss = policy['max_rss_mb'] * 1024 * 1024
+        if max_rss and rss[-1] > max_rss:
+            return f"memory {rss[-1] / 1048576:.0f} MB above {policy['max_rss_mb']} MB"
+        growth = policy['growth_mb'] * 1024 * 1024
+        # The window must be (nearly) covered before growth counts as steady
+        needed = window_seconds // RESOURCE_SAMPLE_INTERVAL
+        if growth and window_seconds and len(rss) >= needed > 1 and rss[-1] - rss[0] >= growth:
+            steps = sum(1 for previous, current in zip(rss, rss[1:]) if current >= previous)
+            if steps >= GUARDRAIL_STEADY_FRACTION * (len(rss) - 1):
+                return (f"memory grew {(rss[-1] - rss[0]) / 1048576:.0f} MB "
+                        f"in {policy['growth_minutes']} minutes")
+        return None
+
+    def _cpu_stuck(self, game_id, policy, since):
+        if not policy['max_cpu_percent'] or policy['cpu_minutes'] <= 0:
+            return False
+        window_seconds = policy['cpu_minutes'] * 60
+        samples = self.sampler.recent(game_id, window_seconds, since)
+        if not samples:
+            return False
+        cpu = samples['cpu']
+        return len(cpu) >= window_seconds // RESOURCE_SAMPLE_INTERVAL and min(cpu) > policy['max_cpu_percent']
+
+    def recycle(self, game_id, reason):
+        """Restart an idler, its playtime so far is kept and a new session starts"""
+        snapshot = game_state.snapshot()
+        old_pid = snapshot.running_games.get(game_id)
+        name = (snapshot.game_sessions.get(game_id) or {}).get('name', game_id)
+        self.recycled[game_id] = time.time()
+        idler_lifecycle.record('recycle', game_id, pid=old_pid, reason=reason)
+        if terminate_idler(game_id) == 'failed':
+            # Still running, don't start a second idler next to it
+            return
+        try:
+            launch_idler(game_id, reason='recycle')
+        except Exception as e:
+            print(f"Error relaunching {game_id} after recycling it: {e}")
+        save_statistics()
+        save_recent_action(f"♻️ Recycled {name}: {reason}")
+        if icon:
+            icon.notify(f"♻️ Restarted {name} ({reason})", "Resource Guardrails")
+
+    def throttle(self, game_id, pid):
+        """Drop an idler and its children to idle priority"""
+        priority = backends.priority_value('idle')
+        try:
+            process = backend.process(pid)
+            for target in [process] + process.children(recursive=True):
+                target.nice(priority)
+        except (psutil.NoSuchProcess, psutil.AccessDenied) as e:
+            print(f"Error throttling {game_id}: {e}")
+            return
+        self.throttled.add(pid)
+        idler_lifecycle.record('throttle', game_id, pid=pid)
+        name = (game_state.snapshot().game_sessions.get(game_id) or {}).get('name', game_id)
+        save_recent_action(f"🐢 Throttled {name}: stuck above {GUARDRAILS['max_cpu_percent']}% CPU")
+
+    def _shed_order(self, candidates, usage):
+        favorites = {str(game['id']) for game in load_game_favorites().get('favorites', [])}
+        goals = {str(goal['game_id']) for goal in load_goals()}
+        def priority(game_id):
+            return (2 if game_id in favorites else 1 if game_id in goals else 0, -usage[game_id]['rss'])
+        return sorted(candidates, key=priority)
+
+    def shed(self, policy, skip=()):
+        """Stop games until the idlers' total memory is back under the cap.
+        Games in `skip` were just recycled, their last sample is from the old idler"""
+        cap = policy['max_total_rss_mb'] * 1024 * 1024
+        running = get_running_games()
+        usage = {game_id: values for game_id, values in self.sampler.latest().items()
+                 if game_id in running and game_id not in skip and values['rss'] is not None}
+        total = sum(values['rss'] for values in usage.values())
+        if total <= cap:
+            return
+        stopped = []
+        candidates = self._shed_order(list(usage), usage)
+        while total > cap and candidates:
+            # Pick just enough games to get under the cap and stop them together, only the
+            # ones that actually stopped count, so go round again while still over
+            batch = []
+            excess = total - cap
+            while candidates and excess > 0:
+                game_id = candidates.pop(0)
+                batch.append(game_id)
+                excess -= usage[game_id]['rss']
+                idler_lifecycle.record('shed', game_id, pid=running.get(game_id),
+                                       rss_mb=round(usage[game_id]['rss'] / 1048576, 1))
+            for game_id in stopped_game_ids(terminate_idlers(batch, save=False)):
+                total -= usage[game_id]['rss']
+                stopped.append(game_id)
+        if stopped:
+            save_statistics()
+            update_tray_menu()
+            save_recent_action(f"🧯 Stopped {len(stopped)} games to stay under {policy['max_total_rss_mb']} MB")
+            if icon:
+                icon.notify(f"🧯 Stopped {len(stopped)} games, idlers were using too much memory",
+                            "Resource Guardrails")
+
+    def check(self, policy):
+        now = time.time()
+        running = get_running_games()
+        self.throttled &= set(running.values())
+        for game_id in [game_id for game_id in self.recycled if game_id not in running]:
+            del self.recycled[game_id]
+        recycled = set()
+        for game_id, pid in running.items():
+            since = self.recycled.get(game_id)
+            if since is not None and now - since < GUARDRAIL_COOLDOWN:
+                continue
+            reason = self._leak_reason(game_id, policy, since)
+            if not reason and self._cpu_stuck(game_id, policy, since):
+                if policy['cpu_action'] == 'restart':
+                    reason = f"CPU above {policy['max_cpu_percent']}% for {policy['cpu_minutes']} minutes"
+                elif pid not in self.throttled:
+                    self.throttle(game_id, pid)
+            if reason:
+                self.recycle(game_id, reason)
+                recycled.add(game_id)
+        if policy['max_total_rss_mb']:
+            self.shed(policy, recycled)
+
+resource_guardrails = ResourceGuardrails(resource_sampler)
+
+def normalize_guardrails(policy):
+    """Validate a guardrail policy, its time windows must fit in the sampled history"""
+    normalized = {}
+    for key, default in DEFAULT_GUARDRAILS.items():
+        value = policy[key]
+        if isinstance(default, bool):
+            if not isinstance(value, bool):
+                raise ValueError(f"{key} must be true or false")
+        elif isinstance(default, (int, float)):
+            if isinstance(value, bool) or not isinstance(value, (int, float)) or not math.isfinite(value) or value < 0:
+                raise ValueError(f"{key} must be a number of at least 0")
+            value = type(default)(value)
+        normalized[key] = value
+    if normalized['cpu_action'] not in ('throttle', 'restart'):
+        raise ValueError("cpu_action must be throttle or restart")
+    for key in ('growth_minutes', 'cpu_minutes'):
+        if normalized[key] > GUARDRAIL_MAX_MINUTES:
+            raise ValueError(f"{key} must be at most {GUARDRAIL_MAX_MINUTES}, the length of the resource history")
+    return normalized
+
+def sample_resources():
+    """Runtime job: sample the idlers, then have the guardrails job enforce the policy"""
+    resource_sampler.sample()
+    if GUARDRAILS and GUARDRAILS.get('enabled'):
+        # Its own job, stopping idlers takes seconds and must not leave gaps in the samples
+        runtime.trigger('guardrails')
+
+def enforce_guardrails():
+    """Runtime job: recycle, throttle or shed idlers according to the guardrail policy"""
+    if GUARDRAILS and GUARDRAILS.get('enabled'):
+        resource_guardrails.check(GUARDRAILS)
+
+@app.route('/api/resources')
+def idler_resources():
+    """CPU, memory, handle and thread history of the running idlers, `points` limits the history"""
+    try:
+        points = request.args.get('points', type=int)
+        data = resource_sampler.export(points)
+        data.update({"status": "success", "interval": RESOURCE_SAMPLE_INTERVAL, "size": RESOURCE_HISTORY_SIZE})
+        return jsonify(data)
+    except Exception as e:
+        return jsonify({"status": "error", "message": str(e)}), 500
+
+@app.route('/api/idlers/lifecycle')
+def idler_lifecycle_stats():
+    """Lifecycle aggregates over the last `hours` (default: the whole log) and the most recent events"""
+    try:
+        hours = request.args.get('hours', type=float)
+        game_id = request.args.get('game_id')
+        limit = request.args.get('limit', 50, type=int)
+        since = time.time() - hours * 3600 if hours else None
+        events = idler_lifecycle.read_events(since)
+        if game_id:
+            events = [event for event in events if event.get('game_id') == game_id]
+        return jsonify({
+            "status": "success",
+            "aggregates": lifecycle_aggregates(events),
+            "recent": events[-limit:][::-1] if limit > 0 else []
+        })
+    except Exception as e:
+        return jsonify({"status": "error", "message": str(e)}), 500
+
+def launch_idler(game_id, name=None, image=None, reason='launch'):
+    """Spawn steam-idle.exe for a game and open its session, returns the PID"""
+    if name is None and game_id not in game_state.snapshot().game_sessions:
+        game_info = fetch_game_info(game_id)
+        name = game_info.get('name', f'Game {game_id}')
+        image = game_info.get('image', '')
+    process = spawn_idler(game_id, reason)
+    game_state.start_session(game_id, process.pid, name, image)
+    return process.pid
+
+def terminate_process_trees(pids):
+    """Terminate several processes and their children at once, wait for all of them together
+    and kill whatever is left after IDLER_TERMINATE_TIMEOUT.
+    Returns {pid: "stopped" | "killed" | "alive"} for each tree"""
+    trees = {}
+    for pid in pids:
+        try:
+            process = backend.process(pid)
+        except (psutil.NoSuchProcess, psutil.AccessDenied):
+            trees[pid] = []
+            continue
+        try:
+            trees[pid] = process.children(recursive=True) + [process]
+        except (psutil.NoSuchProcess, psutil.AccessDenied):
+            trees[pid] = [process]
+    targets = [target for tree in trees.values() for target in tree]
+
+    for target in targets:
+        try:
+            target.terminate()
+        except psutil.NoSuchProcess:
+            pass
+        except psutil.AccessDenied as e:
+            print(f"Error terminating process {target.pid}: {e}")
+    with request_phases.phase('process'):
+        _, alive = backend.wait_procs(targets, timeout=IDLER_TERMINATE_TIMEOUT)
+
+    killed = set()
+    if alive:
+        for target in alive:
+            try:
+                target.kill()
+                killed.add(target.pid)
+            except psutil.NoSuchProcess:
+                pass
+            except psutil.AccessDenied as e:
+                print(f"Error killing process {target.pid}: {e}")
+        with request_phases.phase('process'):
+            _, alive = backend.wait_procs(alive, timeout=IDLER_KILL_TIMEOUT)
+    survivors = {target.pid for target in alive}
+
+    outcomes = {}
+    for pid, tree in trees.items():
+        tree_pids = {target.pid for target in tree}
+        outcome = 'alive' if tree_pids & survivors else 'killed' if tree_pids & killed else 'stopped'
+        idler_terminations.inc(outcome=outcome)
+        outcomes[pid] = outcome
+    return outcomes
+
+def terminate_idler(game_id):
+    """Terminate a running idler and add its current session to the total playtime.
+    Returns "stopped", "killed", "failed" or "not_running", see terminate_idlers()"""
+    return terminate_idlers([game_id], save=False)[str(game_id)]['status']
+
+def launch_idlers(games, reason, profile=None, retries=0):
+    """Start idlers for a batch of games ({'id', 'name', 'image'} dicts, name and image are
+    fetched when missing) in parallel, then save the statistics once. With retries, the
+    started idlers are checked after a moment and the ones that died are spawned again.
+    Returns {game_id: {"status": "started" | "running" | "failed", "pid" or "message"}}"""
+    games = {str(game['id']): game for game in games}
+    running_games = get_running_games()
+    results = {game_id: {"status": "running"} for game_id in games if game_id in running_games}
+    pending = [game_id for game_id in games if game_id not in running_games]
+
+    def launch(game_id, attempt_reason):
+        game = games[game_id]
+        name, image = game.get('name'), game.get('image')
+        if name is None and game_id not in game_state.snapshot().game_sessions:
+            game_info = fetch_game_info(game_id)
+            name, image = game_info.get('name', f'Game {game_id}'), game_info.get('image', '')
+        process = spawn_idler(game_id, attempt_reason, profile)
+        game_state.start_session(game_id, process.pid, name, image)
+        return process.pid
+
+    attempt_reason = reason
+    for attempt in range(retries + 1):
+        if not pending:
+            break
+        with ThreadPoolExecutor(max_workers=IDLER_SPAWN_WORKERS) as pool:
+            futures = {game_id: pool.submit(launch, game_id, attempt_reason) for game_id in pending}
+        for game_id, future in futures.items():
+            try:
+                results[game_id] = {"status": "started", "pid": future.result()}
+            except Exception as e:
+                print(f"Failed to start game {game_id}: {e}")
+                results[game_id] = {"status": "failed", "message": str(e)}
+        if not retries:
+            break
+
+        # Wait a moment for the processes to initialize, then retry the ones that died. A
+        # failed spawn keeps its own error and is retried as is
+        started = [game_id for game_id in futures if results[game_id]['status'] == 'started']
+        pending = [game_id for game_id in futures if results[game_id]['status'] != 'started']
+        if started:
+            time.sleep(2)
+        running_games = get_running_games()
+        for game_id in started:
+            try:
+                if game_id in running_games and backend.process(running_games[game_id]).is_running():
+                    continue
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                pass
+            game_state.drop_running(game_id)
+            results[game_id] = {"status": "failed", "message": "Idler exited right after starting"}
+            pending.append(game_id)
+        if pending and attempt < retries:
+            print(f"Retrying {len(pending)} failed games (attempt {attempt + 2})")
+        attempt_reason = f"{reason}_retry"
+
+    save_statistics()
+    update_tray_menu()
+    return results
+
+def terminate_idlers(game_ids, save=True):
+    """Terminate the idlers of a batch of games together, see terminate_process_trees().
+    Sessions are closed first so the exits are logged as stops. An idler that outlives
+    kill() is tracked again rather than forgotten while it keeps running.
+    Returns {game_id: {"status": "stopped" | "killed" | "failed" | "not_running"}}"""
+    pids = {}
+    results = {}
+    for game_id in map(str, game_ids):
+        pid = game_state.end_session(game_id)
+        if pid is None:
+            results[game_id] = {"status": "not_running"}
+        else:
+            pids[game_id] = pid
+
+    outcomes = terminate_process_trees(list(pids.values()))
+    for game_id, pid in pids.items():
+        outcome = outcomes[pid]
+        if outcome == 'alive':
+            print(f"Idler of {game_id} (PID {pid}) survived kill(), still tracking it")
+            game_state.start_session(game_id, pid)
+            outcome = 'failed'
+        results[game_id] = {"status": outcome}
+
+    if save and pids:
+        save_statistics()
+        update_tray_menu()
+    return results
+
+def stopped_game_ids(results):
+    """Games that terminate_idlers() actually stopped"""
+    return [game_id for game_id, result in results.items() if result['status'] in ('stopped', 'killed')]
+
+def get_game_total_seconds(game_id):
+    """Get the total playtime of a game including its current session"""
+    snapshot = game_state.snapshot()
+    session = snapshot.game_sessions.get(game_id)
+    if not session:
+        return 0
+    total_seconds = session.get('total_time', 0)
+    if game_id in snapshot.running_games and 'start_time' in session:
+        total_seconds += (datetime.now() - session['start_time']).total_seconds()
+    return total_seconds
+
+def default_rotation():
+    return {
+        "enabled": False,
+        "source": None,
+        "queue": [],
+        "position": 0,
+        "cycles": 0,
+        "completed": 0,
+        "slots": MAX_IDLE_SLOTS,
+        "slice_minutes": DEFAULT_ROTATION_SLICE_MINUTES,
+        "active": {}
+    }
+
+def load_rotation():
+    """Load the persisted rotation progress"""
+    rotation = default_rotation()
+    if os.path.exists(ROTATION_FILE):
+        try:
+            with open(ROTATION_FILE, 'r') as f:
+                rotation.update(read_json(f))
+        except Exception as e:
+            print(f"Error loading rotation: {e}")
+    return rotation
+
+def save_rotation():
+    try:
+        with open(ROTATION_FILE, 'w') as f:
+            write_json(rotation_state, f)
+    except Exception as e:
+        print(f"Error saving rotation: {e}")
+
+# Rotation progress survives restarts, the scheduler thread sleeps until the next slice ends
+rotation_state = load_rotation()
+rotation_lock = threading.Lock()
+
+def get_rotation_target(game_id, goal_hours):
+    """Get how long a game should idle in its slot, or None if its goal is already reached.
+    Games with a playtime goal only idle for what is left of it, capped at the slice length."""
+    slice_seconds = rotation_state['slice_minutes'] * 60
+    if game_id not in goal_hours:
+        return slice_seconds
+    remaining = goal_hours[game_id] * 3600 - get_game_total_seconds(game_id)
+    if remaining <= 0:
+        return None
+    return min(slice_seconds, remaining)
+
+def checkpoint_rotation_entry(entry, now):
+    """Fold the time since the last checkpoint into the slot's elapsed time"""
+    started_at = datetime.fromisoformat(entry['started_at'])
+    entry['elapsed'] += max(0, (now - started_at).total_seconds())
+    entry['started_at'] = now.isoformat()
+
+def rotation_tick():
+    """Swap finished games for the next ones in the queue.
+    Returns the number of seconds until the next slot is due, or None when rotation is off."""
+    with rotation_lock:
+        if not rotation_state['enabled'] or not rotation_state['queue']:
+            return None
+
+        now = datetime.now()
+        active = rotation_state['active']
+        changed = False
+
+        # Retire games whose slice is done, or that were stopped outside of the rotation
+        finished = []
+        for game_id in list(active.keys()):
+            entry = active[game_id]
+            if game_id not in get_running_games():
+                del active[game_id]
+                changed = True
+                continue
+            checkpoint_rotation_entry(entry, now)
+            if entry['elapsed'] >= entry['target_seconds']:
+                finished.append(game_id)
+        if finished:
+            # An idler that outlives kill() keeps its slot and is retried on the next tick
+            for game_id in stopped_game_ids(terminate_idlers(finished, save=False)):
+                del active[game_id]
+                rotation_state['completed'] += 1
+                changed = True
+
+        if not is_steam_running():
+            save_rotation()
+            return ROTATION_RETRY_INTERVAL
+
+        # Fill every free slot straight away so there are no idle gaps
+        goal_hours = {}
+        for goal in load_goals():
+            goal_hours[str(goal['game_id'])] = float(goal['target_hours'])
+
+        queue = rotation_state['queue']
+        outside_games = len([g for g in get_running_games() if g not in active])
+        free_slots = rotation_state['slots'] - len(active) - outside_games
+        checked = 0
+        batch = []
+        targets = {}
+        while free_slots > 0 and checked < len(queue):
+            if rotation_state['position'] >= len(queue):
+                rotation_state['position'] = 0
+                rotation_state['cycles'] += 1
+            game = queue[rotation_state['position']]
+            rotation_state['position'] += 1
+            checked += 1
+
+            game_id = str(game['id'])
+            if game_id in get_running_games():
+                continue
+            target_seconds = get_rotation_target(game_id, goal_hours)
+            if target_seconds is None:
+                continue
+            batch.append({"id": game_id, "name": game.get('name'), "image": game.get('image')})
+            targets[game_id] = target_seconds
+            free_slots -= 1
+
+        # Start the whole refill together, a game that failed to start leaves its slot free
+        if batch:
+            for game_id, result in launch_idlers(batch, 'rotation').items():
+                if result['status'] != 'started':
+                    print(f"Failed to start game {game_id} in rotation: {result.get('message')}")
+                    continue
+                active[game_id] = {
+                    "target_seconds": targets[game_id],
+                    "elapsed": 0,
+                    "started_at": now.isoformat()
+                }
+                changed = True
+
+        if active:
+            next_due = min(entry['target_seconds'] - entry['elapsed'] for entry in active.values())
+            delay = max(1, min(next_due, ROTATION_CHECKPOINT_INTERVAL))
+        elif any(get_rotation_target(str(g['id']), goal_hours) is not None for g in queue):
+            # No free slot right now, or the remaining games are running outside the rotation
+            delay = ROTATION_RETRY_INTERVAL
+        else:
+            # Every game in the queue has reached its goal
+            rotation_state['enabled'] = False
+            delay = None
+        save_rotation()
+
+    if delay is None:
+        save_recent_action("🔁 Rotation finished - all goals reached")
+        if icon:
+            icon.notify("🏆 All games in the rotation reached their goals", "Rotation Finished")
+
+    if changed:
+        save_statistics()
+        update_tray_menu()
+
+    return delay
+
+def run_rotation():
+    """Background job for the rotation, returns when it should run again"""
+    try:
+        return rotation_tick()
+    except Exception as e:
+        print(f"Error in rotation: {e}")
+        return ROTATION_RETRY_INTERVAL
+
+def resume_rotation():
+    """Relaunch the active rotation slots that were not adopted after a restart"""
+    with rotation_lock:
+        if not rotation_state['enabled']:
+            return
+        now = datetime.now()
+        queue_games = {str(g['id']): g for g in rotation_state['queue']}
+        batch = []
+        for game_id in rotation_state['active']:
+            if game_id in get_running_games():
+                continue
+            game = queue_games.get(game_id, {})
+            batch.append({"id": game_id, "name": game.get('name'), "image": game.get('image')})
+        for game_id, result in (launch_idlers(batch, 'rotation') if batch else {}).items():
+            if result['status'] == 'started':
+                rotation_state['active'][game_id]['started_at'] = now.isoformat()
+            else:
+                print(f"Failed to resume game {game_id} in rotation: {result.get('message')}")
+        save_rotation()
+    runtime.trigger('rotation')
+
+def stop_rotation(stop_games=True):
+    """Turn rotation off, optionally stopping the games it started"""
+    with rotation_lock:
+        if stop_games:
+            terminate_idlers(list(rotation_state['active'].keys()), save=False)
+        rotation_state['enabled'] = False
+        rotation_state['active'] = {}
+        save_rotation()
+    if stop_games:
+        save_statistics()
+    runtime.trigger('rotation')
+
+@app.route('/api/rotation', methods=['GET', 'POST', 'DELETE'])
+def manage_rotation():
+    if request.method == 'GET':
+        with rotation_lock:
+            now = datetime.now()
+            queue_games = {str(g['id']): g for g in rotation_state['queue']}
+            active = []
+            for game_id, entry in rotation_state['active'].items():
+                started_at = datetime.fromisoformat(entry['started_at'])
+                elapsed = entry['elapsed'] + max(0, (now - started_at).total_seconds())
+                remaining = max(0, entry['target_seconds'] - elapsed)
+                name = game_state.snapshot().game_sessions.get(game_id, {}).get('name') or queue_games.get(game_id, {}).get('name')
+                active.append({
+                    "id": game_id,
+                    "name": name or f'Game {game_id}',
+                    "remaining": format_duration(remaining),
+                    "remaining_seconds": remaining
+                })
+            return jsonify({
+                "enabled": rotation_state['enabled'],
+                "source": rotation_state['source'],
+                "slots": rotation_state['slots'],
+                "slice_minutes": rotation_state['slice_minutes'],
+                "queue_size": len(rotation_state['queue']),
+                "position": rotation_state['position'],
+                "cycles": rotation_state['cycles'],
+                "completed": rotation_state['completed'],
+                "active": active
+            })
+
+    elif request.method == 'POST':
+        data = request.get_json()
+        preset_name = data.get('presetName')
+
+        if preset_name:
+            json_path = os.path.join(PRESETS_DIR, f"{preset_name}.json")
+            if not os.path.exists(json_path):
+                return jsonify({"status": "error", "message": "❌ Preset not found"}), 404
+            with open(json_path, 'r') as f:
+                queue = read_json(f)
+            source = preset_name
+        else:
+            # Game IDs picked from the Steam library, names are fetched when each game gets a slot
+            queue = [{"id": str(game_id)} for game_id in data.get('gameIds', [])]
+            source = "Steam Library"
+
+        if not queue:
+            return jsonify({"status": "error", "message": "🚫 No games to rotate"}), 400
+
+        steam_status = check_steam_status()
+        if not steam_status['running'] or not steam_status['online']:
+            return jsonify({
+                "status": "error",
+                "message": "🚫 Steam must be running and online to start a rotation.",
+                "steam_status": steam_status
+            }), 400
+
+        stop_rotation()
+        with rotation_lock:
+            rotation_state.update(default_rotation())
+            rotation_state.update({
+                "enabled": True,
+                "source": source,
+                "queue": queue,
+                "slots": max(1, min(MAX_IDLE_SLOTS, int(data.get('slots', MAX_IDLE_SLOTS)))),
+                "slice_minutes": max(1, int(data.get('sliceMinutes', DEFAULT_ROTATION_SLICE_MINUTES)))
+            })
+            save_rotation()
+        runtime.trigger('rotation')
+
+        save_recent_action(f"🔁 Started rotation of {source} ({len(queue)} games)")
+        return jsonify({"status": "success", "message": f"Rotating {len(queue)} games"})
+
+    elif request.method == 'DELETE':
+        data = request.get_json(silent=True) or {}
+        stop_rotation(data.get('stopGames', True))
+        update_tray_menu()
+        save_recent_action("⏹️ Stopped rotation")
+        return jsonify({"status": "success"})
+
+def load_schedules():
+    if os.path.exists(SCHEDULES_FILE):
+        try:
+            with open(SCHEDULES_FILE, 'r') as f:
+                return read_json(f)
+        except:
+            return {"schedules": []}
+    return {"schedules": []}
+
+def save_schedules(schedules):
+    with open(SCHEDULES_FILE, 'w') as f:
+        write_json(schedules, f)
+
+def parse_schedule_time(value):
+    """Parse a HH:MM string into (hour, minute)"""
+    hour, minute = value.split(':')
+    hour, minute = int(hour), int(minute)
+    if not (0 <= hour < 24 and 0 <= minute < 60):
+        raise ValueError(f"Invalid time {value}")
+    return hour, minute
+
+def validate_schedule(data):
+    """Build a schedule definition from request data, raises ValueError when it's invalid"""
+    preset_name = data.get('preset_name')
+    if not preset_name or not os.path.exists(os.path.join(PRESETS_DIR, f"{preset_name}.json")):
+        raise ValueError("❌ Preset not found")
+
+    # Days use Python's weekday numbering, Monday is 0
+    days = sorted({int(day) for day in data.get('days', [])})
+    if not days or any(day < 0 or day > 6 for day in days):
+        raise ValueError("🚫 Please select at least one day")
+
+    start_time = data.get('start_time')
+    stop_time = data.get('stop_time') or None
+    parse_schedule_time(start_time)
+    if stop_time:
+        parse_schedule_time(stop_time)
+        if stop_time == start_time:
+            raise ValueError("🚫 Start and stop time must be different")
+
+    return {
+        "preset_name": preset_name,
+        "days": days,
+        "start_time": start_time,
+        "stop_time": stop_time,
+        "enabled": bool(data.get('enabled', True))
+    }
+
+def next_schedule_occurrence(days, time_value, after, day_offset=0):
+    """Get the first datetime after `after` on one of `days` (shifted by day_offset) at HH:MM"""
+    hour, minute = parse_schedule_time(time_value)
+    shifted_days = {(day + day_offset) % 7 for day in days}
+    candidate = after.replace(hour=hour, minute=minute, second=0, microsecond=0)
+    for _ in range(8):
+        if candidate > after and candidate.weekday() in shifted_days:
+            return candidate
+        candidate += timedelta(days=1)
+    return None
+
+def get_schedule_events(schedule, after):
+    """Get the next (when, action) pairs for a schedule"""
+    events = [(next_schedule_occurrence(schedule['days'], schedule['start_time'], after), 'start')]
+    if schedule.get('stop_time'):
+        # A window like 22:00-06:00 stops on the day after it starts
+        overnight = schedule['stop_time'] <= schedule['start_time']
+        events.append((next_schedule_occurrence(
+            schedule['days'], schedule['stop_time'], after, 1 if overnight else 0), 'stop'))
+    return [(when, action) for when, action in events if when]
+
+def is_within_schedule_window(schedule, now):
+    """Check if now falls between a schedule's start and stop time"""
+    if not schedule.get('stop_time'):
+        return False
+    last_start = next_schedule_occurrence(schedule['days'], schedule['start_time'], now - timedelta(days=8))
+    while last_start:
+        following = next_schedule_occurrence(schedule['days'], schedule['start_time'], last_start)
+        if not following or following > now:
+            break
+        last_start = following
+    if not last_start or last_start > now:
+        return False
+    overnight = schedule['stop_time'] <= schedule['start_time']
+    stop_at = next_schedule_occurrence(schedule['days'], schedule['stop_time'], last_start, 1 if overnight else 0)
+    return stop_at is not None and now < stop_at
+
+class ScheduleTimer:
+    """Heap of upcoming schedule events, run by the 'schedules' runtime job.
+
+    Every schedule keeps at most one pending start and stop event in the heap, and the
+    job asks to run again when the earliest one is due. Edits bump the schedule's generation
+    so stale heap entries are dropped when they surface instead of being searched for.
+    """
+
+    def __init__(self):
+        self.heap = []
+        self.generations = {}
+        self.schedules = {}
+        self.counter = 0
+        self.loaded = False
+        self.lock = threading.Lock()
+
+    def push_events(self, schedule, after):
+        generation = self.generations[schedule['id']]
+        for when, action in get_schedule_events(schedule, after):
+            self.counter += 1
+            heapq.heappush(self.heap, (when, self.counter, schedule['id'], generation, action))
+
+    def set_schedule(self, schedule):
+        with self.lock:
+            schedule_id = schedule['id']
+            self.generations[schedule_id] = self.generations.get(schedule_id, 0) + 1
+            self.schedules[schedule_id] = schedule
+            if schedule.get('enabled', True):
+                self.push_events(schedule, datetime.now())
+        runtime.trigger('schedules')
+
+    def remove_schedule(self, schedule_id):
+        with self.lock:
+            self.generations[schedule_id] = self.generations.get(schedule_id, 0) + 1
+            self.schedules.pop(schedule_id, None)
+        runtime.trigger('schedules')
+
+    def load(self, schedules):
+        with self.lock:
+            self.heap = []
+            self.schedules = {}
+            self.loaded = True
+            now = datetime.now()
+            for schedule in schedules:
+                self.generations[schedule['id']] = self.generations.get(schedule['id'], 0) + 1
+                self.schedules[schedule['id']] = schedule
+                if schedule.get('enabled', True):
+                    self.push_events(schedule, now)
+
+    def next_event_time(self, schedule_id):
+        with self.lock:
+            upcoming = [when for when, _, sid, generation, _ in self.heap
+                        if sid == schedule_id and generation == self.generations.get(sid)]
+        return min(upcoming) if upcoming else None
+
+    def pop_due(self):
+        """Pop every due event, returns (due_events, seconds_until_next)"""
+        due = []
+        with self.lock:
+            now = datetime.now()
+            while self.heap:
+                when, _, schedule_id, generation, action = self.heap[0]
+                if generation != self.generations.get(schedule_id):
+                    heapq.heappop(self.heap)
+                    continue
+                if when > now:
+                    return due, (when - now).total_seconds()
+                heapq.heappop(self.heap)
+                schedule = self.schedules[schedule_id]
+                due.append((schedule, action))
+                # Queue this action's next occurrence
+                for next_when, next_action in get_schedule_events(schedule, when):
+                    if next_action == action:
+                        self.counter += 1
+                        heapq.heappush(self.heap, (next_when, self.counter, schedule_id, generation, action))
+        return due, None
+
+schedule_timer = ScheduleTimer()
+
+def run_schedule_action(schedule, action):
+    """Start or stop a schedule's preset"""
+    preset_name = schedule['preset_name']
+    print(f"Schedule {schedule['id']}: {action} preset {preset_name}")
+    with app.app_context():
+        if action == 'start':
+            run_preset_tray(icon, None, preset_name)
+            save_recent_action(f"⏰ Scheduled start of preset {preset_name}")
+        else:
+            stop_preset(preset_name)
+            save_recent_action(f"⏰ Scheduled stop of preset {preset_name}")
+            if icon:
+                icon.notify(f"⏹️ Stopped preset {preset_name}", "Schedule")
+
+def run_due_schedules():
+    """Background job running scheduled preset launches, returns when the next event is due"""
+    if not schedule_timer.loaded:
+        # First run happens once detect_running_games has adopted leftover idlers
+        schedule_timer.load(load_schedules()['schedules'])
+
+        # Start presets whose window is already open, e.g. when the app starts at 10:30 for 10:00-12:00
+        now = datetime.now()
+        for schedule in load_schedules()['schedules']:
+            if schedule.get('enabled', True) and is_within_schedule_window(schedule, now):
+                try:
+                    run_schedule_action(schedule, 'start')
+                except Exception as e:
+                    print(f"Error running schedule {schedule['id']}: {e}")
+
+    while True:
+        due, delay = schedule_timer.pop_due()
+        if not due:
+            return delay
+        for schedule, action in due:
+            try:
+                run_schedule_action(schedule, action)
+            except Exception as e:
+                print(f"Error running schedule {schedule['id']}: {e}")
+
+def serialize_schedule(schedule):
+    next_run = schedule_timer.next_event_time(schedule['id'])
+    return dict(schedule, next_event=next_run.isoformat() if next_run else None)
+
+@app.route('/api/schedules', methods=['GET', 'POST', 'PUT', 'DELETE'])
+def manage_schedules():
+    if request.method == 'GET':
+        schedules = load_schedules()
+        return jsonify({"schedules": [serialize_schedule(s) for s in schedules['schedules']]})
+
+    elif request.method == 'POST':
+        data = request.get_json()
+        try:
+            schedule = validate_schedule(data)
+        except (ValueError, TypeError, AttributeError) as e:
+            return jsonify({"status": "error", "message": str(e)}), 400
+
+        schedules = load_schedules()
+        schedule['id'] = str(max([int(s['id']) for s in schedules['schedules']] + [0]) + 1)
+        schedules['schedules'].append(schedule)
+        save_schedules(schedules)
+        schedule_timer.set_schedule(schedule)
+
+        save_recent_action(f"⏰ Scheduled preset {schedule['preset_name']}")
+        return jsonify({"status": "success", "schedule": serialize_schedule(schedule)})
+
+    elif request.method == 'PUT':
+        data = request.get_json()
+        schedules = load_schedules()
+        existing = next((s for s in schedules['schedules'] if s['id'] == data.get('id')), None)
+        if not existing:
+            return jsonify({"status": "error", "message": "❌ Schedule not found"}), 404
+        try:
+            schedule = validate_schedule(dict(existing, **data))
+        except (ValueError, TypeError, AttributeError) as e:
+            return jsonify({"status": "error", "message": str(e)}), 400
+
+        existing.update(schedule)
+        save_schedules(schedules)
+        schedule_timer.set_schedule(existing)
+
+        save_recent_action(f"⏰ Updated schedule for preset {existing['preset_name']}")
+        return jsonify({"status": "success", "schedule": serialize_schedule(existing)})
+
+    elif request.method == 'DELETE':
+        data = request.get_json()
+        schedules = load_schedules()
+        schedules['schedules'] = [s for s in schedules['schedules'] if s['id'] != data.get('id')]
+        save_schedules(schedules)
+        schedule_timer.remove_schedule(data.get('id'))
+
+        save_recent_action(f"⏰ Removed schedule {data.get('id')}")
+        return jsonify({"status": "success"})
 
 @app.route('/api/export-stats', methods=['POST'])
 def export_stats():
+    snapshot = game_state.snapshot()
     try:
         data = request.get_json()
         export_type = data.get('format', 'csv')
@@ -1612,11 +3732,11 @@ def export_stats():
         
         # First, get the most idled games to determine rankings
         most_idled = []
-        for game_id, session in game_sessions.items():
+        for game_id, session in snapshot.game_sessions.items():
             game_total_seconds = session.get('total_time', 0)
             
             # Add current session time if game is running
-            if game_id in running_games and 'start_time' in session:
+            if game_id in snapshot.running_games and 'start_time' in session:
                 current_session = (current_time - session['start_time']).total_seconds()
                 game_total_seconds += current_session
             
@@ -1631,10 +3751,10 @@ def export_stats():
         rank_map = {game['game_id']: f"#{idx + 1}" for idx, game in enumerate(most_idled[:5])}
         
         # Prepare the full stats with selected fields
-        for game_id, session in game_sessions.items():
+        for game_id, session in snapshot.game_sessions.items():
             game_total_seconds = session.get('total_time', 0)
             current_session_time = 0
-            is_running = game_id in running_games
+            is_running = game_id in snapshot.running_games
             
             if is_running and 'start_time' in session:
                 current_session_time = (current_time - session['start_time']).total_seconds()
@@ -1671,7 +3791,7 @@ def export_stats():
             'Total Playtime (HH:MM:SS)': format_duration(total_seconds),
             'Average Daily Playtime (Hours)': round((total_seconds / 3600) / max(1, (current_time - datetime.fromtimestamp(os.path.getctime(STATS_FILE))).days), 2),
             'Export Date': current_time.strftime('%Y-%m-%d %H:%M:%S'),
-            'Currently Running Games': len(running_games)
+            'Currently Running Games': len(snapshot.running_games)
         }
         
         if export_type == 'csv':
@@ -1714,7 +3834,7 @@ def export_stats():
             filepath = os.path.join(APPDATA_PATH, filename)
             
             with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(json_data, f, indent=2)
+                write_json(json_data, f, indent=2)
             
             try:
                 return send_file(
@@ -1752,10 +3872,9 @@ def toggle_auto_reconnect():
 
 @app.route('/api/stats/reset', methods=['POST'])
 def reset_statistics():
-    global game_sessions
     try:
         # Clear game sessions
-        game_sessions = {}
+        game_state.reset_sessions()
         
         # Delete stats file
         if os.path.exists(STATS_FILE):
@@ -1799,6 +3918,11 @@ def rename_preset():
             os.rename(old_json_path, new_json_path)
         if os.path.exists(old_bat_path):
             os.rename(old_bat_path, new_bat_path)
+        profiles = load_preset_launch_profiles()
+        if old_name in profiles:
+            profiles[new_name] = profiles.pop(old_name)
+            save_preset_launch_profiles(profiles)
+        bump_resource('presets')
             
         # Add to recent actions
         save_recent_action(f"Renamed preset from '{old_name}' to '{new_name}'")
@@ -1808,8 +3932,9 @@ def rename_preset():
         return jsonify({"status": "error", "message": str(e)}), 500
 
 @app.route('/api/settings', methods=['GET', 'POST'])
+@conditional_get('settings', live=lambda: (get_startup_status(), sampling_profiler.running))
 def manage_settings():
-    global minimize_to_tray, AUTO_RECONNECT, DISCORD_RPC_ENABLED
+    global minimize_to_tray, AUTO_RECONNECT, DISCORD_RPC_ENABLED, GUARDRAILS, LAUNCH_PROFILE, DUTY_CYCLE
     if request.method == 'POST':
         data = request.get_json()
         settings = load_settings()
@@ -1829,21 +3954,47 @@ def manage_settings():
         if 'discord_rpc_enabled' in data:
             settings['discord_rpc_enabled'] = data['discord_rpc_enabled']
             DISCORD_RPC_ENABLED = data['discord_rpc_enabled']
-            if DISCORD_RPC_ENABLED:
-                initialize_discord_rpc()
-            elif DISCORD_RPC:
-                try:
-                    DISCORD_RPC.close()
-                except:
-                    pass
+            discord_publisher.wake()
         
         if 'run_on_startup' in data:
             settings['run_on_startup'] = data['run_on_startup']
             set_startup_status(data['run_on_startup'])
         
+        if 'guardrails' in data:
+            try:
+                policy = normalize_guardrails({**DEFAULT_GUARDRAILS, **settings.get('guardrails', {}),
+                                               **data['guardrails']})
+            except (ValueError, TypeError) as e:
+                return jsonify({"status": "error", "message": f"❌ {e}"}), 400
+            settings['guardrails'] = GUARDRAILS = policy
+        
+        if 'launch_profile' in data:
+            try:
+                profile = normalize_launch_profile(dict(LAUNCH_PROFILE, **data['launch_profile']))
+            except ValueError as e:
+                return jsonify({"status": "error", "message": f"❌ {e}"}), 400
+            settings['launch_profile'] = LAUNCH_PROFILE = profile
+        
+        if 'duty_cycle' in data:
+            try:
+                policy = normalize_duty_cycle({**DEFAULT_DUTY_CYCLE, **settings.get('duty_cycle', {}),
+                                               **data['duty_cycle']})
+            except (ValueError, TypeError) as e:
+                return jsonify({"status": "error", "message": f"❌ {e}"}), 400
+            settings['duty_cycle'] = DUTY_CYCLE = policy
+            runtime.trigger('duty_cycle')
+        
+        profile_path = None
+        if 'profiler_enabled' in data:
+            settings['profiler_enabled'] = bool(data['profiler_enabled'])
+            profile_path = set_profiler_enabled(settings['profiler_enabled'])
+        
         if save_settings(settings):
             save_recent_action("Updated settings")
-            return jsonify({"status": "success", "message": "Settings updated successfully"})
+            response = {"status": "success", "message": "Settings updated successfully"}
+            if profile_path:
+                response["profile"] = profile_path
+            return jsonify(response)
         else:
             return jsonify({"status": "error", "message": "Failed to save settings"}), 500
     else:
@@ -1851,6 +4002,7 @@ def manage_settings():
         settings = load_settings()
         # Add startup status
         settings['run_on_startup'] = get_startup_status()
+        settings['profiler_running'] = sampling_profiler.running
         return jsonify(settings)
 
 @app.route('/api/reconfigure-idle', methods=['POST'])
@@ -1916,37 +4068,11 @@ def stop_preset(preset_name=None):
             
         # Read the games from the preset
         with open(json_path, 'r') as f:
-            games = json.load(f)
+            games = read_json(f)
             
-        stopped_games = []
-        for game in games:
-            game_id = str(game['id'])
-            if game_id in running_games:
-                try:
-                    pid = running_games[game_id]
-                    process = psutil.Process(pid)
-                    for child in process.children(recursive=True):
-                        child.terminate()
-                    process.terminate()
-                    stopped_games.append(game_id)
-                    
-                    # Update game session
-                    if game_id in game_sessions and 'start_time' in game_sessions[game_id]:
-                        session_duration = (datetime.now() - game_sessions[game_id]['start_time']).total_seconds()
-                        game_sessions[game_id]['total_time'] += session_duration
-                        game_sessions[game_id].pop('start_time', None)
-                    
-                    del running_games[game_id]
-                except (psutil.NoSuchProcess, psutil.AccessDenied):
-                    del running_games[game_id]
-                    
-        # Save statistics
-        save_statistics()
+        stopped_games = stopped_game_ids(terminate_idlers([game['id'] for game in games]))
         save_recent_action(f"Stopped preset {preset_name}")
         
-        # Update tray menu
-        update_tray_menu()
-        
         return jsonify({
             "status": "success",
             "stopped_games": stopped_games
@@ -1954,15 +4080,6 @@ def stop_preset(preset_name=None):
     except Exception as e:
         return jsonify({"status": "error", "message": str(e)}), 500
 
-def update_tray_periodically():
-    """Update the system tray menu every 30 seconds to refresh playtimes and status"""
-    while True:
-        try:
-            update_tray_menu()
-        except Exception as e:
-            print(f"Error in periodic tray update: {e}")
-        time.sleep(30)
-
 def show_window(icon, item):
     window.show()
     window.restore()  # Restore from minimized state
@@ -1974,49 +4091,29 @@ def exit_app(icon, item):
 
 def emergency_stop_tray(icon, item):
     # Stop all running games
-    stopped_games = []
-    for game_id in list(running_games.keys()):
-        try:
-            pid = running_games[game_id]
-            process = psutil.Process(pid)
-            for child in process.children(recursive=True):
-                child.terminate()
-            process.terminate()
-            stopped_games.append(game_id)
-            del running_games[game_id]
-            
-            # Update game session
-            if game_id in game_sessions and 'start_time' in game_sessions[game_id]:
-                session_duration = (datetime.now() - game_sessions[game_id]['start_time']).total_seconds()
-                game_sessions[game_id]['total_time'] += session_duration
-                game_sessions[game_id].pop('start_time', None)
-        except (psutil.NoSuchProcess, psutil.AccessDenied):
-            del running_games[game_id]
+    stop_rotation(stop_games=False)
+    stopped_games = stopped_game_ids(terminate_idlers(get_running_games()))
     
     save_recent_action(f"🛑 Emergency stop from tray - Stopped {len(stopped_games)} games")
-    save_statistics()
     if icon:
         icon.notify(f"🛑 Stopped {len(stopped_games)} games", "Emergency Stop")
+
+def stop_rotation_tray(icon, item):
+    """Stop the library rotation from the system tray menu"""
+    stop_rotation()
+    save_recent_action("⏹️ Stopped rotation from tray")
+    icon.notify("⏹️ Rotation stopped", "Rotation")
     update_tray_menu()
 
 def stop_single_game_tray(icon, item, game_id):
     """Stop a single game from the system tray menu"""
     try:
-        if game_id in running_games:
-            pid = running_games[game_id]
-            process = psutil.Process(pid)
-            for child in process.children(recursive=True):
-                child.terminate()
-            process.terminate()
-            
-            # Update game session
-            if game_id in game_sessions and 'start_time' in game_sessions[game_id]:
-                session_duration = (datetime.now() - game_sessions[game_id]['start_time']).total_seconds()
-                game_sessions[game_id]['total_time'] += session_duration
-                game_sessions[game_id].pop('start_time', None)
-            
-            del running_games[game_id]
-            save_statistics()
+        if game_id in get_running_games():
+            game_name = game_state.snapshot().game_sessions[game_id]['name']
+            if not stopped_game_ids(terminate_idlers([game_id])):
+                # Still running and tracked again, leave the UI as it is
+                icon.notify(f"❌ Could not stop {game_name}", "Error")
+                return
             
             # Notify the UI to update through the window's evaluate_js method
             if window:
@@ -2029,151 +4126,29 @@ def stop_single_game_tray(icon, item, game_id):
                     });
                 """ % game_id)
             
-            icon.notify(f"⏹️ Stopped {game_sessions[game_id]['name']}", "Game Stopped")
-            save_recent_action(f"⏹️ Stopped game {game_sessions[game_id]['name']} from tray")
-            update_tray_menu()
+            icon.notify(f"⏹️ Stopped {game_name}", "Game Stopped")
+            save_recent_action(f"⏹️ Stopped game {game_name} from tray")
     except Exception as e:
         icon.notify(f"❌ Error stopping game: {str(e)}", "Error")
 
 def run_preset_tray(icon, item, preset_name):
     """Run a preset from the system tray menu"""
     # Check Steam status first
-    steam_status = check_steam_status()
-    if not steam_status['running']:
-        icon.notify("🚫 Steam is not running. Please start Steam first.", "Error")
+    error = steam_not_ready(check_steam_status())
+    if error:
+        icon.notify(error, "Error")
         return
     
-    if not steam_status['online']:
-        icon.notify("📡 Steam appears to be offline. Please ensure Steam is online.", "Error")
+    # Get the preset data from JSON file
+    json_path = os.path.join(PRESETS_DIR, f"{preset_name}.json")
+    if not os.path.exists(json_path):
+        icon.notify(f"❌ Preset {preset_name} not found", "Error")
         return
     
     try:
-        # Get the preset data from JSON file
-        json_path = os.path.join(PRESETS_DIR, f"{preset_name}.json")
-        if not os.path.exists(json_path):
-            icon.notify(f"❌ Preset {preset_name} not found", "Error")
-            return
-            
-        with open(json_path, 'r') as f:
-            games = json.load(f)
-        
-        # Keep track of started games and failed games
-        started_games = []
-        failed_games = []
-        
-        # First attempt to start all games
-        for game in games:
-            game_id = str(game['id'])
-            if game_id not in running_games:  # Only start if not already running
-                try:
-                    process = subprocess.Popen([IDLER_PATH, game_id], shell=True)
-                    running_games[game_id] = process.pid
-                    started_games.append(game_id)
-                    
-                    # Initialize or update game session
-                    if game_id not in game_sessions:
-                        game_sessions[game_id] = {
-                            'total_time': 0,
-                            'name': game['name'],
-                            'image': game['image']
-                        }
-                    game_sessions[game_id]['start_time'] = datetime.now()
-                except Exception as e:
-                    print(f"Failed to start game {game_id}: {e}")
-                    failed_games.append(game)
-        
-        # Wait a moment for processes to initialize
-        time.sleep(2)
-        
-        # Verify all games are running and retry failed ones
-        max_retries = 3
-        retry_count = 0
-        
-        while retry_count < max_retries:
-            # Check which games failed to start
-            failed_games = []
-            for game in games:
-                game_id = str(game['id'])
-                if game_id in running_games:
-                    try:
-                        # Verify process is actually running
-                        process = psutil.Process(running_games[game_id])
-                        if not process.is_running():
-                            failed_games.append(game)
-                            del running_games[game_id]
-                    except (psutil.NoSuchProcess, psutil.AccessDenied):
-                        failed_games.append(game)
-                        del running_games[game_id]
-                else:
-                    failed_games.append(game)
-            
-            # If all games are running, break the retry loop
-            if not failed_games:
-                break
-                
-            # Retry failed games
-            retry_count += 1
-            if retry_count < max_retries:
-                print(f"Retrying {len(failed_games)} failed games (attempt {retry_count + 1})")
-                for game in failed_games:
-                    game_id = str(game['id'])
-                    try:
-                        process = subprocess.Popen([IDLER_PATH, game_id], shell=True)
-                        running_games[game_id] = process.pid
-                        started_games.append(game_id)
-                        
-                        # Initialize or update game session
-                        if game_id not in game_sessions:
-                            game_sessions[game_id] = {
-                                'total_time': 0,
-                                'name': game['name'],
-                                'image': game['image']
-                            }
-                        game_sessions[game_id]['start_time'] = datetime.now()
-                    except Exception as e:
-                        print(f"Failed to start game {game_id} on retry: {e}")
-                
-                # Wait between retries
-                time.sleep(2)
-        
-        save_statistics()
-        
-        # Notify the UI to update through the window's evaluate_js method
-        if window:
-            window.evaluate_js("""
-                runningGames.clear();
-                %s.forEach(gameId => runningGames.add(gameId));
-                updateGamesList();
-                loadPresets(true).then(presets => {
-                    updatePresetsList(presets);
-                    updateRunningGamesList();
-                });
-            """ % json.dumps([str(game['id']) for game in games]))
-        
-        # Prepare status message
-        if failed_games:
-            message = f"Started {len(started_games)} games, but {len(failed_games)} failed to start"
-            icon.notify(f"⚠️ {message}", "Preset Started with Issues")
-            save_recent_action(f"⚠️ Started preset {preset_name} with issues")
-        else:
-            message = f"Started {len(started_games)} games from preset {preset_name}"
-            icon.notify(f"▶️ {message}", "Preset Started")
-            save_recent_action(f"▶️ Started preset {preset_name}")
-        
-        update_tray_menu()
-        
-        return jsonify({
-            "status": "success" if not failed_games else "partial",
-            "message": message,
-            "gameIds": started_games,
-            "failedGames": [{"id": g["id"], "name": g["name"]} for g in failed_games]
-        })
+        start_preset(preset_name)
     except Exception as e:
         icon.notify(f"❌ Error running preset: {str(e)}", "Error")
-        return jsonify({
-            "status": "error",
-            "message": str(e)
-        }), 500
 
 def launch_steam_tray(icon, item):
     steam_path = get_steam_path()
@@ -2181,7 +4156,7 @@ def launch_steam_tray(icon, item):
         try:
             steam_exe = os.path.join(steam_path, "Steam.exe")
             if os.path.exists(steam_exe):
-                subprocess.Popen([steam_exe])
+                backend.launch_steam(steam_exe)
                 icon.notify("🚀 Steam launch initiated", "Steam")
                 save_recent_action("🚀 Launched Steam from tray")
             else:
@@ -2192,12 +4167,13 @@ def launch_steam_tray(icon, item):
         icon.notify("❌ Steam installation not found", "Error")
 
 def get_game_playtime(game_id):
-    if game_id in game_sessions:
-        session = game_sessions[game_id]
+    snapshot = game_state.snapshot()
+    if game_id in snapshot.game_sessions:
+        session = snapshot.game_sessions[game_id]
         total_seconds = session.get('total_time', 0)
         
         # Add current session time if game is running
-        if game_id in running_games and 'start_time' in session:
+        if game_id in snapshot.running_games and 'start_time' in session:
             current_session = (datetime.now() - session['start_time']).total_seconds()
             total_seconds += current_session
         
@@ -2205,12 +4181,13 @@ def get_game_playtime(game_id):
     return "00:00:00"
 
 def get_most_idled_game():
+    snapshot = game_state.snapshot()
     most_idled = None
     max_time = 0
     
-    for game_id, session in game_sessions.items():
+    for game_id, session in snapshot.game_sessions.items():
         total_seconds = session.get('total_time', 0)
-        if game_id in running_games and 'start_time' in session:
+        if game_id in snapshot.running_games and 'start_time' in session:
             current_session = (datetime.now() - session['start_time']).total_seconds()
             total_seconds += current_session
         
@@ -2224,14 +4201,212 @@ def get_most_idled_game():
 
 def get_steam_id():
     """Get user's Steam ID from registry or config"""
-    try:
-        # Try to get Steam ID from registry
-        hkey = winreg.OpenKey(winreg.HKEY_CURRENT_USER, "Software\\Valve\\Steam\\ActiveProcess")
-        steam_id = winreg.QueryValueEx(hkey, "ActiveUser")[0]
-        winreg.CloseKey(hkey)
-        return str(steam_id) if steam_id != 0 else None
-    except:
+    return backend.steam_active_user()
+
+class ManifestIndex:
+    """Persistent index of installed apps read from appmanifest_*.acf files.
+
+    Each manifest is stored with the mtime and size it was parsed at, so a
+    refresh lists the steamapps folders and only re-reads files that changed.
+    Readers get the last refreshed copy without touching the disk.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.lock = threading.Lock()
+        self.libraryfolders = {"mtime": None, "folders": []}
+        self.manifests = {}  # manifest path -> {"mtime", "size", "appid", "name"}
+        self.apps = {}  # appid -> {"name", "path"}
+        self.loaded = False
+        self.refreshed = False
+
+    def load(self):
+        if os.path.exists(self.path):
+            try:
+                with open(self.path, 'r') as f:
+                    data = read_json(f)
+                self.libraryfolders = data.get('libraryfolders', self.libraryfolders)
+                self.manifests = data.get('manifests', {})
+            except Exception as e:
+                print(f"Error loading manifest index: {e}")
+        self.apps = self._build_apps()
+        self.loaded = True
+
+    def save(self):
+        try:
+            with open(self.path, 'w') as f:
+                write_json({"libraryfolders": self.libraryfolders, "manifests": self.manifests}, f)
+        except Exception as e:
+            print(f"Error saving manifest index: {e}")
+
+    def _build_apps(self):
+        return {
+            entry['appid']: {"name": entry['name'], "path": manifest_path}
+            for manifest_path, entry in self.manifests.items()
+        }
+
+    def steamapps_folders(self):
+        return [os.path.join(folder, "steamapps") for folder in self.libraryfolders['folders']]
+
+    def _refresh_libraryfolders(self, steam_path):
+        """Re-read libraryfolders.vdf only when it changed"""
+        libraryfolders_path = os.path.join(steam_path, "steamapps", "libraryfolders.vdf")
+        try:
+            mtime = os.stat(libraryfolders_path).st_mtime_ns
+        except OSError:
+            self.libraryfolders = {"mtime": None, "folders": [steam_path]}
+            return
+        if mtime == self.libraryfolders['mtime']:
+            return
+
+        folders = []
+        try:
+            with open(libraryfolders_path, 'r', encoding='utf-8') as f:
+                data = vdf_parser.load(f)
+        except (OSError, vdf_parser.VDFError) as e:
+            print(f"Error reading libraryfolders.vdf: {e}")
+            data = {}
+        root = next(iter(data.values()), {})
+        for key, value in (root.items() if isinstance(root, dict) else []):
+            if isinstance(value, dict) and 'path' in value:
+                folders.append(value['path'])
+            elif isinstance(value, str) and key.isdigit():
+                # Older layout, "1" "D:\\SteamLibrary"
+                folders.append(value)
+        # The install folder is always a library, even when the file omits it
+        unique = {}
+        for folder in [steam_path] + folders:
+            unique.setdefault(os.path.normcase(os.path.normpath(folder)), folder)
+        self.libraryfolders = {"mtime": mtime, "folders": list(unique.values())}
+
+    def refresh(self):
+        """Rescan the library folders, parsing only new or changed manifests"""
+        steam_path = get_steam_path()
+        if not steam_path:
+            return
+        with self.lock:
+            if not self.loaded:
+                self.load()
+            self._refresh_libraryfolders(steam_path)
+
+            seen = set()
+            changed = 0
+            for apps_path in self.steamapps_folders():
+                try:
+                    entries = list(os.scandir(apps_path))
+                except OSError:
+                    continue
+                for entry in entries:
+                    if not (entry.name.startswith("appmanifest_") and entry.name.endswith(".acf")):
+                        continue
+                    # scandir carries the stat data on Windows, no extra open per file
+                    stat = entry.stat()
+                    seen.add(entry.path)
+                    known = self.manifests.get(entry.path)
+                    if known and known['mtime'] == stat.st_mtime_ns and known['size'] == stat.st_size:
+                        continue
+                    try:
+                        # Stops reading once appid and name are found
+                        with open(entry.path, 'r', encoding='utf-8') as f:
+                            values = vdf_parser.find_values(f, ('AppState', 'appid'), ('AppState', 'name'))
+                    except (OSError, vdf_parser.VDFError) as e:
+                        print(f"Error reading {entry.name}: {e}")
+                        continue
+                    self.manifests[entry.path] = {
+                        "mtime": stat.st_mtime_ns,
+                        "size": stat.st_size,
+                        "appid": values.get(('AppState', 'appid'), entry.name[len("appmanifest_"):-len(".acf")]),
+                        "name": values.get(('AppState', 'name'), "Unknown Game")
+                    }
+                    changed += 1
+
+            removed = [path for path in self.manifests if path not in seen]
+            for path in removed:
+                del self.manifests[path]
+
+            if changed or removed or not self.refreshed:
+                self.apps = self._build_apps()
+                self.save()
+            self.refreshed = True
+
+    def installed_apps(self):
+        """Installed apps by appid, from the last refresh (or the saved index on first use)"""
+        with self.lock:
+            if not self.loaded:
+                self.load()
+            apps = self.apps
+        if not self.refreshed:
+            if apps:
+                runtime.trigger('manifest_index')
+            else:
+                # Nothing saved yet, the first scan has to happen now
+                self.refresh()
+                apps = self.apps
+        return apps
+
+manifest_index = ManifestIndex(MANIFEST_INDEX_FILE)
+
+def refresh_manifest_index():
+    manifest_index.refresh()
+
+def watch_library_folders():
+    """Refresh the manifest index whenever a steamapps folder changes"""
+    while True:
+        folders = [folder for folder in manifest_index.steamapps_folders() if os.path.isdir(folder)]
+        if not folders:
+            time.sleep(60)
+            continue
+
+        try:
+            with backend.watch_folders(folders) as watcher:
+                while True:
+                    if watcher.wait(60):
+                        runtime.trigger('manifest_index')
+                    elif manifest_index.steamapps_folders() != folders:
+                        # Re-arm when libraryfolders.vdf added or removed a folder
+                        break
+        except Exception as e:
+            print(f"Error watching library folders: {e}")
+            time.sleep(60)
+
+def fetch_owned_games(steam_id):
+    """Owned games listed on the Steam Community profile, None when the page has no list"""
+    profile_url = f"https://steamcommunity.com/profiles/{steam_id}/games?tab=all"
+    response = http.get(profile_url, timeout=15)
+    if not response.ok:
+        return None
+    # Extract games list from JavaScript variable in the page
+    games_match = re.search(r'var rgGames = (\[.*?\]);', response.text)
+    if not games_match:
         return None
+    return [
+        {
+            "id": str(game.get('appid')),
+            "name": game.get('name', 'Unknown Game'),
+            "icon": game.get('logo', ''),
+            "installed": False,
+            "hours": game.get('hours_forever', '0'),
+            "last_played": game.get('last_played', 0)
+        }
+        for game in json.loads(games_match.group(1))
+    ]
+
+def load_library_cache():
+    """Last owned games fetched from the Steam Community profile"""
+    if os.path.exists(LIBRARY_CACHE_FILE):
+        try:
+            with open(LIBRARY_CACHE_FILE, 'r', encoding='utf-8') as f:
+                return read_json(f)
+        except Exception as e:
+            print(f"Error loading library cache: {e}")
+    return []
+
+def save_library_cache(games):
+    try:
+        with open(LIBRARY_CACHE_FILE, 'w', encoding='utf-8') as f:
+            write_json(games, f)
+    except Exception as e:
+        print(f"Error saving library cache: {e}")
 
 def get_steam_library():
     """Get list of games from user's Steam library"""
@@ -2245,75 +4420,497 @@ def get_steam_library():
         if not steam_path:
             return {"error": "❌ Steam installation not found"}
 
-        # Get all games from Steam Web API
-        all_games = {}
-        try:
-            # First try to get games from Steam Community profile
-            profile_url = f"https://steamcommunity.com/profiles/{steam_id}/games?tab=all"
-            response = requests.get(profile_url)
-            if response.ok:
-                # Extract games list from JavaScript variable in the page
-                games_match = re.search(r'var rgGames = (\[.*?\]);', response.text)
-                if games_match:
-                    games_data = json.loads(games_match.group(1))
-                    for game in games_data:
-                        game_id = str(game.get('appid'))
-                        all_games[game_id] = {
-                            "id": game_id,
-                            "name": game.get('name', 'Unknown Game'),
-                            "icon": game.get('logo', ''),
-                            "installed": False,
-                            "hours": game.get('hours_forever', '0'),
-                            "last_played": game.get('last_played', 0)
-                        }
-        except Exception as e:
-            print(f"Error fetching games from Steam Community: {e}")
+        # Get owned games from the Steam Community profile, or the last copy of them while offline
+        owned_games = None
+        if connectivity.online:
+            try:
+                owned_games = fetch_owned_games(steam_id)
+            except requests.RequestException as e:
+                print(f"Error fetching games from Steam Community: {e}")
+                connectivity.request_failed(e)
+            except Exception as e:
+                print(f"Error fetching games from Steam Community: {e}")
+        if owned_games is None:
+            owned_games = load_library_cache()
+            if not connectivity.online:
+                connectivity.defer('library', get_cached_steam_library, True)
+        else:
+            save_library_cache(owned_games)
+        all_games = {game['id']: dict(game) for game in owned_games}
 
-        # Get installed games from local machine
-        libraryfolders_path = os.path.join(steam_path, "steamapps", "libraryfolders.vdf")
-        if os.path.exists(libraryfolders_path):
-            library_folders = []
-            with open(libraryfolders_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-                for line in content.split('\n'):
-                    if '"path"' in line:
-                        path = line.split('"')[3].replace('\\\\', '\\')
-                        library_folders.append(path)
-
-            # Mark installed games
-            for library in library_folders:
-                apps_path = os.path.join(library, "steamapps")
-                if os.path.exists(apps_path):
-                    for file in os.listdir(apps_path):
-                        if file.startswith("appmanifest_") and file.endswith(".acf"):
-                            with open(os.path.join(apps_path, file), 'r', encoding='utf-8') as f:
-                                manifest = f.read()
-                                game_id = file.replace("appmanifest_", "").replace(".acf", "")
-                                name_match = re.search(r'"name"\s*"([^"]+)"', manifest)
-                                game_name = name_match.group(1) if name_match else "Unknown Game"
-                                
-                                if game_id in all_games:
-                                    all_games[game_id]['installed'] = True
-                                else:
-                                    # Get game icon from Steam API
-                                    icon_url = f"https://steamcdn-a.akamaihd.net/steam/apps/{game_id}/header.jpg"
-                                    all_games[game_id] = {
-                                        "id": game_id,
-                                        "name": game_name,
-                                        "icon": icon_url,
-                                        "installed": True,
-                                        "hours": "0",
-                                        "last_played": 0
-                                    }
+        # Get installed games from the manifest index, refreshed in the background
+        for game_id, app in manifest_index.installed_apps().items():
+            if game_id in all_games:
+                all_games[game_id]['installed'] = True
+            else:
+                # Get game icon from Steam API
+                icon_url = f"https://steamcdn-a.akamaihd.net/steam/apps/{game_id}/header.jpg"
+                all_games[game_id] = {
+                    "id": game_id,
+                    "name": app['name'],
+                    "icon": icon_url,
+                    "installed": True,
+                    "hours": "0",
+                    "last_played": 0
+                }
 
         return {"games": list(all_games.values())}
     except Exception as e:
         return {"error": str(e)}
 
+LIBRARY_SORTS = ('name', 'hours', 'last_played')
+LIBRARY_PAGE_LIMIT = 200
+
+def parse_hours(value):
+    """Parse Steam's hours_forever strings such as '1,234.5'"""
+    try:
+        return float(str(value).replace(',', ''))
+    except ValueError:
+        return 0.0
+
+class LibraryIndex:
+    """Search index over the owned games, rebuilt whenever the library is loaded.
+
+    Every query is a substring match. Queries of three or more characters
+    intersect the posting lists of their trigrams and confirm the substring,
+    shorter ones are answered exactly by the posting list of the one or two
+    character gram. Results come back in one of the presorted views,
+    optionally restricted to installed games.
+    """
+
+    def __init__(self, games):
+        self.games = games
+        self.version = format(int(time.time() * 1000), 'x')
+        self.names = [game['name'].lower() for game in games]
+
+        self.trigrams = {}
+        self.short_grams = {}  # One and two character grams, for short queries
+        for position, name in enumerate(self.names):
+            for size, grams in ((3, self.trigrams), (2, self.short_grams), (1, self.short_grams)):
+                for i in range(len(name) - size + 1):
+                    postings = grams.setdefault(name[i:i + size], [])
+                    # Positions arrive in order, skip a gram repeated within one name
+                    if not postings or postings[-1] != position:
+                        postings.append(position)
+
+        self.views = {
+            'name': sorted(range(len(games)), key=lambda p: self.names[p]),
+            'hours': sorted(range(len(games)), key=lambda p: -parse_hours(games[p].get('hours', 0))),
+            'last_played': sorted(range(len(games)), key=lambda p: -int(games[p].get('last_played') or 0)),
+        }
+        self.ranks = {
+            sort: {position: rank for rank, position in enumerate(view)}
+            for sort, view in self.views.items()
+        }
+        self.installed = {p for p, game in enumerate(games) if game.get('installed')}
+
+    def match(self, query):
+        """Return the set of positions whose name matches the query"""
+        if len(query) >= 3:
+            postings = [self.trigrams.get(query[i:i + 3]) for i in range(len(query) - 2)]
+            if not all(postings):
+                return set()
+            postings.sort(key=len)
+            candidates = set(postings[0]).intersection(*postings[1:])
+            return {p for p in candidates if query in self.names[p]}
+        return set(self.short_grams.get(query, ()))
+
+    def search(self, query='', installed_only=False, sort='name'):
+        """Return matching positions ordered by the requested view"""
+        query = query.strip().lower()
+        if not query:
+            view = self.views[sort]
+            return [p for p in view if p in self.installed] if installed_only else view
+
+        matches = self.match(query)
+        if installed_only:
+            matches &= self.installed
+        return sorted(matches, key=self.ranks[sort].__getitem__)
+
+# Last successful library load and its index, pages are served from it
+library_cache = {"games": None, "index": None}
+library_lock = threading.Lock()
+# Serializes loads, which fetch over the network, readers keep using the cache meanwhile
+library_load_lock = threading.Lock()
+# Ordered results of the last query, so following pages skip the search
+library_results = {"key": None, "positions": []}
+
+def get_cached_steam_library(refresh=False):
+    """Return the cached library, loading and indexing it on first use or when refresh is requested"""
+    if not refresh:
+        with library_lock:
+            if library_cache["games"] is not None:
+                return {"games": library_cache["games"], "index": library_cache["index"]}
+
+    with library_load_lock:
+        if not refresh:
+            with library_lock:
+                # Loaded by another request while we waited
+                if library_cache["games"] is not None:
+                    return {"games": library_cache["games"], "index": library_cache["index"]}
+        # Fetch and index outside library_lock, then swap the new library in whole
+        result = get_steam_library()
+        if 'error' in result:
+            return result
+        index = LibraryIndex(result["games"])
+        with library_lock:
+            library_cache["games"] = result["games"]
+            library_cache["index"] = index
+    # Owned games seed the app catalog
+    runtime.trigger('app_catalog')
+    return {"games": result["games"], "index": index}
+
+def encode_library_cursor(version, offset):
+    return base64.urlsafe_b64encode(f"{version}:{offset}".encode()).decode().rstrip('=')
+
+def decode_library_cursor(cursor, version):
+    """Return the offset a cursor points at, or None when it is invalid or from an older library"""
+    try:
+        cursor_version, offset = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4)).decode().split(':')
+        return int(offset) if cursor_version == version else None
+    except Exception:
+        return None
+
 @app.route('/api/steam-library')
 def steam_library():
-    """API endpoint to get user's Steam library"""
-    return jsonify(get_steam_library())
+    """Get the user's Steam library, searchable and cursor paged when limit is given"""
+    library = get_cached_steam_library(refresh=request.args.get('refresh') == '1')
+    if 'error' in library:
+        return jsonify(library)
+    if 'limit' not in request.args:
+        return jsonify({"games": library["games"]})
+
+    index = library["index"]
+    query = request.args.get('q', '')
+    installed_only = request.args.get('installed') == '1'
+    sort = request.args.get('sort', 'name')
+    if sort not in LIBRARY_SORTS:
+        return jsonify({"error": f"🚫 Unknown sort, use one of: {', '.join(LIBRARY_SORTS)}"}), 400
+    try:
+        limit = min(LIBRARY_PAGE_LIMIT, max(1, int(request.args.get('limit'))))
+    except ValueError:
+        return jsonify({"error": "🚫 Invalid limit"}), 400
+
+    offset = 0
+    cursor = request.args.get('cursor')
+    if cursor:
+        offset = decode_library_cursor(cursor, index.version)
+        if offset is None:
+            return jsonify({"error": "🔄 The library changed, please reload the list"}), 409
+
+    key = (index.version, query.strip().lower(), installed_only, sort)
+    with library_lock:
+        if library_results["key"] != key:
+            library_results["key"] = key
+            library_results["positions"] = index.search(query, installed_only, sort)
+        positions = library_results["positions"]
+
+    page = positions[offset:offset + limit]
+    next_offset = offset + len(page)
+    return jsonify({
+        "games": [index.games[p] for p in page],
+        "offset": offset,
+        "next_cursor": encode_library_cursor(index.version, next_offset) if next_offset < len(positions) else None,
+        "total": len(positions),
+        "total_games": len(index.games),
+        "installed_games": len(index.installed)
+    })
+
+def normalize_app_name(name):
+    """Lowercase a name into plain words, so 'Baldur's Gate™ 3' and 'baldurs gate 3' compare equal"""
+    return ' '.join(re.findall(r"\w+", name.lower().replace("'", '').replace('’', '')))
+
+class AppCatalogIndex:
+    """Name index over the app catalog.
+
+    Each query word matches words of the app names by prefix through a sorted
+    word list, a word with no prefix match is swapped for its closest
+    spellings and a word with neither rules out every app. Candidates are ranked by similarity to the whole query, with a
+    bonus for prefix matches and for apps that are installed or owned.
+    """
+
+    MAX_SCORED = 500
+
+    def __init__(self, apps, local_ids):
+        self.apps = apps
+        self.ids = list(apps)
+        self.names = list(apps.values())
+        self.normalized = [normalize_app_name(name) for name in self.names]
+        self.local = {p for p, app_id in enumerate(self.ids) if app_id in local_ids}
+
+        words = []
+        for position, name in enumerate(self.normalized):
+            for word in set(name.split()):
+                words.append((sys.intern(word), position))
+        words.sort()
+        self.words = [word for word, _ in words]
+        self.word_positions = [position for _, position in words]
+        self.vocabulary = sorted(set(self.words))
+
+    def __len__(self):
+        return len(self.ids)
+
+    def _prefix_range(self, word):
+        return (bisect.bisect_left(self.words, word),
+                bisect.bisect_left(self.words, word + '\uffff'))
+
+    def _close_words(self, word):
+        """Known words spelled like a word with no prefix match, among those sharing its first letter"""
+        start = bisect.bisect_left(self.vocabulary, word[0])
+        end = bisect.bisect_left(self.vocabulary, word[0] + '\uffff')
+        return difflib.get_close_matches(word, self.vocabulary[start:end], n=3, cutoff=0.75)
+
+    def _candidates(self, words):
+        sets = []
+        for word in words:
+            start, end = self._prefix_range(word)
+            if start == end:
+                positions = set()
+                for close in self._close_words(word):
+                    close_start, close_end = self._prefix_range(close)
+                    positions.update(self.word_positions[close_start:close_end])
+                if not positions:
+                    # Unknown word, better no candidate than a blind guess
+                    return set()
+                sets.append(positions)
+            else:
+                sets.append(range(start, end))
+
+        # Start from the narrowest word
+        sets.sort(key=len)
+        first = sets[0]
+        candidates = first if isinstance(first, set) else set(self.word_positions[first.start:first.stop])
+        for positions in sets[1:]:
+            if isinstance(positions, range):
+                positions = self.word_positions[positions.start:positions.stop]
+            candidates = candidates.intersection(positions)
+            if not candidates:
+                break
+        return candidates
+
+    def search(self, query, limit=10):
+        """Return up to limit ranked {"id", "name", "score"} candidates for a name"""
+        query = normalize_app_name(query)
+        if not query:
+            return []
+        candidates = self._candidates(query.split())
+        if len(candidates) > self.MAX_SCORED:
+            # Shorter names are the likelier titles, long ones are mostly DLC and soundtracks
+            candidates = sorted(candidates, key=lambda p: len(self.normalized[p]))[:self.MAX_SCORED]
+
+        matcher = difflib.SequenceMatcher(b=query, autojunk=False)
+        scored = []
+        for position in candidates:
+            name = self.normalized[position]
+            if name == query:
+                score = 2.0
+            else:
+                matcher.set_seq1(name)
+                score = matcher.ratio()
+                if name.startswith(query):
+                    score += 0.5
+            if position in self.local:
+                score += 0.25
+            scored.append((-score, len(name), position))
+        scored.sort()
+        return [
+            {"id": self.ids[position], "name": self.names[position], "score": round(-score, 3)}
+            for score, _, position in scored[:limit]
+        ]
+
+    def name_of(self, app_id):
+        return self.apps.get(app_id)
+
+class AppCatalog:
+    """Local appid <-> name catalog.
+
+    Built from Steam's bulk app list, re-downloaded when older than
+    CATALOG_MAX_AGE, and seeded with the installed apps and the owned library
+    so those resolve even before the first download. The index is rebuilt
+    off the request path and swapped in whole.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.lock = threading.Lock()
+        self.apps = {}  # appid -> name from the bulk list
+        self.fetched_at = 0
+        self.loaded = False
+        self.index = None
+        self.index_key = None
+        self.failures = 0  # Failed downloads in a row
+        self.retry_at = 0  # No download before this, backs off after failures
+
+    def load(self):
+        if os.path.exists(self.path):
+            try:
+                with open(self.path, 'r', encoding='utf-8') as f:
+                    data = read_json(f)
+                self.apps = {str(app_id): name for app_id, name in data.get('apps', [])}
+                self.fetched_at = data.get('fetched_at', 0)
+            except Exception as e:
+                print(f"Error loading app catalog: {e}")
+        self.loaded = True
+
+    def save(self):
+        try:
+            with open(self.path, 'w', encoding='utf-8') as f:
+                write_json({"fetched_at": self.fetched_at, "apps": list(self.apps.items())}, f)
+        except Exception as e:
+            print(f"Error saving app catalog: {e}")
+
+    def download(self):
+        response = http.get(CATALOG_URL, timeout=30)
+        response.raise_for_status()
+        apps = {}
+        for app in response.json().get('applist', {}).get('apps', []):
+            name = app.get('name', '').strip()
+            if name:
+                apps[str(app['appid'])] = name
+        if apps:
+            self.apps = apps
+            self.fetched_at = time.time()
+            self.save()
+
+    def local_apps(self):
+        """Installed and owned apps, known without the bulk list"""
+        apps = {app_id: app['name'] for app_id, app in manifest_index.installed_apps().items()}
+        for game in library_cache["games"] or []:
+            apps.setdefault(game['id'], game['name'])
+        return apps
+
+    def refresh(self):
+        """Download the app list when stale and rebuild the index when its inputs changed.
+
+        Returns the delay until the next download attempt while backing off
+        after failures, None otherwise.
+        """
+        with self.lock:
+            if not self.loaded:
+                self.load()
+            retry_in = None
+            if time.time() - self.fetched_at > CATALOG_MAX_AGE:
+                if time.time() < self.retry_at:
+                    # Backing off after failed downloads, a replay on the next online edge waits too
+                    retry_in = self.retry_at - time.time()
+                elif connectivity.online:
+                    try:
+                        self.download()
+                        self.failures = 0
+                    except Exception as e:
+                        print(f"Error downloading app catalog: {e}")
+                        if isinstance(e, requests.RequestException):
+                            connectivity.request_failed(e)
+                        self.failures += 1
+                        retry_in = min(CATALOG_RETRY_MAX, CATALOG_RETRY_INTERVAL * 2 ** (self.failures - 1))
+                        self.retry_at = time.time() + retry_in
+                else:
+                    connectivity.defer('app_catalog', runtime.trigger, 'app_catalog')
+
+            local = self.local_apps()
+            key = (self.fetched_at, len(self.apps), frozenset(local))
+            if key != self.index_key:
+                apps = dict(self.apps)
+                apps.update(local)
+                self.index = AppCatalogIndex(apps, set(local))
+                self.index_key = key
+            return retry_in
+
+    def search(self, query, limit=10):
+        index = self.index
+        return index.search(query, limit) if index else []
+
+    def name_of(self, app_id):
+        index = self.index
+        return index.name_of(app_id) if index else None
+
+app_catalog = AppCatalog(CATALOG_FILE)
+
+def refresh_app_catalog():
+    return app_catalog.refresh()
+
+def search_store(name, timeout=STORE_SEARCH_TIMEOUT):
+    """First result of the Steam store search, or None"""
+    search_url = f"https://store.steampowered.com/search/?term={requests.utils.quote(name)}"
+    search_response = http.get(search_url, timeout=timeout)
+    search_soup = BeautifulSoup(search_response.text, 'html.parser')
+    first_result = search_soup.find('a', {'class': 'search_result_row'})
+    return first_result['data-ds-appid'] if first_result else None
+
+def resolve_game_name(name, store=True, timeout=STORE_SEARCH_TIMEOUT):
+    """Resolve a game name to {"id", "name", "score", "source"}, or None.
+
+    Confident catalog matches are returned directly. Otherwise the store
+    search decides while online, and the best catalog candidate is the
+    fallback when offline, when the store finds nothing or when store is False.
+    """
+    candidates = app_catalog.search(name, limit=1)
+    best = candidates[0] if candidates else None
+    if best and best['score'] >= CATALOG_MATCH_THRESHOLD:
+        return dict(best, source='catalog')
+    if store and connectivity.online:
+        try:
+            game_id = search_store(name, timeout)
+            if game_id:
+                return {"id": game_id, "name": app_catalog.name_of(game_id), "score": None, "source": 'store'}
+        except requests.RequestException as e:
+            print(f"Error searching the store for {name}: {e}")
+            connectivity.request_failed(e)
+        except Exception as e:
+            print(f"Error searching the store for {name}: {e}")
+    return dict(best, source='catalog') if best else None
+
+# Store searches of batch resolves, bounded across requests so repeated imports don't pile up
+store_search_pool = ThreadPoolExecutor(max_workers=CATALOG_RESOLVE_WORKERS, thread_name_prefix="store-search")
+
+def resolve_before(name, deadline):
+    """resolve_game_name() with a store search that fits in what is left until `deadline`"""
+    remaining = deadline - time.monotonic()
+    if remaining <= 1:
+        return resolve_game_name(name, store=False)
+    return resolve_game_name(name, timeout=min(STORE_SEARCH_TIMEOUT, remaining))
+
+@app.route('/api/catalog/search')
+def catalog_search():
+    """Ranked appid candidates for a game name, from the local catalog"""
+    query = request.args.get('q', '').strip()
+    if not query:
+        return jsonify({"status": "error", "message": "🚫 Please provide a game name"}), 400
+    try:
+        limit = min(50, max(1, int(request.args.get('limit', 10))))
+    except ValueError:
+        return jsonify({"status": "error", "message": "🚫 Invalid limit"}), 400
+    index = app_catalog.index
+    return jsonify({
+        "status": "success",
+        "results": app_catalog.search(query, limit),
+        "catalog_size": len(index) if index else 0
+    })
+
+@app.route('/api/catalog/resolve', methods=['POST'])
+def catalog_resolve():
+    """Resolve a batch of game names, e.g. the lines of an imported TXT file"""
+    data = request.get_json() or {}
+    names = data.get('names', [])
+    if not isinstance(names, list) or not names:
+        return jsonify({"status": "error", "message": "🚫 Please provide game names"}), 400
+    names = [name for name in dict.fromkeys(str(name).strip() for name in names) if name]
+
+    try:
+        # Store searches run in parallel under one deadline, names still waiting get the catalog's best guess
+        deadline = time.monotonic() + CATALOG_RESOLVE_DEADLINE
+        futures = {name: store_search_pool.submit(resolve_before, name, deadline) for name in names}
+        done, _ = wait(futures.values(), timeout=CATALOG_RESOLVE_DEADLINE)
+        results = {}
+        for name, future in futures.items():
+            if future in done and not future.exception():
+                results[name] = future.result()
+            else:
+                future.cancel()
+                results[name] = resolve_game_name(name, store=False)
+        return jsonify({"status": "success", "results": results})
+    except Exception as e:
+        return jsonify({"status": "error", "message": str(e)}), 500
 
 @app.route('/api/import-from-library', methods=['POST'])
 def import_from_library():
@@ -2336,7 +4933,7 @@ def import_from_library():
         # Save as preset
         preset_json_path = os.path.join(PRESETS_DIR, f"{preset_name}.json")
         with open(preset_json_path, 'w') as f:
-            json.dump(games, f)
+            write_json(games, f)
 
         # Create BAT file
         bat_content = "@echo off\n"
@@ -2347,6 +4944,7 @@ def import_from_library():
         bat_path = os.path.join(PRESETS_DIR, f"{preset_name}.bat")
         with open(bat_path, 'w') as f:
             f.write(bat_content)
+        bump_resource('presets')
 
         return jsonify({"status": "success"})
     except Exception as e:
@@ -2357,204 +4955,191 @@ def suspend_game():
     data = request.get_json()
     game_id = str(data.get('gameId'))
     
-    if game_id not in running_games:
+    if game_id not in get_running_games():
         return jsonify({"status": "error", "message": "🚫 Game is not running"}), 400
     
     try:
-        # Get the process
-        pid = running_games[game_id]
-        process = psutil.Process(pid)
-        
-        # Suspend the process
-        process.suspend()
+        duty_cycle.pin(game_id)
         
         return jsonify({"status": "success"})
     except psutil.NoSuchProcess:
         # If process doesn't exist, remove it from running games
-        running_games.pop(game_id, None)
+        game_state.drop_running(game_id)
         return jsonify({"status": "error", "message": "❌ Game process not found"}), 404
     except Exception as e:
         return jsonify({"status": "error", "message": str(e)}), 500
 
-# Add resume game route for future use
 @app.route('/api/resume-game', methods=['POST'])
 def resume_game():
     data = request.get_json()
     game_id = str(data.get('gameId'))
     
-    if game_id not in running_games:
+    if game_id not in get_running_games():
         return jsonify({"status": "error", "message": "🚫 Game is not running"}), 400
     
     try:
-        # Get the process
-        pid = running_games[game_id]
-        process = psutil.Process(pid)
-        
-        # Resume the process
-        process.resume()
+        duty_cycle.unpin(game_id)
         
         return jsonify({"status": "success"})
     except psutil.NoSuchProcess:
         # If process doesn't exist, remove it from running games
-        running_games.pop(game_id, None)
+        game_state.drop_running(game_id)
         return jsonify({"status": "error", "message": "❌ Game process not found"}), 404
     except Exception as e:
         return jsonify({"status": "error", "message": str(e)}), 500
 
+def suspend_idler(game_id):
+    """Suspend an idler and its child processes and start counting its suspended time"""
+    process = backend.process(get_running_games()[game_id])
+    for target in [process] + process.children(recursive=True):
+        target.suspend()
+    game_state.set_suspended(game_id, True)
+
+def resume_idler(game_id):
+    """Resume a suspended idler and its child processes"""
+    process = backend.process(get_running_games()[game_id])
+    for target in [process] + process.children(recursive=True):
+        target.resume()
+    game_state.set_suspended(game_id, False)
+
+def resume_stopped_idler(pid):
+    """Resume an adopted idler, and its child processes, left suspended by an earlier run"""
+    try:
+        process = backend.process(pid)
+        for target in [process] + process.children(recursive=True):
+            if target.status() == psutil.STATUS_STOPPED:
+                target.resume()
+    except (psutil.NoSuchProcess, psutil.AccessDenied) as e:
+        print(f"Error resuming adopted idler {pid}: {e}")
+
+class DutyCycle:
+    """Keeps the idlers suspended except for an active window of `active_seconds` every
+    `period_seconds`. Windows are spread evenly over the period, in game ID order, so the
+    idlers never all wake together. The job sleeps until the next window opens or closes.
+    Games suspended by hand are pinned and left alone.
+    """
+
+    def __init__(self):
+        self.lock = threading.RLock()  # Guards managed and pinned, ticks and the routes race otherwise
+        self.members = ()
+        self.offsets = {}
+        self.managed = set()  # Games the duty cycle suspended
+        self.pinned = set()  # Games suspended with /api/suspend-game
+        self.stopped = False
+
+    def _offsets(self, game_ids, period):
+        members = tuple(sorted(game_ids))
+        if members != self.members:
+            self.members = members
+            step = period / len(members) if members else 0
+            self.offsets = {game_id: index * step for index, game_id in enumerate(members)}
+        return self.offsets
+
+    def _set(self, game_id, suspended):
+        try:
+            if suspended:
+                suspend_idler(game_id)
+                self.managed.add(game_id)
+            else:
+                resume_idler(game_id)
+                self.managed.discard(game_id)
+        except (psutil.NoSuchProcess, KeyError):
+            self.managed.discard(game_id)
+        except psutil.AccessDenied as e:
+            print(f"Error changing the duty cycle state of {game_id}: {e}")
+
+    def pin(self, game_id):
+        """Suspend an idler by hand, the duty cycle leaves it suspended until unpinned"""
+        with self.lock:
+            suspend_idler(game_id)
+            self.managed.discard(game_id)
+            self.pinned.add(game_id)
+
+    def unpin(self, game_id):
+        """Resume an idler suspended by hand and hand it back to the duty cycle"""
+        with self.lock:
+            resume_idler(game_id)
+            self.pinned.discard(game_id)
+        runtime.trigger('duty_cycle')
+
+    def release(self, pinned=False):
+        """Resume every idler the duty cycle suspended, and the pinned ones too if asked"""
+        with self.lock:
+            running = get_running_games()
+            for game_id in (self.managed | self.pinned) if pinned else set(self.managed):
+                if game_id in running:
+                    self._set(game_id, False)
+            self.managed.clear()
+            if pinned:
+                self.pinned.clear()
+            self.members = ()
+
+    def shutdown(self):
+        """Resume every suspended idler before exiting, so none is left frozen after we are gone"""
+        with self.lock:
+            self.stopped = True
+            self.release(pinned=True)
+
+    def tick(self):
+        """Runtime job, returns the delay until the next window opens or closes"""
+        policy = DUTY_CYCLE
+        with self.lock:
+            if self.stopped:
+                return None
+            if not policy or not policy.get('enabled'):
+                self.release()
+                return None
+            period = policy['period_seconds']
+            active = policy['active_seconds']
+            snapshot = game_state.snapshot()
+            running = snapshot.running_games
+            self.managed &= set(running)
+            self.pinned &= set(running)
+            # The runtime may run a job up to `slack` seconds early, decide for then
+            now = time.time() + runtime.slack
+            next_change = period
+            for game_id, offset in self._offsets(running, period).items():
+                if game_id in self.pinned:
+                    continue
+                phase = (now - offset) % period
+                should_run = phase < active
+                suspended = 'suspended_since' in (snapshot.game_sessions.get(game_id) or {})
+                if should_run == suspended:
+                    self._set(game_id, not should_run)
+                next_change = min(next_change, (active - phase) if should_run else (period - phase))
+            return max(next_change, runtime.slack)
+
+    def on_state_change(self):
+        """GameState listener, new or stopped idlers get their window right away"""
+        if DUTY_CYCLE and DUTY_CYCLE.get('enabled') and tuple(sorted(game_state.snapshot().running_games)) != self.members:
+            runtime.trigger('duty_cycle')
+
+duty_cycle = DutyCycle()
+game_state.subscribe(duty_cycle.on_state_change)
+
+def normalize_duty_cycle(policy):
+    period = int(policy['period_seconds'])
+    active = int(policy['active_seconds'])
+    if active < DUTY_CYCLE_MIN_ACTIVE:
+        raise ValueError(f"active_seconds must be at least {DUTY_CYCLE_MIN_ACTIVE}")
+    if period <= active:
+        raise ValueError("period_seconds must be longer than active_seconds")
+    return {"enabled": bool(policy['enabled']), "period_seconds": period, "active_seconds": active}
+
 def check_internet_connection():
+    """Probe Steam's web services, run by the connectivity monitor"""
     try:
-        # Try to connect to a reliable host
-        socket.create_connection(("8.8.8.8", 53), timeout=3)
-        return True
-    except OSError:
+        response = http.head(CONNECTIVITY_URL, timeout=CONNECTIVITY_TIMEOUT)
+        return response.status_code < 500
+    except requests.RequestException:
         return False
 
-def show_no_internet_error():
-    import tkinter as tk
-    from tkinter import ttk
-    
-    def retry_connection():
-        if check_internet_connection():
-            # Show success message before closing
-            message_label.config(text="📶 Connection detected!\nStarting the program...", fg='#00FF00')
-            dialog.after(1500, dialog.destroy)  # Close after 1.5 seconds
-            return True
-        else:
-            # Show the notification label with animation
-            notification_label.config(text="🚫 There's no connection")
-            notification_label.pack(pady=(0, 10))
-            dialog.after(100, lambda: notification_label.config(fg='#FF4444'))  # Fade in red color
-            dialog.after(2000, lambda: notification_label.pack_forget())  # Hide after 2 seconds
-            return False
-    
-    def close_app():
-        dialog.destroy()
-        sys.exit(1)
-    
-    # Create the custom dialog
-    dialog = tk.Tk()
-    dialog.title("Connection Error")
-    dialog.configure(bg='#1E1E1E')
-    dialog.overrideredirect(True)  # Remove window decorations
-    
-    # Set dialog size
-    dialog_width = 350
-    dialog_height = 249
-    dialog.geometry(f"{dialog_width}x{dialog_height}")
-    
-    # Main frame
-    main_frame = tk.Frame(dialog, bg='#1E1E1E')
-    main_frame.pack(fill='both', expand=True)
-    
-    # Title bar
-    title_frame = tk.Frame(main_frame, bg='#1E1E1E')
-    title_frame.pack(fill='x', padx=10, pady=5)
-    
-    title_label = tk.Label(title_frame, text="Connection Error", fg='#CCCCCC', bg='#1E1E1E', font=('Segoe UI', 11))
-    title_label.pack(side='left')
-    
-    close_btn = tk.Label(title_frame, text="×", fg='#CCCCCC', bg='#1E1E1E', font=('Segoe UI', 11))
-    close_btn.pack(side='right')
-    close_btn.bind('<Button-1>', lambda e: close_app())
-    
-    # Warning icon (triangle with exclamation mark)
-    icon_text = "⚠"
-    icon_label = tk.Label(main_frame, text=icon_text, fg='#FFA500', bg='#1E1E1E', font=('Segoe UI', 36))
-    icon_label.pack(pady=(10, 5))
-    
-    # Error message
-    message_label = tk.Label(main_frame, 
-                           text="📵 No internet connection detected!\n\nPlease check your connection and try again.",
-                           fg='#CCCCCC',
-                           bg='#1E1E1E',
-                           font=('Segoe UI', 9),
-                           justify='center')
-    message_label.pack(pady=(0, 10))
-    
-    # Notification label (hidden by default)
-    notification_label = tk.Label(main_frame,
-                                text="",
-                                fg='#FF4444',
-                                bg='#1E1E1E',
-                                font=('Segoe UI', 8))
-    
-    # Buttons frame
-    button_frame = tk.Frame(main_frame, bg='#1E1E1E')
-    button_frame.pack(pady=(0, 15))
-    
-    # Button style
-    retry_btn = tk.Button(button_frame,
-                         text="🔄 Retry",
-                         command=retry_connection,
-                         bg='#333333',
-                         fg='#FFFFFF',
-                         activebackground='#404040',
-                         activeforeground='#FFFFFF',
-                         relief='flat',
-                         font=('Segoe UI', 9),
-                         width=10)
-    retry_btn.pack(side='left', padx=5)
-    
-    ok_btn = tk.Button(button_frame,
-                      text="🚫 OK",
-                      command=close_app,
-                      bg='#333333',
-                      fg='#FFFFFF',
-                      activebackground='#404040',
-                      activeforeground='#FFFFFF',
-                      relief='flat',
-                      font=('Segoe UI', 9),
-                      width=10)
-    ok_btn.pack(side='left', padx=5)
-    
-    # Center window
-    dialog.update_idletasks()
-    screen_width = dialog.winfo_screenwidth()
-    screen_height = dialog.winfo_screenheight()
-    x = (screen_width - dialog_width) // 2
-    y = (screen_height - dialog_height) // 2
-    dialog.geometry(f"+{x}+{y}")
-    
-    # Make window draggable
-    def start_move(event):
-        dialog.x = event.x
-        dialog.y = event.y
-
-    def stop_move(event):
-        dialog.x = None
-        dialog.y = None
-
-    def do_move(event):
-        deltax = event.x - dialog.x
-        deltay = event.y - dialog.y
-        x = dialog.winfo_x() + deltax
-        y = dialog.winfo_y() + deltay
-        dialog.geometry(f"+{x}+{y}")
-
-    title_frame.bind('<Button-1>', start_move)
-    title_frame.bind('<ButtonRelease-1>', stop_move)
-    title_frame.bind('<B1-Motion>', do_move)
-    
-    # Auto-check connection every 5 seconds
-    def auto_check_connection():
-        if check_internet_connection():
-            # Show success message and close
-            message_label.config(text="📶 Connection detected!\nStarting the program...", fg='#00FF00')
-            dialog.after(1500, dialog.destroy)
-        else:
-            dialog.after(5000, auto_check_connection)  # Check again in 5 seconds
-    
-    # Start auto-checking
-    auto_check_connection()
-    
-    dialog.mainloop()
-
 def load_game_history():
     """Load game history from file"""
     if os.path.exists(HISTORY_FILE):
         try:
             with open(HISTORY_FILE, 'r') as f:
-                return json.load(f)
+                return read_json(f)
         except:
             return {"history": []}
     return {"history": []}
@@ -2563,13 +5148,15 @@ def save_game_history(history):
     """Save game history to file"""
     try:
         with open(HISTORY_FILE, 'w') as f:
-            json.dump(history, f)
+            write_json(history, f)
+        bump_resource('game_history')
         return True
     except Exception as e:
         print(f"Error saving game history: {e}")
         return False
 
 @app.route('/api/game-history', methods=['GET', 'POST', 'DELETE'])
+@conditional_get('game_history')
 def manage_game_history():
     if request.method == 'GET':
         return jsonify(load_game_history())
@@ -2613,16 +5200,18 @@ def load_game_favorites():
     if os.path.exists(GAME_FAVORITES_FILE):
         try:
             with open(GAME_FAVORITES_FILE, 'r') as f:
-                return json.load(f)
+                return read_json(f)
         except:
             return {"favorites": []}
     return {"favorites": []}
 
 def save_game_favorites(favorites):
     with open(GAME_FAVORITES_FILE, 'w') as f:
-        json.dump(favorites, f)
+        write_json(favorites, f)
+    bump_resource('game_favorites')
 
 @app.route('/api/game-favorites', methods=['GET', 'POST', 'DELETE'])
+@conditional_get('game_favorites')
 def manage_game_favorites():
     if request.method == 'GET':
         return jsonify(load_game_favorites())
@@ -2673,7 +5262,7 @@ def load_export_preferences():
     prefs_file = get_export_preferences_path()
     if os.path.exists(prefs_file):
         with open(prefs_file, 'r') as f:
-            return json.load(f)
+            return read_json(f)
     return {
         'game_id': True,
         'game_name': True,
@@ -2702,79 +5291,155 @@ def save_export_preferences():
         preferences = request.get_json()
         prefs_file = get_export_preferences_path()
         with open(prefs_file, 'w') as f:
-            json.dump(preferences, f)
+            write_json(preferences, f)
         return jsonify({"status": "success"})
     except Exception as e:
         print(f"Error saving export preferences: {str(e)}")
         return jsonify({"status": "error", "message": str(e)}), 500
 
+class RunningStateCheckpoint:
+    """Keeps {game_id: {"pid", "create_time"}} of the running idlers on disk, so the next start
+    adopts them straight from the file instead of searching every process. Idlers outlive
+    the app, so the checkpoint is frozen at exit rather than emptied.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.loaded = False  # Nothing is written before the old checkpoint was read
+        self.frozen = False
+        self.saved = None
+        self.create_times = {}  # pid -> create_time
+
+    def on_state_change(self):
+        """GameState listener, the write happens in the runtime"""
+        if not self.frozen:
+            runtime.trigger('running_state')
+
+    def save(self):
+        if self.frozen or not self.loaded:
+            return
+        running = game_state.snapshot().running_games
+        state = {}
+        for game_id, pid in running.items():
+            create_time = self.create_times.get(pid)
+            if create_time is None:
+                try:
+                    create_time = self.create_times[pid] = backend.process(pid).create_time()
+                except (psutil.NoSuchProcess, psutil.AccessDenied):
+                    continue
+            state[game_id] = {"pid": pid, "create_time": create_time}
+        pids = set(running.values())
+        self.create_times = {pid: value for pid, value in self.create_times.items() if pid in pids}
+        if state == self.saved:
+            return
+        try:
+            with open(self.path, 'w') as f:
+                write_json(state, f)
+            self.saved = state
+        except OSError as e:
+            print(f"Error saving running state: {e}")
+
+    def freeze(self):
+        """Write the idlers still running and stop tracking changes, called at exit"""
+        self.save()
+        self.frozen = True
+
+    def adoptable(self):
+        """(game_id, pid, create_time) for checkpointed idlers that are still running.
+        A PID whose creation time changed was reused by another process and is skipped"""
+        self.loaded = True
+        if not os.path.exists(self.path):
+            return []
+        try:
+            with open(self.path, 'r') as f:
+                state = read_json(f)
+        except Exception as e:
+            print(f"Error loading running state: {e}")
+            return []
+        found = []
+        for game_id, entry in state.items():
+            try:
+                process = backend.process(entry['pid'])
+                create_time = process.create_time()
+                if abs(create_time - entry['create_time']) > 1:
+                    continue
+                if process.name().lower() not in ('cmd.exe', 'steam-idle.exe') or not process.is_running():
+                    continue
+            except (psutil.NoSuchProcess, psutil.AccessDenied, KeyError, TypeError):
+                continue
+            found.append((game_id, entry['pid'], create_time))
+        return found
+
+running_checkpoint = RunningStateCheckpoint(RUNNING_STATE_FILE)
+game_state.subscribe(running_checkpoint.on_state_change)
+
 def detect_running_games():
-    """Detect already running steam-idle processes and add them to running_games"""
+    """Adopt steam-idle processes left running by an earlier run. The idlers are adopted right
+    away from the running-state checkpoint and one process scan, named from the local caches.
+    Returns (game IDs, game infos, game IDs whose store info should be fetched)"""
     detected_games = []
     detected_game_info = []  # Store full game info for UI updates
+    missing_info = []
     
     if icon:
         icon.notify("🔍 Scanning for running games...", "Detection Started")
     
     try:
         current_time = datetime.now()
-        for proc in psutil.process_iter(['pid', 'name', 'cmdline']):
-            try:
-                if proc.name().lower() == 'steam-idle.exe':
+        found = {game_id: (pid, create_time) for game_id, pid, create_time in running_checkpoint.adoptable()}
+        known_pids = {pid for pid, _ in found.values()}
+        
+        # One pass with the cheap attributes prefetched, only idlers get their command line read
+        with process_scan(scan='adoption'):
+            for proc in backend.process_iter(['pid', 'ppid', 'name', 'create_time']):
+                info = proc.info
+                if (info.get('name') or '').lower() != 'steam-idle.exe':
+                    continue
+                # The child of a checkpointed cmd.exe
+                if info.get('pid') in known_pids or info.get('ppid') in known_pids:
+                    continue
+                try:
                     cmdline = proc.cmdline()
-                    if len(cmdline) > 1:
-                        game_id = cmdline[1]  # The game ID is passed as the first argument
-                        if game_id not in running_games:
-                            process = proc
-                            running_games[game_id] = process.pid
-                            
-                            try:
-                                # Get process creation time for accurate session tracking
-                                process_create_time = datetime.fromtimestamp(process.create_time())
-                            except:
-                                # If we can't get creation time, use current time
-                                process_create_time = current_time
-                            
-                            # Initialize game session and get game info
-                            if game_id not in game_sessions:
-                                game_info = fetch_game_info(game_id)
-                                game_sessions[game_id] = {
-                                    'total_time': 0,
-                                    'name': game_info['name'],
-                                    'image': game_info['image'],
-                                    'start_time': process_create_time  # Use actual process start time
-                                }
-                                detected_game_info.append(game_info)  # Store full game info
-                            else:
-                                # Update existing session with correct start time
-                                game_sessions[game_id]['start_time'] = process_create_time
-                                # Add existing game info
-                                detected_game_info.append({
-                                    'id': game_id,
-                                    'name': game_sessions[game_id]['name'],
-                                    'image': game_sessions[game_id]['image']
-                                })
-                            
-                            detected_games.append(game_id)
-            except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
+                except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
+                    continue
+                if len(cmdline) > 1:
+                    # The game ID is passed as the first argument
+                    found.setdefault(cmdline[1], (info['pid'], info.get('create_time')))
+        
+        running_games = get_running_games()
+        sessions = game_state.snapshot().game_sessions
+        for game_id, (pid, create_time) in found.items():
+            if game_id in running_games:
                 continue
+            # Use the process start time for accurate session tracking
+            start_time = datetime.fromtimestamp(create_time) if create_time else current_time
+            session = sessions.get(game_id)
+            if session is None:
+                game_info = cached_game_info(game_id)
+                if game_info is None:
+                    game_info = local_game_info(game_id, app_catalog.name_of(game_id) or f"Game {game_id}")
+                    missing_info.append(game_id)
+                name, image = game_info['name'], game_info['image']
+            else:
+                name = image = None
+                game_info = {'id': game_id, 'name': session['name'], 'image': session['image']}
+            # A run that died without releasing the duty cycle leaves its idlers suspended
+            resume_stopped_idler(pid)
+            apply_launch_profile(pid, LAUNCH_PROFILE)
+            idler_profiles[game_id] = LAUNCH_PROFILE
+            game_state.start_session(game_id, pid, name, image, start_time)
+            detected_games.append(game_id)
+            detected_game_info.append(game_info)
     except Exception as e:
         print(f"Error detecting running games: {e}")
         if icon:
             icon.notify(f"❌ Error detecting games: {str(e)}", "Error")
-        return []
+        return [], [], []
     
     if detected_games:
         # Save statistics
         save_statistics()
         
-        # Update Discord RPC
-        if DISCORD_RPC_ENABLED:
-            try:
-                update_discord_rpc()
-            except Exception as e:
-                print(f"Error updating Discord RPC: {e}")
-        
         # Update tray menu to show current games
         try:
             update_tray_menu()
@@ -2787,14 +5452,34 @@ def detect_running_games():
         if icon:
             icon.notify("ℹ️ No running games detected", "Detection Complete")
     
-    return detected_games, detected_game_info
+    return detected_games, detected_game_info, missing_info
+
+def fill_adopted_game_info(game_ids):
+    """Fetch the store names and images of adopted games the local caches didn't know,
+    pushing each one to the UI as it arrives"""
+    def fill(game_id):
+        game_info = fetch_game_info(game_id)
+        if 'error' in game_info:
+            return
+        game_state.set_info(game_id, game_info['name'], game_info['image'])
+        if window:
+            window.evaluate_js("updateAdoptedGame(%s);" % json.dumps(game_info))
+
+    with ThreadPoolExecutor(max_workers=IDLER_SPAWN_WORKERS) as pool:
+        list(pool.map(fill, game_ids))
+    save_statistics()
+    update_tray_menu()
 
 def on_loaded():
     """Called when the window is fully loaded"""
     # Detect already running games
-    detected_games, detected_game_info = detect_running_games()
+    detected_games, detected_game_info, missing_info = detect_running_games()
+    # Pick the rotation up where it left off now that leftover idlers are adopted
+    resume_rotation()
+    runtime.trigger('schedules')
     if detected_games:
         print(f"Detected {len(detected_games)} running games")
+    if detected_games and window:
         # Update UI to show detected games
         window.evaluate_js("""
             // Show loading notification
@@ -2820,60 +5505,108 @@ def on_loaded():
                 showNotification('✅ Successfully added ' + %d + ' games to library', 'success');
             });
         """ % (json.dumps(detected_game_info), json.dumps(detected_games), len(detected_games)))
+    if missing_info:
+        threading.Thread(target=fill_adopted_game_info, args=(missing_info,), daemon=True,
+                         name="adoption-metadata").start()
 
 def update_and_save_statistics():
-    """Update and save statistics periodically"""
-    while True:
-        try:
-            if running_games:
-                current_time = datetime.now()
-                stats_updated = False
-
-                # Update session times for running games
-                for game_id in list(running_games.keys()):
-                    if game_id in game_sessions and 'start_time' in game_sessions[game_id]:
-                        # Calculate current session duration
-                        session_duration = (current_time - game_sessions[game_id]['start_time']).total_seconds()
-                        
-                        # Create a temporary copy of the session
-                        temp_session = game_sessions[game_id].copy()
-                        
-                        # Update total_time in the temporary session
-                        temp_session['total_time'] = game_sessions[game_id].get('total_time', 0)
-                        temp_session['total_time'] += session_duration
-                        
-                        # Save the temporary session to the statistics file
-                        stats_data = load_statistics()
-                        if 'game_sessions' not in stats_data:
-                            stats_data['game_sessions'] = {}
-                        
-                        stats_data['game_sessions'][game_id] = {
-                            'total_time': temp_session['total_time'],
-                            'name': temp_session.get('name', 'Unknown Game'),
-                            'image': temp_session.get('image', '')
-                        }
-                        
-                        with open(STATS_FILE, 'w') as f:
-                            json.dump(stats_data, f)
-                        
-                        stats_updated = True
-                
-                if stats_updated:
-                    print(f"Statistics auto-saved at {current_time.strftime('%H:%M:%S')}")
-        except Exception as e:
-            print(f"Error in statistics auto-save: {e}")
-        
-        time.sleep(60)  # Update every minute
+    """Save the running games' playtime so far, without closing their sessions"""
+    snapshot = game_state.snapshot()
+    if not snapshot.running_games:
+        return
+    current_time = datetime.now()
+    stats_data = load_statistics()
+    if 'game_sessions' not in stats_data:
+        stats_data['game_sessions'] = {}
+    stats_updated = False
+
+    # Update session times for running games
+    for game_id in list(snapshot.running_games.keys()):
+        session = snapshot.game_sessions.get(game_id)
+        if session and 'start_time' in session:
+            session_duration = (current_time - session['start_time']).total_seconds()
+            suspended_time = session.get('suspended_time', 0)
+            if 'suspended_since' in session:
+                suspended_time += max(0.0, (current_time - session['suspended_since']).total_seconds())
+            stats_data['game_sessions'][game_id] = {
+                'total_time': session.get('total_time', 0) + session_duration,
+                'suspended_time': suspended_time,
+                'name': session.get('name', 'Unknown Game'),
+                'image': session.get('image', '')
+            }
+            stats_updated = True
+
+    # Write the file once for all games
+    if stats_updated:
+        with open(STATS_FILE, 'w') as f:
+            write_json(stats_data, f)
+        print(f"Statistics auto-saved at {current_time.strftime('%H:%M:%S')}")
+
+def register_background_jobs():
+    """Register the periodic jobs run by the runtime"""
+    # Returns its own delay, shorter while offline
+    runtime.add_job('connectivity', connectivity.check, interval=CONNECTIVITY_INTERVAL)
+    runtime.add_job('replay_deferred', connectivity.replay)
+    runtime.add_job('tray', update_tray_menu, interval=30, jitter=3)
+    runtime.add_job('goals', check_game_goals, interval=60, jitter=5)
+    runtime.add_job('statistics', update_and_save_statistics, interval=60, jitter=5)
+    runtime.add_job('auto_reconnect', check_and_restart_games, interval=RECONNECT_INTERVAL, jitter=10,
+                    run_at_start=False)
+    # Event driven jobs, triggered once leftover idlers are adopted and whenever they change
+    runtime.add_job('rotation', run_rotation)
+    runtime.add_job('schedules', run_due_schedules)
+    # Rescans are mostly triggered by watch_library_folders, the interval is a fallback
+    runtime.add_job('manifest_index', refresh_manifest_index, interval=MANIFEST_REFRESH_INTERVAL, jitter=30)
+    runtime.add_job('app_catalog', refresh_app_catalog, interval=CATALOG_CHECK_INTERVAL, jitter=60)
+    # Returns a short delay while launches wait to be confirmed
+    runtime.add_job('idler_lifecycle', idler_lifecycle.check, interval=LIFECYCLE_CHECK_INTERVAL)
+    runtime.add_job('resources', sample_resources, interval=RESOURCE_SAMPLE_INTERVAL)
+    runtime.add_job('guardrails', enforce_guardrails, run_at_start=False)
+    # Reschedules itself for the next window while enabled
+    runtime.add_job('duty_cycle', duty_cycle.tick, run_at_start=False)
+    runtime.add_job('running_state', running_checkpoint.save, run_at_start=False)
+    runtime.trigger('duty_cycle')
+
+def save_final_statistics():
+    """Close the open sessions and save statistics before exiting"""
+    try:
+        # The idlers keep running, the next start adopts them from the checkpoint
+        duty_cycle.shutdown()
+        running_checkpoint.freeze()
+        if get_running_games():
+            current_time = datetime.now()
+            for game_id in get_running_games():
+                game_state.end_session(game_id, current_time)
+            save_statistics()
+            print("Final statistics saved before exit")
+    except Exception as e:
+        print(f"Error saving final statistics: {e}")
+
+def run_headless():
+    """Run without a window or tray icon and serve the UI on localhost, e.g. with the fake backend"""
+    port = int(os.getenv('STEAMIDLE_PORT', '5000'))
+    register_background_jobs()
+    runtime.start()
+    threading.Thread(target=watch_library_folders, daemon=True, name="library-watcher").start()
+    on_loaded()
+    print(f"Running headless on the {backend.name} backend at http://127.0.0.1:{port}")
+    try:
+        app.run(host='127.0.0.1', port=port, threaded=True)
+    finally:
+        save_final_statistics()
+        sampling_profiler.stop()
 
 if __name__ == '__main__':
-    # Check for internet connection before starting the app
-    while not check_internet_connection():
-        show_no_internet_error()
-    
     # Initialize settings
     settings = load_settings()
     minimize_to_tray = settings.get('minimize_to_tray', False)
     AUTO_RECONNECT = settings.get('auto_reconnect', False)
+    if settings.get('profiler_enabled', False):
+        set_profiler_enabled(True)
+
+    if backend.headless:
+        run_headless()
+        sys.exit(0)
     
     # Create window first with loaded callback
     window = webview.create_window('Steam Idle Manager', app, minimized=False, width=1440, height=1000)
@@ -2886,42 +5619,19 @@ if __name__ == '__main__':
     # Create tray icon
     create_tray_icon()
     
-    # Start the auto-reconnect checker thread
-    reconnect_thread = threading.Thread(target=check_and_restart_games)
-    reconnect_thread.daemon = True
-    reconnect_thread.start()
-    
-    # Start the game goals checker thread
-    goals_thread = threading.Thread(target=check_game_goals)
-    goals_thread.daemon = True
-    goals_thread.start()
-    
-    # Start the tray menu update thread
-    tray_update_thread = threading.Thread(target=update_tray_periodically)
-    tray_update_thread.daemon = True
-    tray_update_thread.start()
-    
-    # Start the statistics auto-save thread
-    stats_thread = threading.Thread(target=update_and_save_statistics)
-    stats_thread.daemon = True
-    stats_thread.start()
+    # Start the background jobs (tray refresh, goals, statistics, auto-reconnect, rotation, schedules)
+    register_background_jobs()
+    runtime.start()
+    discord_publisher.start()
+    threading.Thread(target=watch_library_folders, daemon=True, name="library-watcher").start()
     
     try:
         # Start the application
         webview.start()
     finally:
         # Save final statistics before closing
-        try:
-            if running_games:
-                current_time = datetime.now()
-                for game_id in list(running_games.keys()):
-                    if game_id in game_sessions and 'start_time' in game_sessions[game_id]:
-                        session_duration = (current_time - game_sessions[game_id]['start_time']).total_seconds()
-                        game_sessions[game_id]['total_time'] = game_sessions[game_id].get('total_time', 0) + session_duration
-                save_statistics()
-                print("Final statistics saved before exit")
-        except Exception as e:
-            print(f"Error saving final statistics: {e}")
+        save_final_statistics()
+        sampling_profiler.stop()
         
         # Clean up tray icon and Discord RPC when exiting
         if icon:
@@ -0,0 +1,275 @@
+"""Valve KeyValues (VDF/ACF) parser.
+
+Text KeyValues (libraryfolders.vdf, appmanifest_*.acf, loginusers.vdf) are
+tokenized from the stream in chunks, so callers can stop reading as soon as
+they have what they need:
+
+    with open(path, encoding='utf-8') as f:
+        values = find_values(f, ('AppState', 'appid'), ('AppState', 'name'))
+
+Binary KeyValues (shortcuts.vdf) and appinfo.vdf are also supported.
+iter_appinfo() walks appinfo.vdf entry by entry and only decodes an entry's
+KeyValues when asked for them.
+"""
+import re
+import struct
+
+CHUNK_SIZE = 8 * 1024
+
+# Leading whitespace and comments, then a quoted string, a brace, a conditional like [$WIN32] or a bare word
+SKIP_RE = re.compile(r'(?:\s+|//[^\n]*(?:\n|\Z))*')
+TOKEN_RE = re.compile(SKIP_RE.pattern + r'(?:"((?:[^"\\]|\\.)*)"|([{}])|\[[^\]\n]*\]|(?!//)([^\s{}"\[]+))', re.S)
+ESCAPE_RE = re.compile(r'\\(.)', re.S)
+ESCAPES = {'n': '\n', 't': '\t', '\\': '\\', '"': '"'}
+
+# Binary KeyValues value types
+BIN_NESTED = 0x00
+BIN_STRING = 0x01
+BIN_INT32 = 0x02
+BIN_FLOAT32 = 0x03
+BIN_POINTER = 0x04
+BIN_WIDESTRING = 0x05
+BIN_COLOR = 0x06
+BIN_UINT64 = 0x07
+BIN_END = 0x08
+BIN_INT64 = 0x0A
+BIN_END_ALT = 0x0B
+
+APPINFO_MAGIC_27 = 0x07564427
+APPINFO_MAGIC_28 = 0x07564428
+APPINFO_MAGIC_29 = 0x07564429
+
+class VDFError(ValueError):
+    """Raised for malformed KeyValues data"""
+
+def _unescape(value):
+    if '\\' not in value:
+        return value
+    return ESCAPE_RE.sub(lambda m: ESCAPES.get(m.group(1), '\\' + m.group(1)), value)
+
+def tokenize(fp, chunk_size=CHUNK_SIZE):
+    """Yield ('string', value), ('open', None) and ('close', None) tokens from a text stream"""
+    buffer = ''
+    position = 0
+    eof = False
+    while True:
+        match = TOKEN_RE.match(buffer, position)
+        # A token touching the end of the buffer may continue in the next chunk
+        if not eof and (match is None or match.end() == len(buffer)):
+            chunk = fp.read(chunk_size)
+            if chunk:
+                buffer = buffer[position:] + chunk
+                position = 0
+                continue
+            eof = True
+            match = TOKEN_RE.match(buffer, position)
+
+        if match is None:
+            if SKIP_RE.match(buffer, position).end() == len(buffer):
+                return
+            raise VDFError(f"Unexpected data near {buffer[position:position + 20]!r}")
+
+        quoted, brace, bare = match.groups()
+        position = match.end()
+        if quoted is not None:
+            yield 'string', _unescape(quoted)
+        elif brace == '{':
+            yield 'open', None
+        elif brace == '}':
+            yield 'close', None
+        elif bare is not None:
+            yield 'string', bare
+
+def iter_events(fp):
+    """Yield ('value', key, value), ('open', key, None) and ('close', None, None) events"""
+    key = None
+    depth = 0
+    for kind, value in tokenize(fp):
+        if kind == 'string':
+            if key is None:
+                key = value
+            else:
+                yield 'value', key, value
+                key = None
+        elif kind == 'open':
+            if key is None:
+                raise VDFError("Block without a key")
+            yield 'open', key, None
+            key = None
+            depth += 1
+        else:
+            if key is not None:
+                raise VDFError(f"Key {key!r} without a value")
+            if depth == 0:
+                raise VDFError("Unbalanced closing brace")
+            yield 'close', None, None
+            depth -= 1
+    if key is not None or depth:
+        raise VDFError("Unexpected end of data")
+
+def iter_items(fp):
+    """Yield (path, value) for every leaf value, path being the tuple of keys leading to it"""
+    path = []
+    for event, key, value in iter_events(fp):
+        if event == 'value':
+            yield tuple(path) + (key,), value
+        elif event == 'open':
+            path.append(key)
+        else:
+            path.pop()
+
+def load(fp):
+    """Parse a whole text KeyValues stream into nested dicts, later duplicate keys win"""
+    root = {}
+    stack = [root]
+    for event, key, value in iter_events(fp):
+        if event == 'value':
+            stack[-1][key] = value
+        elif event == 'open':
+            child = {}
+            stack[-1][key] = child
+            stack.append(child)
+        else:
+            stack.pop()
+    return root
+
+def loads(text):
+    return load(_StringReader(text))
+
+def find_values(fp, *paths):
+    """Return {path: value} for the given key paths, matched case-insensitively.
+
+    Reading stops as soon as every path has been found, so looking up the
+    name in an appmanifest only reads its first few lines.
+    """
+    wanted = {tuple(key.lower() for key in path): path for path in paths}
+    found = {}
+    for item_path, value in iter_items(fp):
+        lowered = tuple(key.lower() for key in item_path)
+        if lowered in wanted and wanted[lowered] not in found:
+            found[wanted[lowered]] = value
+            if len(found) == len(wanted):
+                break
+    return found
+
+class _StringReader:
+    def __init__(self, text):
+        self.text = text
+        self.position = 0
+
+    def read(self, size):
+        chunk = self.text[self.position:self.position + size]
+        self.position += len(chunk)
+        return chunk
+
+def _read_cstring(data, position, encoding='utf-8'):
+    end = data.index(b'\0', position)
+    return data[position:end].decode(encoding, 'replace'), end + 1
+
+def loads_binary(data, position=0, string_table=None):
+    """Parse binary KeyValues from bytes, returns (dict, end position).
+
+    string_table is used by appinfo.vdf v29, where keys are indexes into it.
+    """
+    result = {}
+    length = len(data)
+    while position < length:
+        value_type = data[position]
+        position += 1
+        if value_type in (BIN_END, BIN_END_ALT):
+            return result, position
+
+        if string_table is not None:
+            (index,) = struct.unpack_from('<I', data, position)
+            key = string_table[index]
+            position += 4
+        else:
+            key, position = _read_cstring(data, position)
+
+        if value_type == BIN_NESTED:
+            result[key], position = loads_binary(data, position, string_table)
+        elif value_type == BIN_STRING:
+            result[key], position = _read_cstring(data, position)
+        elif value_type == BIN_WIDESTRING:
+            end = position
+            while data[end:end + 2] != b'\0\0':
+                end += 2
+            result[key] = data[position:end].decode('utf-16-le', 'replace')
+            position = end + 2
+        elif value_type in (BIN_INT32, BIN_POINTER, BIN_COLOR):
+            (result[key],) = struct.unpack_from('<i', data, position)
+            position += 4
+        elif value_type == BIN_FLOAT32:
+            (result[key],) = struct.unpack_from('<f', data, position)
+            position += 4
+        elif value_type == BIN_UINT64:
+            (result[key],) = struct.unpack_from('<Q', data, position)
+            position += 8
+        elif value_type == BIN_INT64:
+            (result[key],) = struct.unpack_from('<q', data, position)
+            position += 8
+        else:
+            raise VDFError(f"Unknown binary value type {value_type:#x} at offset {position - 1}")
+    raise VDFError("Unexpected end of binary data")
+
+def load_binary(fp):
+    """Parse a binary KeyValues file such as shortcuts.vdf"""
+    result, _ = loads_binary(fp.read())
+    return result
+
+class AppInfoEntry:
+    """One app in appinfo.vdf, its KeyValues are decoded on first access"""
+
+    __slots__ = ('appid', 'info_state', 'last_updated', 'change_number', '_blob', '_string_table', '_data')
+
+    def __init__(self, appid, info_state, last_updated, change_number, blob, string_table):
+        self.appid = appid
+        self.info_state = info_state
+        self.last_updated = last_updated
+        self.change_number = change_number
+        self._blob = blob
+        self._string_table = string_table
+        self._data = None
+
+    @property
+    def data(self):
+        if self._data is None:
+            self._data, _ = loads_binary(self._blob, 0, self._string_table)
+            self._blob = None
+        return self._data
+
+def _read_exact(fp, size):
+    data = fp.read(size)
+    if len(data) != size:
+        raise VDFError("Unexpected end of appinfo.vdf")
+    return data
+
+def iter_appinfo(fp):
+    """Yield an AppInfoEntry per app in a binary appinfo.vdf stream (v27 to v29)"""
+    magic, _universe = struct.unpack('<II', _read_exact(fp, 8))
+    if magic not in (APPINFO_MAGIC_27, APPINFO_MAGIC_28, APPINFO_MAGIC_29):
+        raise VDFError(f"Unsupported appinfo.vdf version {magic:#x}")
+
+    string_table = None
+    if magic == APPINFO_MAGIC_29:
+        # Keys live in a string table at the end of the file
+        (table_offset,) = struct.unpack('<q', _read_exact(fp, 8))
+        entries_start = fp.tell()
+        fp.seek(table_offset)
+        (count,) = struct.unpack('<I', _read_exact(fp, 4))
+        table = fp.read().split(b'\0')
+        string_table = [name.decode('utf-8', 'replace') for name in table[:count]]
+        fp.seek(entries_start)
+
+    # Fixed entry header after the size field: info state, last updated, PICS token,
+    # SHA-1 and change number, then the SHA-1 of the binary data from v28 on
+    header_size = 4 + 4 + 8 + 20 + 4 + (20 if magic != APPINFO_MAGIC_27 else 0)
+    while True:
+        (appid,) = struct.unpack('<I', _read_exact(fp, 4))
+        if appid == 0:
+            return
+        (size,) = struct.unpack('<I', _read_exact(fp, 4))
+        entry = _read_exact(fp, size)
+        info_state, last_updated = struct.unpack_from('<II', entry, 0)
+        (change_number,) = struct.unpack_from('<I', entry, 36)
+        yield AppInfoEntry(appid, info_state, last_updated, change_number, entry[header_size:], string_table)